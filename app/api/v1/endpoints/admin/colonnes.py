@@ -9,7 +9,7 @@ from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel, Field
 from sqlalchemy.orm import Session
 
-from app.api.deps import CurrentEditor, get_db
+from app.api.deps import CurrentEditor, get_db, json_body, json_body_openapi
 from app.models.comptabilite import ColonneDynamique
 
 router = APIRouter(prefix="/colonnes", tags=["Admin - Colonnes Dynamiques"])
@@ -341,10 +341,11 @@ async def delete_colonne(
     response_model=list[ColonneRead],
     summary="Réordonner les colonnes",
     description="Met à jour l'ordre des colonnes.",
+    openapi_extra=json_body_openapi(ColonneReorderRequest),
 )
 async def reorder_colonnes(
-    data: ColonneReorderRequest,
     current_user: CurrentEditor,
+    data: ColonneReorderRequest = Depends(json_body(ColonneReorderRequest)),
     db: Session = Depends(get_db),
 ):
     """Reorder multiple columns at once."""
@@ -8,11 +8,13 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from pydantic import BaseModel
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, undefer_group
 
 from app.api.deps import CurrentEditor, get_db
+from app.models.base import DETAIL
 from app.models.comptabilite import CompteAdministratif as CompteAdministratifModel, DonneesDepenses, DonneesRecettes, Exercice, PlanComptable
-from app.models.geographie import Commune, Region, Province
+from app.models.geographie import Commune
+from app.services.cache_service import reference_cache
 
 router = APIRouter(prefix="/comptes-administratifs", tags=["Admin - Comptes Administratifs"])
 
@@ -21,19 +23,8 @@ router = APIRouter(prefix="/comptes-administratifs", tags=["Admin - Comptes Admi
 # SCHEMAS
 # ============================================================================
 
-class CommuneInfo(BaseModel):
-    id: str
-    code: str
-    nom: str
-
-
-class RegionInfo(BaseModel):
-    id: str
-    code: str
-    nom: str
-
-
-class ProvinceInfo(BaseModel):
+class CollectiviteInfo(BaseModel):
+    """Commune, région ou province rattachée (même forme aux trois niveaux)."""
     id: str
     code: str
     nom: str
@@ -54,9 +45,9 @@ class CompteAdministratifRead(BaseModel):
     updated_at: datetime
     created_by: Optional[str] = None
     # Relations
-    commune: Optional[CommuneInfo] = None
-    region: Optional[RegionInfo] = None
-    province: Optional[ProvinceInfo] = None
+    commune: Optional[CollectiviteInfo] = None
+    region: Optional[CollectiviteInfo] = None
+    province: Optional[CollectiviteInfo] = None
 
 
 class CompteAdministratifWithStats(CompteAdministratifRead):
@@ -156,6 +147,7 @@ async def create_compte_administratif(
         db.add(exercice)
         db.commit()
         db.refresh(exercice)
+        reference_cache.invalidate()
 
     if exercice.cloture:
         raise HTTPException(
@@ -206,8 +198,8 @@ async def create_compte_administratif(
     ) > 0
 
     # Get region and province
-    region = db.query(Region).filter(Region.id == commune.region_id).first()
-    province = db.query(Province).filter(Province.id == region.province_id).first() if region else None
+    region = reference_cache.get_region(db, commune.region_id)
+    province = region.province if region else None
 
     compte_id = _generate_compte_id(commune.id, exercice.id)
 
@@ -221,17 +213,17 @@ async def create_compte_administratif(
         notes=data.notes,
         created_at=exercice.created_at or datetime.now(),
         updated_at=exercice.updated_at or datetime.now(),
-        commune=CommuneInfo(
+        commune=CollectiviteInfo(
             id=str(commune.id),
             code=commune.code,
             nom=commune.nom
         ),
-        region=RegionInfo(
+        region=CollectiviteInfo(
             id=str(region.id),
             code=region.code,
             nom=region.nom
         ) if region else None,
-        province=ProvinceInfo(
+        province=CollectiviteInfo(
             id=str(province.id),
             code=province.code,
             nom=province.nom
@@ -355,8 +347,8 @@ async def list_comptes_administratifs(
         depenses_count = r['depenses_count']
 
         # Get region and province info
-        region = db.query(Region).filter(Region.id == commune.region_id).first()
-        province = db.query(Province).filter(Province.id == region.province_id).first() if region else None
+        region = reference_cache.get_region(db, commune.region_id)
+        province = region.province if region else None
 
         compte_id = _generate_compte_id(commune.id, exercice.id)
         has_data = (recettes_count or 0) + (depenses_count or 0) > 0
@@ -370,17 +362,17 @@ async def list_comptes_administratifs(
             statut=_get_statut(exercice, has_data),
             created_at=exercice.created_at or datetime.now(),
             updated_at=exercice.updated_at or datetime.now(),
-            commune=CommuneInfo(
+            commune=CollectiviteInfo(
                 id=str(commune.id),
                 code=commune.code,
                 nom=commune.nom
             ) if commune else None,
-            region=RegionInfo(
+            region=CollectiviteInfo(
                 id=str(region.id),
                 code=region.code,
                 nom=region.nom
             ) if region else None,
-            province=ProvinceInfo(
+            province=CollectiviteInfo(
                 id=str(province.id),
                 code=province.code,
                 nom=province.nom
@@ -453,8 +445,8 @@ async def get_compte_administratif(
     has_data = recettes_count + depenses_count > 0
 
     # Get region and province
-    region = db.query(Region).filter(Region.id == commune.region_id).first()
-    province = db.query(Province).filter(Province.id == region.province_id).first() if region else None
+    region = reference_cache.get_region(db, commune.region_id)
+    province = region.province if region else None
 
     return CompteAdministratifRead(
         id=compte_id,
@@ -465,17 +457,17 @@ async def get_compte_administratif(
         statut=_get_statut(exercice, has_data),
         created_at=exercice.created_at or datetime.now(),
         updated_at=exercice.updated_at or datetime.now(),
-        commune=CommuneInfo(
+        commune=CollectiviteInfo(
             id=str(commune.id),
             code=commune.code,
             nom=commune.nom
         ),
-        region=RegionInfo(
+        region=CollectiviteInfo(
             id=str(region.id),
             code=region.code,
             nom=region.nom
         ) if region else None,
-        province=ProvinceInfo(
+        province=CollectiviteInfo(
             id=str(province.id),
             code=province.code,
             nom=province.nom
@@ -549,7 +541,9 @@ async def get_lignes_budgetaires(
 
     # Get recettes if type is None or "recette"
     if type is None or type == "recette":
-        recettes = db.query(DonneesRecettes).filter(
+        recettes = db.query(DonneesRecettes).options(
+            undefer_group(DETAIL)
+        ).filter(
             DonneesRecettes.commune_id == commune_id_parsed,
             DonneesRecettes.exercice_id == exercice_id
         ).all()
@@ -585,7 +579,9 @@ async def get_lignes_budgetaires(
 
     # Get depenses if type is None or "depense"
     if type is None or type == "depense":
-        depenses = db.query(DonneesDepenses).filter(
+        depenses = db.query(DonneesDepenses).options(
+            undefer_group(DETAIL)
+        ).filter(
             DonneesDepenses.commune_id == commune_id_parsed,
             DonneesDepenses.exercice_id == exercice_id
         ).all()
@@ -7,9 +7,12 @@ from datetime import datetime
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, undefer_group
 
 from app.api.deps import CurrentEditor, get_db
+from app.models.base import DETAIL
 from app.models.comptabilite import (
     DonneesDepenses,
     DonneesRecettes,
@@ -27,11 +30,23 @@ from app.schemas.comptabilite import (
     DonneesRecettesUpdate,
     DonneesRecettesValidation,
 )
-from app.schemas.base import Message
+from app.schemas.base import Message, dump_list_json
 
 router = APIRouter(prefix="/donnees", tags=["Admin - Données Financières"])
 
 
+def _colonnes_lecture(model, schema) -> list:
+    """
+    Colonnes SQL nommées comme les champs du schéma de lecture ; les
+    prévisions retenues et le taux d'exécution sont des expressions SQL.
+    """
+    calculees = {"previsions_definitives": model.previsions_effectives}
+    return [
+        calculees.get(name, getattr(model, name)).label(name)
+        for name in schema.__trusted_fields__
+    ]
+
+
 def _validate_commune_exercice_compte(
     db: Session, commune_id: int, exercice_id: int, compte_code: str
 ) -> tuple[Commune, Exercice, PlanComptable]:
@@ -84,39 +99,23 @@ async def list_recettes(
     """
     Get all receipts for a commune/exercise.
     """
-    recettes = (
-        db.query(DonneesRecettes)
-        .filter(
+    # Projection de colonnes (pas d'objets ORM) : prévisions effectives et
+    # taux d'exécution calculés par PostgreSQL dans la même requête
+    recettes = db.execute(
+        select(*_colonnes_lecture(DonneesRecettes, DonneesRecettesRead))
+        .where(
             DonneesRecettes.commune_id == commune_id,
             DonneesRecettes.exercice_id == exercice_id,
         )
         .order_by(DonneesRecettes.compte_code)
-        .all()
-    )
+    ).mappings().all()
 
-    return [
-        DonneesRecettesRead(
-            id=r.id,
-            commune_id=r.commune_id,
-            exercice_id=r.exercice_id,
-            compte_code=r.compte_code,
-            budget_primitif=r.budget_primitif,
-            budget_additionnel=r.budget_additionnel,
-            modifications=r.modifications,
-            previsions_definitives=r.previsions_definitives or r.previsions_calculees,
-            or_admis=r.or_admis,
-            recouvrement=r.recouvrement,
-            reste_a_recouvrer=r.reste_a_recouvrer,
-            commentaire=r.commentaire,
-            valide=r.valide,
-            valide_par=r.valide_par,
-            valide_le=r.valide_le,
-            taux_execution=r.taux_execution,
-            created_at=r.created_at,
-            updated_at=r.updated_at,
-        )
-        for r in recettes
-    ]
+    return Response(
+        content=dump_list_json(
+            DonneesRecettesRead, [DonneesRecettesRead.model_construct(**row) for row in recettes]
+        ),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -168,7 +167,7 @@ async def create_recette(
         budget_primitif=recette.budget_primitif,
         budget_additionnel=recette.budget_additionnel,
         modifications=recette.modifications,
-        previsions_definitives=recette.previsions_definitives or recette.previsions_calculees,
+        previsions_definitives=recette.previsions_effectives,
         or_admis=recette.or_admis,
         recouvrement=recette.recouvrement,
         reste_a_recouvrer=recette.reste_a_recouvrer,
@@ -197,7 +196,9 @@ async def update_recette(
     """
     Update a receipt entry.
     """
-    recette = db.query(DonneesRecettes).filter(DonneesRecettes.id == recette_id).first()
+    recette = db.query(DonneesRecettes).options(
+        undefer_group(DETAIL)
+    ).filter(DonneesRecettes.id == recette_id).first()
 
     if not recette:
         raise HTTPException(
@@ -228,7 +229,7 @@ async def update_recette(
         budget_primitif=recette.budget_primitif,
         budget_additionnel=recette.budget_additionnel,
         modifications=recette.modifications,
-        previsions_definitives=recette.previsions_definitives or recette.previsions_calculees,
+        previsions_definitives=recette.previsions_effectives,
         or_admis=recette.or_admis,
         recouvrement=recette.recouvrement,
         reste_a_recouvrer=recette.reste_a_recouvrer,
@@ -256,7 +257,9 @@ async def delete_recette(
     """
     Delete a receipt entry.
     """
-    recette = db.query(DonneesRecettes).filter(DonneesRecettes.id == recette_id).first()
+    recette = db.query(DonneesRecettes).options(
+        undefer_group(DETAIL)
+    ).filter(DonneesRecettes.id == recette_id).first()
 
     if not recette:
         raise HTTPException(
@@ -292,7 +295,9 @@ async def validate_recette(
     """
     Validate or invalidate a receipt entry.
     """
-    recette = db.query(DonneesRecettes).filter(DonneesRecettes.id == recette_id).first()
+    recette = db.query(DonneesRecettes).options(
+        undefer_group(DETAIL)
+    ).filter(DonneesRecettes.id == recette_id).first()
 
     if not recette:
         raise HTTPException(
@@ -321,7 +326,7 @@ async def validate_recette(
         budget_primitif=recette.budget_primitif,
         budget_additionnel=recette.budget_additionnel,
         modifications=recette.modifications,
-        previsions_definitives=recette.previsions_definitives or recette.previsions_calculees,
+        previsions_definitives=recette.previsions_effectives,
         or_admis=recette.or_admis,
         recouvrement=recette.recouvrement,
         reste_a_recouvrer=recette.reste_a_recouvrer,
@@ -355,41 +360,23 @@ async def list_depenses(
     """
     Get all expenses for a commune/exercise.
     """
-    depenses = (
-        db.query(DonneesDepenses)
-        .filter(
+    # Projection de colonnes (pas d'objets ORM) : prévisions effectives et
+    # taux d'exécution calculés par PostgreSQL dans la même requête
+    depenses = db.execute(
+        select(*_colonnes_lecture(DonneesDepenses, DonneesDepensesRead))
+        .where(
             DonneesDepenses.commune_id == commune_id,
             DonneesDepenses.exercice_id == exercice_id,
         )
         .order_by(DonneesDepenses.compte_code)
-        .all()
-    )
+    ).mappings().all()
 
-    return [
-        DonneesDepensesRead(
-            id=d.id,
-            commune_id=d.commune_id,
-            exercice_id=d.exercice_id,
-            compte_code=d.compte_code,
-            budget_primitif=d.budget_primitif,
-            budget_additionnel=d.budget_additionnel,
-            modifications=d.modifications,
-            previsions_definitives=d.previsions_definitives or d.previsions_calculees,
-            engagement=d.engagement,
-            mandat_admis=d.mandat_admis,
-            paiement=d.paiement,
-            reste_a_payer=d.reste_a_payer,
-            programme=d.programme,
-            commentaire=d.commentaire,
-            valide=d.valide,
-            valide_par=d.valide_par,
-            valide_le=d.valide_le,
-            taux_execution=d.taux_execution,
-            created_at=d.created_at,
-            updated_at=d.updated_at,
-        )
-        for d in depenses
-    ]
+    return Response(
+        content=dump_list_json(
+            DonneesDepensesRead, [DonneesDepensesRead.model_construct(**row) for row in depenses]
+        ),
+        media_type="application/json",
+    )
 
 
 @router.post(
@@ -441,7 +428,7 @@ async def create_depense(
         budget_primitif=depense.budget_primitif,
         budget_additionnel=depense.budget_additionnel,
         modifications=depense.modifications,
-        previsions_definitives=depense.previsions_definitives or depense.previsions_calculees,
+        previsions_definitives=depense.previsions_effectives,
         engagement=depense.engagement,
         mandat_admis=depense.mandat_admis,
         paiement=depense.paiement,
@@ -472,7 +459,9 @@ async def update_depense(
     """
     Update an expense entry.
     """
-    depense = db.query(DonneesDepenses).filter(DonneesDepenses.id == depense_id).first()
+    depense = db.query(DonneesDepenses).options(
+        undefer_group(DETAIL)
+    ).filter(DonneesDepenses.id == depense_id).first()
 
     if not depense:
         raise HTTPException(
@@ -503,7 +492,7 @@ async def update_depense(
         budget_primitif=depense.budget_primitif,
         budget_additionnel=depense.budget_additionnel,
         modifications=depense.modifications,
-        previsions_definitives=depense.previsions_definitives or depense.previsions_calculees,
+        previsions_definitives=depense.previsions_effectives,
         engagement=depense.engagement,
         mandat_admis=depense.mandat_admis,
         paiement=depense.paiement,
@@ -533,7 +522,9 @@ async def delete_depense(
     """
     Delete an expense entry.
     """
-    depense = db.query(DonneesDepenses).filter(DonneesDepenses.id == depense_id).first()
+    depense = db.query(DonneesDepenses).options(
+        undefer_group(DETAIL)
+    ).filter(DonneesDepenses.id == depense_id).first()
 
     if not depense:
         raise HTTPException(
@@ -569,7 +560,9 @@ async def validate_depense(
     """
     Validate or invalidate an expense entry.
     """
-    depense = db.query(DonneesDepenses).filter(DonneesDepenses.id == depense_id).first()
+    depense = db.query(DonneesDepenses).options(
+        undefer_group(DETAIL)
+    ).filter(DonneesDepenses.id == depense_id).first()
 
     if not depense:
         raise HTTPException(
@@ -598,7 +591,7 @@ async def validate_depense(
         budget_primitif=depense.budget_primitif,
         budget_additionnel=depense.budget_additionnel,
         modifications=depense.modifications,
-        previsions_definitives=depense.previsions_definitives or depense.previsions_calculees,
+        previsions_definitives=depense.previsions_effectives,
         engagement=depense.engagement,
         mandat_admis=depense.mandat_admis,
         paiement=depense.paiement,
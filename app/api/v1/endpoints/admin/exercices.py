@@ -18,6 +18,7 @@ from app.schemas.comptabilite import (
     ExerciceUpdate,
 )
 from app.schemas.base import Message
+from app.services.cache_service import reference_cache
 
 router = APIRouter(prefix="/exercices", tags=["Admin - Exercices"])
 
@@ -126,6 +127,7 @@ async def create_exercice(
     )
     db.add(exercice)
     db.commit()
+    reference_cache.invalidate()
     db.refresh(exercice)
 
     return ExerciceRead(
@@ -175,6 +177,7 @@ async def update_exercice(
         setattr(exercice, field, value)
 
     db.commit()
+    reference_cache.invalidate()
     db.refresh(exercice)
 
     return ExerciceRead(
@@ -249,6 +252,7 @@ async def close_exercice(
 
     exercice.cloture = True
     db.commit()
+    reference_cache.invalidate()
     db.refresh(exercice)
 
     return ExerciceRead(
@@ -295,6 +299,7 @@ async def reopen_exercice(
 
     exercice.cloture = False
     db.commit()
+    reference_cache.invalidate()
     db.refresh(exercice)
 
     return ExerciceRead(
@@ -353,6 +358,7 @@ async def delete_exercice(
 
     db.delete(exercice)
     db.commit()
+    reference_cache.invalidate()
 
     return Message(message=f"Exercice {exercice.annee} supprimé")
 
@@ -5,7 +5,7 @@ CRUD operations for budget categories (admin/editor only).
 
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import CurrentEditor, get_db
@@ -14,9 +14,11 @@ from app.models.enums import SectionBudgetaire, TypeMouvement
 from app.schemas.comptabilite import (
     PlanComptableCreate,
     PlanComptableRead,
+    PlanComptableTree,
     PlanComptableUpdate,
 )
 from app.schemas.base import Message
+from app.services.cache_service import reference_cache
 
 router = APIRouter(prefix="/plan-comptable", tags=["Admin - Plan Comptable"])
 
@@ -33,6 +35,7 @@ async def list_plan_comptable(
     section: Optional[str] = Query(None, description="Filtrer par section (fonctionnement/investissement)"),
     niveau: Optional[int] = Query(None, ge=1, le=3, description="Filtrer par niveau"),
     actif: Optional[bool] = Query(None, description="Filtrer par statut actif"),
+    racine: Optional[str] = Query(None, max_length=10, description="Limiter au sous-arbre d'un code (inclus)"),
     search: Optional[str] = Query(None, min_length=1, max_length=100, description="Recherche par code/intitulé"),
     page: int = Query(1, ge=1, description="Numéro de page"),
     limit: int = Query(100, ge=1, le=500, description="Nombre de résultats par page"),
@@ -63,6 +66,9 @@ async def list_plan_comptable(
     if actif is not None:
         query = query.filter(PlanComptable.actif == actif)
 
+    if racine:
+        query = query.filter(PlanComptable.sous_arbre(racine))
+
     if search:
         search_pattern = f"%{search}%"
         query = query.filter(
@@ -114,6 +120,28 @@ async def list_plan_comptable(
     }
 
 
+@router.get(
+    "/arbre",
+    response_model=list[PlanComptableTree],
+    summary="Arborescence du plan comptable",
+    description="Retourne toutes les rubriques du plan comptable sous forme d'arbre.",
+)
+def get_plan_comptable_arbre(
+    current_user: CurrentEditor,
+    db: Session = Depends(get_db),
+):
+    """
+    Get the full plan comptable as a tree (roots with nested children).
+
+    Served from the reference cache as pre-serialized JSON; rebuilt after any
+    plan comptable write.
+    """
+    return Response(
+        content=reference_cache.get_arbre_comptes(db),
+        media_type="application/json",
+    )
+
+
 @router.get(
     "/{code}",
     response_model=dict,
@@ -195,6 +223,7 @@ async def create_rubrique(
     )
     db.add(rubrique)
     db.commit()
+    reference_cache.invalidate()
     db.refresh(rubrique)
 
     return {
@@ -250,6 +279,7 @@ async def update_rubrique(
         setattr(rubrique, field, value)
 
     db.commit()
+    reference_cache.invalidate()
     db.refresh(rubrique)
 
     return {
@@ -298,5 +328,6 @@ async def delete_rubrique(
 
     db.delete(rubrique)
     db.commit()
+    reference_cache.invalidate()
 
     return Message(message="Rubrique supprimée avec succès")
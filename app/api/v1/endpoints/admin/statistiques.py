@@ -7,7 +7,7 @@ from datetime import date, datetime, timedelta
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session, joinedload
 
 from app.api.deps import CurrentAdmin, get_db
@@ -23,6 +23,15 @@ from app.schemas.documents import AuditLogRead
 router = APIRouter(prefix="/statistiques", tags=["Admin - Statistiques"])
 
 
+def _exercice_id(annee: int):
+    """
+    Sous-requête scalaire de l'id d'exercice d'une année.
+    Filtrer sur exercice_id (plutôt que joindre exercices) garde la requête
+    sur une seule table et permet l'élagage des partitions.
+    """
+    return select(Exercice.id).where(Exercice.annee == annee).scalar_subquery()
+
+
 # =====================
 # Dashboard Statistics
 # =====================
@@ -50,20 +59,14 @@ async def dashboard_stats(
     total_communes = db.query(func.count(Commune.id)).scalar() or 0
 
     # Communes avec données pour l'année en cours
-    communes_avec_donnees = db.query(func.count(func.distinct(DonneesRecettes.commune_id))).join(
-        Exercice,
-        DonneesRecettes.exercice_id == Exercice.id
-    ).filter(
-        Exercice.annee == current_year
+    communes_avec_donnees = db.query(func.count(func.distinct(DonneesRecettes.commune_id))).filter(
+        DonneesRecettes.exercice_id == _exercice_id(current_year)
     ).scalar() or 0
 
     # Si pas de données pour l'année en cours, chercher l'année précédente
     if communes_avec_donnees == 0:
-        communes_avec_donnees = db.query(func.count(func.distinct(DonneesRecettes.commune_id))).join(
-            Exercice,
-            DonneesRecettes.exercice_id == Exercice.id
-        ).filter(
-            Exercice.annee == last_year
+        communes_avec_donnees = db.query(func.count(func.distinct(DonneesRecettes.commune_id))).filter(
+            DonneesRecettes.exercice_id == _exercice_id(last_year)
         ).scalar() or 0
 
     # Financial totals - utiliser or_admis pour recettes, mandat_admis pour dépenses
@@ -71,18 +74,12 @@ async def dashboard_stats(
     total_depenses = db.query(func.sum(DonneesDepenses.mandat_admis)).scalar() or 0
 
     # Recettes/dépenses année précédente pour calculer l'évolution
-    recettes_last_year = db.query(func.sum(DonneesRecettes.or_admis)).join(
-        Exercice,
-        DonneesRecettes.exercice_id == Exercice.id
-    ).filter(
-        Exercice.annee == last_year
+    recettes_last_year = db.query(func.sum(DonneesRecettes.or_admis)).filter(
+        DonneesRecettes.exercice_id == _exercice_id(last_year)
     ).scalar() or 0
 
-    depenses_last_year = db.query(func.sum(DonneesDepenses.mandat_admis)).join(
-        Exercice,
-        DonneesDepenses.exercice_id == Exercice.id
-    ).filter(
-        Exercice.annee == last_year
+    depenses_last_year = db.query(func.sum(DonneesDepenses.mandat_admis)).filter(
+        DonneesDepenses.exercice_id == _exercice_id(last_year)
     ).scalar() or 0
 
     # Calcul des évolutions (en pourcentage)
@@ -136,11 +133,8 @@ async def revenus_par_annee(
 
     for year in years_range:
         # Total recettes pour cette année
-        total_recettes = db.query(func.sum(DonneesRecettes.recouvrement)).join(
-            Exercice,
-            DonneesRecettes.exercice_id == Exercice.id
-        ).filter(
-            Exercice.annee == year
+        total_recettes = db.query(func.sum(DonneesRecettes.recouvrement)).filter(
+            DonneesRecettes.exercice_id == _exercice_id(year)
         ).scalar() or 0
 
         # Calcul de l'évolution
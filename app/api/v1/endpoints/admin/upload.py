@@ -4,22 +4,26 @@ Handle file uploads for images and documents.
 """
 
 import os
-import uuid
+import secrets
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from fastapi import APIRouter, Depends, File, HTTPException, Query, UploadFile, status
-from sqlalchemy.orm import Session
+from fastapi.responses import Response
+from sqlalchemy import select
+from sqlalchemy.orm import Session, undefer_group
 
 from app.api.deps import CurrentEditor, get_db
+from app.models.base import DETAIL
 from app.core.config import settings
 from app.models.documents import Document
 from app.models.comptabilite import Exercice
 from app.models.geographie import Commune
+from app.models.utilisateurs import Utilisateur
 from app.models.enums import TypeDocument
 from app.schemas.documents import DocumentRead, DocumentWithDetails
-from app.schemas.base import Message
+from app.schemas.base import Message, dump_list_json
 
 router = APIRouter(prefix="/upload", tags=["Admin - Upload"])
 
@@ -96,7 +100,7 @@ async def upload_image(
 
     # Generate unique filename
     ext = ALLOWED_IMAGE_TYPES[file.content_type]
-    filename = f"{uuid.uuid4().hex}{ext}"
+    filename = f"{secrets.token_hex(16)}{ext}"
 
     # Create destination directory
     upload_dir = get_upload_dir() / folder
@@ -174,7 +178,7 @@ async def upload_document(
 
     # Generate unique filename
     ext = ALLOWED_DOCUMENT_TYPES[file.content_type]
-    filename = f"{uuid.uuid4().hex}{ext}"
+    filename = f"{secrets.token_hex(16)}{ext}"
 
     # Create destination directory
     upload_dir = get_upload_dir() / "documents" / str(commune_id) / str(exercice.annee)
@@ -241,7 +245,9 @@ async def delete_document(
     """
     Delete a document.
     """
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = db.query(Document).options(
+        undefer_group(DETAIL)
+    ).filter(Document.id == document_id).first()
 
     if not document:
         raise HTTPException(
@@ -280,7 +286,9 @@ async def update_document(
     """
     Update document metadata.
     """
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = db.query(Document).options(
+        undefer_group(DETAIL)
+    ).filter(Document.id == document_id).first()
 
     if not document:
         raise HTTPException(
@@ -345,47 +353,39 @@ async def list_documents(
     """
     List all documents with filters.
     """
-    query = db.query(Document)
+    # Noms de la commune, de l'exercice et de l'uploadeur projetés dans la
+    # même requête (jointures externes), sans charger d'objets ORM
+    parents = {
+        "commune_nom": Commune.nom,
+        "exercice_annee": Exercice.annee,
+        "uploadeur_nom": Utilisateur.nom_complet,
+    }
+    stmt = (
+        select(*(
+            (parents[name] if name in parents else getattr(Document, name)).label(name)
+            for name in DocumentWithDetails.__trusted_fields__
+        ))
+        .outerjoin(Commune, Commune.id == Document.commune_id)
+        .outerjoin(Exercice, Exercice.id == Document.exercice_id)
+        .outerjoin(Utilisateur, Utilisateur.id == Document.uploade_par)
+    )
 
     if commune_id:
-        query = query.filter(Document.commune_id == commune_id)
+        stmt = stmt.where(Document.commune_id == commune_id)
     if exercice_id:
-        query = query.filter(Document.exercice_id == exercice_id)
+        stmt = stmt.where(Document.exercice_id == exercice_id)
     if type_document:
-        query = query.filter(Document.type_document == type_document)
+        stmt = stmt.where(Document.type_document == type_document)
     if public is not None:
-        query = query.filter(Document.public == public)
-
-    documents = query.order_by(Document.created_at.desc()).offset(offset).limit(limit).all()
-
-    results = []
-    for doc in documents:
-        commune = db.query(Commune).filter(Commune.id == doc.commune_id).first()
-        exercice = db.query(Exercice).filter(Exercice.id == doc.exercice_id).first()
-
-        results.append(
-            DocumentWithDetails(
-                id=doc.id,
-                commune_id=doc.commune_id,
-                exercice_id=doc.exercice_id,
-                type_document=doc.type_document,
-                titre=doc.titre,
-                description=doc.description,
-                public=doc.public,
-                nom_fichier=doc.nom_fichier,
-                chemin_fichier=doc.chemin_fichier,
-                taille_octets=doc.taille_octets,
-                mime_type=doc.mime_type,
-                uploade_par=doc.uploade_par,
-                nb_telechargements=doc.nb_telechargements,
-                taille_formatee=doc.taille_formatee,
-                extension=doc.extension,
-                created_at=doc.created_at,
-                updated_at=doc.updated_at,
-                commune_nom=commune.nom if commune else None,
-                exercice_annee=exercice.annee if exercice else None,
-                uploadeur_nom=None,
-            )
-        )
+        stmt = stmt.where(Document.public == public)
 
-    return results
+    documents = db.execute(
+        stmt.order_by(Document.created_at.desc()).offset(offset).limit(limit)
+    ).mappings().all()
+
+    return Response(
+        content=dump_list_json(
+            DocumentWithDetails, [DocumentWithDetails.model_construct(**row) for row in documents]
+        ),
+        media_type="application/json",
+    )
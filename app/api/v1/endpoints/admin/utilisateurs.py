@@ -7,7 +7,7 @@ from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from app.api.deps import CurrentAdmin, get_db
 from app.core.security import get_password_hash, verify_password
@@ -25,6 +25,13 @@ from app.schemas.base import Message
 
 router = APIRouter(prefix="/utilisateurs", tags=["Admin - Utilisateurs"])
 
+ROLE_NOMS = {
+    'admin': 'Administrateur',
+    'editeur': 'Éditeur',
+    'lecteur': 'Lecteur',
+    'commune': 'Commune',
+}
+
 
 @router.get(
     "",
@@ -92,12 +99,36 @@ async def list_utilisateurs(
     # Calculate offset from page
     offset = (page - 1) * limit
 
-    # Get paginated results
-    users = query.order_by(Utilisateur.nom).offset(offset).limit(limit).all()
+    # Get paginated results: projected columns only, commune name/code
+    # through an outer join (no ORM objects, no per-user commune lookup)
+    users = (
+        query
+        .outerjoin(Commune, Commune.id == Utilisateur.commune_id)
+        .with_entities(
+            Utilisateur.id,
+            Utilisateur.email,
+            Utilisateur.nom,
+            Utilisateur.prenom,
+            Utilisateur.role,
+            Utilisateur.commune_id,
+            Utilisateur.actif,
+            Utilisateur.email_verifie,
+            Utilisateur.derniere_connexion,
+            Utilisateur.created_at,
+            Utilisateur.updated_at,
+            Commune.nom.label("commune_nom"),
+            Commune.code.label("commune_code"),
+        )
+        .order_by(Utilisateur.nom)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
 
     # Build user list with stats
     items = []
     for u in users:
+        role_code = u.role.value if hasattr(u.role, 'value') else str(u.role)
         items.append({
             "id": str(u.id),
             "email": u.email,
@@ -105,15 +136,13 @@ async def list_utilisateurs(
             "prenom": u.prenom,
             "role": {
                 "id": str(u.id),
-                "code": u.role.value if hasattr(u.role, 'value') else str(u.role),
-                "nom": {
-                    'admin': 'Administrateur',
-                    'editeur': 'Éditeur',
-                    'lecteur': 'Lecteur',
-                    'commune': 'Commune',
-                }.get(u.role.value if hasattr(u.role, 'value') else str(u.role), u.role.value if hasattr(u.role, 'value') else str(u.role)),
+                "code": role_code,
+                "nom": ROLE_NOMS.get(role_code, role_code),
                 "actif": True,
             },
+            "commune_id": u.commune_id,
+            "commune_nom": u.commune_nom,
+            "commune_code": u.commune_code,
             "actif": u.actif,
             "email_verifie": u.email_verifie,
             "derniere_connexion": u.derniere_connexion.isoformat() if u.derniere_connexion else None,
@@ -147,7 +176,7 @@ async def get_utilisateur(
     """
     user = (
         db.query(Utilisateur)
-        .options(joinedload(Utilisateur.commune))
+        .options(*Utilisateur.with_full_detail())
         .filter(Utilisateur.id == user_id)
         .first()
     )
@@ -158,12 +187,6 @@ async def get_utilisateur(
         )
 
     role_code = user.role.value if hasattr(user.role, 'value') else str(user.role)
-    role_names = {
-        'admin': 'Administrateur',
-        'editeur': 'Éditeur',
-        'lecteur': 'Lecteur',
-        'commune': 'Commune',
-    }
 
     return {
         "id": str(user.id),
@@ -173,7 +196,7 @@ async def get_utilisateur(
         "role": {
             "id": role_code,
             "code": role_code,
-            "nom": role_names.get(role_code, role_code),
+            "nom": ROLE_NOMS.get(role_code, role_code),
             "actif": True,
         },
         "commune_id": user.commune_id,
@@ -198,7 +221,7 @@ async def get_utilisateur(
     summary="Créer un utilisateur",
     description="Crée un nouvel utilisateur (admin uniquement).",
 )
-async def create_utilisateur(
+def create_utilisateur(
     user_data: UserCreate,
     current_user: CurrentAdmin,
     db: Session = Depends(get_db),
@@ -214,7 +237,7 @@ async def create_utilisateur(
     - **commune_id**: Associated commune (optional)
     """
     # Check if email exists
-    existing = db.query(Utilisateur).filter(Utilisateur.email == user_data.email).first()
+    existing = db.query(Utilisateur).filter(Utilisateur.par_email(user_data.email)).first()
     if existing:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -286,7 +309,7 @@ async def update_utilisateur(
     # Check email uniqueness if changing
     if user_data.email and user_data.email != user.email:
         existing = (
-            db.query(Utilisateur).filter(Utilisateur.email == user_data.email).first()
+            db.query(Utilisateur).filter(Utilisateur.par_email(user_data.email)).first()
         )
         if existing:
             raise HTTPException(
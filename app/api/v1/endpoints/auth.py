@@ -53,7 +53,7 @@ def get_client_info(request: Request) -> tuple[Optional[str], Optional[str]]:
     summary="Connexion utilisateur",
     description="Authentifie un utilisateur et retourne les tokens JWT."
 )
-async def login(
+def login(
     request: Request,
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db),
@@ -93,7 +93,7 @@ async def login(
     summary="Connexion utilisateur (JSON)",
     description="Authentifie un utilisateur via JSON et retourne les tokens avec les infos utilisateur."
 )
-async def login_json(
+def login_json(
     request: Request,
     credentials: UserLogin,
     db: Session = Depends(get_db),
@@ -120,27 +120,7 @@ async def login_json(
         )
 
     ip_address, user_agent = get_client_info(request)
-    token = auth_service.create_tokens(user, ip_address, user_agent)
-
-    return UserLoginResponse(
-        token=token,
-        user=UserRead(
-            id=user.id,
-            email=user.email,
-            nom=user.nom,
-            prenom=user.prenom,
-            role=user.role,
-            commune_id=user.commune_id,
-            actif=user.actif,
-            email_verifie=user.email_verifie,
-            derniere_connexion=user.derniere_connexion,
-            created_at=user.created_at,
-            updated_at=user.updated_at,
-            nom_complet=user.nom_complet,
-            is_admin=user.is_admin,
-            is_editor=user.is_editor,
-        )
-    )
+    return auth_service.login(user, ip_address, user_agent)
 
 
 @router.post(
@@ -210,7 +190,7 @@ async def request_password_reset(
     summary="Confirmer la réinitialisation",
     description="Réinitialise le mot de passe avec le token."
 )
-async def confirm_password_reset(
+def confirm_password_reset(
     reset_confirm: PasswordResetConfirm,
     db: Session = Depends(get_db),
 ):
@@ -311,7 +291,7 @@ async def logout_all(
     summary="Changer le mot de passe",
     description="Change le mot de passe de l'utilisateur connecté."
 )
-async def change_password(
+def change_password(
     password_data: PasswordChange,
     current_user: CurrentActiveUser,
     db: Session = Depends(get_db),
@@ -350,17 +330,9 @@ async def list_sessions(
     List all active sessions for current user.
     """
     auth_service = AuthService(db)
-    sessions = auth_service.get_user_sessions(current_user.id)
-
-    return [
-        SessionList(
-            id=session.id,
-            ip_address=session.ip_address,
-            created_at=session.created_at,
-            is_current=False,  # Would need current token to determine
-        )
-        for session in sessions
-    ]
+    # Validated once by response_model (from_attributes); is_current stays False
+    # since the current token is not known here
+    return auth_service.get_user_sessions(current_user.id)
 
 
 # =====================
@@ -374,7 +346,7 @@ async def list_sessions(
     summary="Inscription (Admin)",
     description="Crée un nouveau compte utilisateur. Réservé aux administrateurs."
 )
-async def register_user(
+def register_user(
     user_data: UserRegister,
     current_admin: CurrentAdmin,
     db: Session = Depends(get_db),
@@ -3,17 +3,23 @@ Public documents API endpoints.
 Access to public documents and file downloads.
 """
 
+import base64
+from datetime import datetime
+from functools import lru_cache
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from fastapi.responses import FileResponse
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import FileResponse, Response
+from sqlalchemy import Select, bindparam, select, tuple_
+from sqlalchemy.orm import Session, undefer_group
 
 from app.api.deps import DbSession, get_db
+from app.models.base import DETAIL
 from app.models.comptabilite import Exercice
 from app.models.documents import Document
 from app.models.geographie import Commune
 from app.models.enums import TypeDocument
+from app.schemas.base import dump_list_json
 from app.schemas.documents import (
     DocumentDownloadInfo,
     DocumentFilter,
@@ -24,6 +30,64 @@ from app.schemas.documents import (
 router = APIRouter(prefix="/documents", tags=["Documents"])
 
 
+def _encode_cursor(doc: Document) -> str:
+    """Opaque cursor pointing after a document: (created_at, id) in base64."""
+    raw = f"{doc.created_at.isoformat()}|{doc.id}".encode()
+    return base64.urlsafe_b64encode(raw).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, int]:
+    """Decode a cursor produced by _encode_cursor."""
+    try:
+        created_at, doc_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        return datetime.fromisoformat(created_at), int(doc_id)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Curseur de pagination invalide"
+        )
+
+
+# Filtres optionnels de la liste publique ; le rang donne le bit du masque
+_FILTRES_LISTE = ("commune_id", "exercice_id", "type_document", "search", "cursor_id")
+
+
+@lru_cache(maxsize=64)
+def _requete_liste(masque: int) -> Select:
+    """
+    Public document list statement for one combination of filters.
+
+    Built once per combination (bit i set: _FILTRES_LISTE[i] is filtered on)
+    with bound parameters only; the values are passed at execution, so the
+    statement and its compiled SQL are reused across requests.
+    """
+    stmt = select(Document).where(Document.public == True)
+
+    if masque & 1:
+        stmt = stmt.where(Document.commune_id == bindparam("commune_id"))
+    if masque & 2:
+        stmt = stmt.where(Document.exercice_id == bindparam("exercice_id"))
+    if masque & 4:
+        stmt = stmt.where(Document.type_document == bindparam("type_document"))
+    if masque & 8:
+        stmt = stmt.where(Document.recherche(bindparam("search")))
+
+    # Curseur : reprise après le dernier document vu (index idx_documents_public_recents),
+    # sans parcourir puis ignorer les pages précédentes comme avec OFFSET
+    if masque & 16:
+        stmt = stmt.where(
+            tuple_(Document.created_at, Document.id)
+            < tuple_(bindparam("cursor_created_at"), bindparam("cursor_id"))
+        )
+    else:
+        stmt = stmt.offset(bindparam("offset"))
+
+    return stmt.order_by(
+        Document.created_at.desc(),
+        Document.id.desc()
+    ).limit(bindparam("limit"))
+
+
 @router.get(
     "",
     response_model=list[DocumentList],
@@ -47,7 +111,7 @@ async def list_documents(
         None,
         min_length=2,
         max_length=100,
-        description="Recherche dans le titre"
+        description="Recherche plein texte (titre, description, nom de fichier)"
     ),
     limit: int = Query(
         50,
@@ -60,6 +124,11 @@ async def list_documents(
         ge=0,
         description="Nombre de résultats à ignorer"
     ),
+    cursor: Optional[str] = Query(
+        None,
+        max_length=100,
+        description="Curseur de la page suivante (en-tête X-Next-Cursor), remplace offset"
+    ),
     db: Session = Depends(get_db),
 ):
     """
@@ -70,43 +139,44 @@ async def list_documents(
     - **commune_id**: Filter by commune
     - **exercice_annee**: Filter by fiscal year
     - **type_document**: Filter by document type
-    - **search**: Search in title
+    - **search**: Full-text search in title, description and file name
     - **limit**: Max results (default 50, max 200)
     - **offset**: Skip results for pagination
+    - **cursor**: Keyset pagination, from the X-Next-Cursor header of the previous page
     """
-    query = db.query(Document).filter(Document.public == True)
+    params = {"limit": limit}
 
     if commune_id:
-        query = query.filter(Document.commune_id == commune_id)
+        params["commune_id"] = commune_id
 
     if exercice_annee:
         exercice = db.query(Exercice).filter(Exercice.annee == exercice_annee).first()
         if exercice:
-            query = query.filter(Document.exercice_id == exercice.id)
+            params["exercice_id"] = exercice.id
 
     if type_document:
-        query = query.filter(Document.type_document == type_document)
+        params["type_document"] = type_document
 
     if search:
-        query = query.filter(Document.titre.ilike(f"%{search}%"))
-
-    documents = query.order_by(
-        Document.created_at.desc()
-    ).offset(offset).limit(limit).all()
-
-    return [
-        DocumentList(
-            id=doc.id,
-            type_document=doc.type_document,
-            titre=doc.titre,
-            nom_fichier=doc.nom_fichier,
-            taille_formatee=doc.taille_formatee,
-            mime_type=doc.mime_type,
-            public=doc.public,
-            created_at=doc.created_at
-        )
-        for doc in documents
-    ]
+        params["search"] = search
+
+    if cursor:
+        params["cursor_created_at"], params["cursor_id"] = _decode_cursor(cursor)
+    else:
+        params["offset"] = offset
+
+    masque = sum(1 << i for i, nom in enumerate(_FILTRES_LISTE) if nom in params)
+    documents = db.scalars(_requete_liste(masque), params).all()
+
+    response = Response(
+        content=dump_list_json(
+            DocumentList, [DocumentList.from_orm_trusted(doc) for doc in documents]
+        ),
+        media_type="application/json",
+    )
+    if len(documents) == limit:
+        response.headers["X-Next-Cursor"] = _encode_cursor(documents[-1])
+    return response
 
 
 @router.get(
@@ -158,19 +228,12 @@ async def get_documents_by_commune(
 
     documents = query.order_by(Document.created_at.desc()).all()
 
-    return [
-        DocumentList(
-            id=doc.id,
-            type_document=doc.type_document,
-            titre=doc.titre,
-            nom_fichier=doc.nom_fichier,
-            taille_formatee=doc.taille_formatee,
-            mime_type=doc.mime_type,
-            public=doc.public,
-            created_at=doc.created_at
-        )
-        for doc in documents
-    ]
+    return Response(
+        content=dump_list_json(
+            DocumentList, [DocumentList.from_orm_trusted(doc) for doc in documents]
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -187,9 +250,7 @@ async def get_document(
     Get a public document by ID.
     """
     document = db.query(Document).options(
-        joinedload(Document.commune),
-        joinedload(Document.exercice),
-        joinedload(Document.uploadeur)
+        *Document.with_full_detail()
     ).filter(
         Document.id == document_id,
         Document.public == True
@@ -244,7 +305,9 @@ async def download_document(
     or stream the file directly. This implementation returns the
     file path for simplicity.
     """
-    document = db.query(Document).filter(
+    document = db.query(Document).options(
+        undefer_group(DETAIL)
+    ).filter(
         Document.id == document_id,
         Document.public == True
     ).first()
@@ -283,7 +346,9 @@ async def get_document_file(
 
     Returns the file as a download response.
     """
-    document = db.query(Document).filter(
+    document = db.query(Document).options(
+        undefer_group(DETAIL)
+    ).filter(
         Document.id == document_id,
         Document.public == True
     ).first()
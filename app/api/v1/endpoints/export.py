@@ -4,7 +4,6 @@ Generate and download administrative account reports in Excel and Word formats.
 """
 
 from datetime import datetime
-from decimal import Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
@@ -15,8 +14,9 @@ from sqlalchemy.orm import Session, joinedload
 from app.api.deps import get_db
 from app.api.v1.endpoints.tableaux import (
     _get_commune_and_exercice,
-    _build_recettes_sections,
     _build_depenses_sections,
+    _build_equilibre,
+    _build_recettes_sections,
 )
 from app.models.comptabilite import (
     DonneesDepenses,
@@ -24,12 +24,9 @@ from app.models.comptabilite import (
     Exercice,
 )
 from app.models.geographie import Commune, Region
-from app.models.enums import SectionBudgetaire
 from app.schemas.tableau import (
-    LigneEquilibre,
     TableauComplet,
     TableauDepenses,
-    TableauEquilibre,
     TableauRecettes,
 )
 from app.services.export_service import excel_export_service, word_export_service
@@ -60,7 +57,6 @@ def _build_tableau_complet(
     total_depenses_paiement = sum(s.total_paiement for s in depenses_sections)
 
     # Build recettes table
-    taux_recettes = (total_recettes_or / total_recettes_prev * 100) if total_recettes_prev > 0 else None
     tableau_recettes = TableauRecettes(
         commune_id=commune_id,
         commune_nom=commune.nom,
@@ -68,12 +64,10 @@ def _build_tableau_complet(
         sections=recettes_sections,
         total_general_previsions=total_recettes_prev,
         total_general_or_admis=total_recettes_or,
-        total_general_recouvrement=total_recettes_recouv,
-        taux_execution_global=taux_recettes
+        total_general_recouvrement=total_recettes_recouv
     )
 
     # Build depenses table
-    taux_depenses = (total_depenses_mandat / total_depenses_prev * 100) if total_depenses_prev > 0 else None
     tableau_depenses = TableauDepenses(
         commune_id=commune_id,
         commune_nom=commune.nom,
@@ -81,82 +75,12 @@ def _build_tableau_complet(
         sections=depenses_sections,
         total_general_previsions=total_depenses_prev,
         total_general_mandat_admis=total_depenses_mandat,
-        total_general_paiement=total_depenses_paiement,
-        taux_execution_global=taux_depenses
+        total_general_paiement=total_depenses_paiement
     )
 
     # Build equilibre table
-    fonct_recettes = recettes_sections[0] if recettes_sections else None
-    fonct_depenses = depenses_sections[0] if depenses_sections else None
-    invest_recettes = recettes_sections[1] if len(recettes_sections) > 1 else None
-    invest_depenses = depenses_sections[1] if len(depenses_sections) > 1 else None
-
-    fonct_r_prev = fonct_recettes.total_previsions_definitives if fonct_recettes else Decimal("0.00")
-    fonct_r_real = fonct_recettes.total_or_admis if fonct_recettes else Decimal("0.00")
-    fonct_d_prev = fonct_depenses.total_previsions_definitives if fonct_depenses else Decimal("0.00")
-    fonct_d_real = fonct_depenses.total_mandat_admis if fonct_depenses else Decimal("0.00")
-
-    invest_r_prev = invest_recettes.total_previsions_definitives if invest_recettes else Decimal("0.00")
-    invest_r_real = invest_recettes.total_or_admis if invest_recettes else Decimal("0.00")
-    invest_d_prev = invest_depenses.total_previsions_definitives if invest_depenses else Decimal("0.00")
-    invest_d_real = invest_depenses.total_mandat_admis if invest_depenses else Decimal("0.00")
-
-    lignes_equilibre = [
-        LigneEquilibre(
-            libelle="Section de fonctionnement",
-            section=SectionBudgetaire.FONCTIONNEMENT,
-            recettes_previsions=fonct_r_prev,
-            recettes_realisations=fonct_r_real,
-            depenses_previsions=fonct_d_prev,
-            depenses_realisations=fonct_d_real,
-            solde_previsions=fonct_r_prev - fonct_d_prev,
-            solde_realisations=fonct_r_real - fonct_d_real,
-        ),
-        LigneEquilibre(
-            libelle="Section d'investissement",
-            section=SectionBudgetaire.INVESTISSEMENT,
-            recettes_previsions=invest_r_prev,
-            recettes_realisations=invest_r_real,
-            depenses_previsions=invest_d_prev,
-            depenses_realisations=invest_d_real,
-            solde_previsions=invest_r_prev - invest_d_prev,
-            solde_realisations=invest_r_real - invest_d_real,
-        ),
-        LigneEquilibre(
-            libelle="TOTAL GÉNÉRAL",
-            section=None,
-            recettes_previsions=total_recettes_prev,
-            recettes_realisations=total_recettes_or,
-            depenses_previsions=total_depenses_prev,
-            depenses_realisations=total_depenses_mandat,
-            solde_previsions=total_recettes_prev - total_depenses_prev,
-            solde_realisations=total_recettes_or - total_depenses_mandat,
-        ),
-    ]
-
-    tableau_equilibre = TableauEquilibre(
-        commune_id=commune_id,
-        commune_nom=commune.nom,
-        exercice_annee=exercice_annee,
-        lignes=lignes_equilibre,
-        fonctionnement_recettes_prev=fonct_r_prev,
-        fonctionnement_recettes_real=fonct_r_real,
-        fonctionnement_depenses_prev=fonct_d_prev,
-        fonctionnement_depenses_real=fonct_d_real,
-        fonctionnement_solde_prev=fonct_r_prev - fonct_d_prev,
-        fonctionnement_solde_real=fonct_r_real - fonct_d_real,
-        investissement_recettes_prev=invest_r_prev,
-        investissement_recettes_real=invest_r_real,
-        investissement_depenses_prev=invest_d_prev,
-        investissement_depenses_real=invest_d_real,
-        investissement_solde_prev=invest_r_prev - invest_d_prev,
-        investissement_solde_real=invest_r_real - invest_d_real,
-        total_recettes_prev=total_recettes_prev,
-        total_recettes_real=total_recettes_or,
-        total_depenses_prev=total_depenses_prev,
-        total_depenses_real=total_depenses_mandat,
-        total_solde_prev=total_recettes_prev - total_depenses_prev,
-        total_solde_real=total_recettes_or - total_depenses_mandat,
+    tableau_equilibre = _build_equilibre(
+        commune_id, commune.nom, exercice_annee, recettes_sections, depenses_sections
     )
 
     return TableauComplet(
@@ -250,7 +174,6 @@ async def export_excel_recettes(
     total_prev = sum(s.total_previsions_definitives for s in sections)
     total_or = sum(s.total_or_admis for s in sections)
     total_recouv = sum(s.total_recouvrement for s in sections)
-    taux = (total_or / total_prev * 100) if total_prev > 0 else None
 
     recettes = TableauRecettes(
         commune_id=commune_id,
@@ -259,8 +182,7 @@ async def export_excel_recettes(
         sections=sections,
         total_general_previsions=total_prev,
         total_general_or_admis=total_or,
-        total_general_recouvrement=total_recouv,
-        taux_execution_global=taux
+        total_general_recouvrement=total_recouv
     )
 
     commune_info = {
@@ -313,7 +235,6 @@ async def export_excel_depenses(
     total_prev = sum(s.total_previsions_definitives for s in sections)
     total_mandat = sum(s.total_mandat_admis for s in sections)
     total_paiement = sum(s.total_paiement for s in sections)
-    taux = (total_mandat / total_prev * 100) if total_prev > 0 else None
 
     depenses = TableauDepenses(
         commune_id=commune_id,
@@ -322,8 +243,7 @@ async def export_excel_depenses(
         sections=sections,
         total_general_previsions=total_prev,
         total_general_mandat_admis=total_mandat,
-        total_general_paiement=total_paiement,
-        taux_execution_global=taux
+        total_general_paiement=total_paiement
     )
 
     commune_info = {
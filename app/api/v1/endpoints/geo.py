@@ -6,15 +6,17 @@ Provinces, Regions, Communes - Madagascar administrative hierarchy.
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
 from sqlalchemy.orm import Session, joinedload
 
 from app.api.deps import DbSession, get_db
 from app.models.geographie import Commune, Province, Region
 from app.models.comptabilite import DonneesRecettes, DonneesDepenses
 from app.models.enums import TypeCommune
-from sqlalchemy import func
+from sqlalchemy import Integer, Text, cast, distinct, func, literal_column, select, union
+from sqlalchemy.dialects.postgresql import aggregate_order_by
 
-from app.schemas.base import PaginatedResponse
+from app.schemas.base import PaginatedResponse, dump_list_json
 from app.schemas.geographie import (
     CommuneDetail,
     CommuneList,
@@ -33,32 +35,108 @@ from app.schemas.geographie import (
 router = APIRouter(prefix="/geo", tags=["Géographie"])
 
 
-def _get_commune_ca_counts(db: Session) -> dict[int, int]:
+def _objet_json(model, noms: tuple[str, ...], **extra):
     """
-    Get the number of distinct exercices with data for each commune.
-    Returns a dict {commune_id: nb_comptes_administratifs}.
+    json_build_object des colonnes `noms` du modèle, dans l'ordre du schéma,
+    suivies des expressions `extra`.
     """
-    # Collect (commune_id, exercice_id) pairs from both tables
-    pairs: set[tuple[int, int]] = set()
+    paires = [(nom, getattr(model, nom)) for nom in noms] + list(extra.items())
+    # Clés en littéraux SQL : un paramètre lié n'a pas de type pour json_build_object
+    return func.json_build_object(
+        *(arg for nom, valeur in paires for arg in (literal_column(f"'{nom}'"), valeur))
+    )
+
+
+def _requete_hierarchie():
+    """
+    Hiérarchie provinces → régions, assemblée en JSON par PostgreSQL.
+    Clés et ordre repris des schémas ProvinceWithRegions / RegionList ;
+    type json (et non jsonb) pour conserver cet ordre. Converti en texte
+    pour que le pilote ne décode pas le document.
+    """
+    regions = (
+        select(
+            Region.province_id,
+            func.json_agg(
+                aggregate_order_by(
+                    _objet_json(Region, RegionList.__trusted_fields__), Region.nom
+                )
+            ).label("regions"),
+        )
+        .group_by(Region.province_id)
+        .subquery()
+    )
+
+    champs_province = tuple(
+        nom for nom in ProvinceWithRegions.__trusted_fields__ if nom != "regions"
+    )
+    province = _objet_json(
+        Province,
+        champs_province,
+        regions=func.coalesce(regions.c.regions, literal_column("'[]'::json")),
+    )
+
+    provinces = (
+        select(func.json_agg(aggregate_order_by(province, Province.nom)))
+        .select_from(Province)
+        .outerjoin(regions, regions.c.province_id == Province.id)
+        .scalar_subquery()
+    )
+
+    return select(
+        cast(
+            func.json_build_object(
+                literal_column("'provinces'"),
+                func.coalesce(provinces, literal_column("'[]'::json")),
+            ),
+            Text,
+        )
+    )
+
+
+_HIERARCHIE_JSON = _requete_hierarchie()
 
-    for cid, eid in db.query(
-        DonneesRecettes.commune_id,
-        DonneesRecettes.exercice_id,
-    ).distinct().all():
-        pairs.add((cid, eid))
 
-    for cid, eid in db.query(
-        DonneesDepenses.commune_id,
-        DonneesDepenses.exercice_id,
-    ).distinct().all():
-        pairs.add((cid, eid))
+def _commune_ca_counts_subquery():
+    """
+    Subquery (commune_id, nb) : number of distinct exercices with data
+    (recettes or depenses) for each commune, counted by PostgreSQL.
+    """
+    # UNION (sans ALL) dédoublonne les paires (commune, exercice)
+    paires = union(
+        select(DonneesRecettes.commune_id, DonneesRecettes.exercice_id),
+        select(DonneesDepenses.commune_id, DonneesDepenses.exercice_id),
+    ).subquery()
+
+    return (
+        select(paires.c.commune_id, func.count().label("nb"))
+        .group_by(paires.c.commune_id)
+        .subquery()
+    )
 
-    # Count distinct exercices per commune
-    counts: dict[int, int] = {}
-    for commune_id, _ in pairs:
-        counts[commune_id] = counts.get(commune_id, 0) + 1
 
-    return counts
+def _get_commune_ca_counts(db: Session, commune_ids: list[int]) -> dict[int, int]:
+    """
+    Get the number of distinct exercices with data for the given communes.
+    Returns a dict {commune_id: nb_comptes_administratifs}.
+    """
+    ca = _commune_ca_counts_subquery()
+    return dict(db.execute(
+        select(ca.c.commune_id, ca.c.nb).where(ca.c.commune_id.in_(commune_ids))
+    ).all())
+
+
+def _colonnes_commune(schema, *exclus: str) -> list:
+    """
+    Columns named after the schema fields: commune columns, plus region and
+    province names (the query must join Region and Province).
+    """
+    parents = {"region_nom": Region.nom, "province_nom": Province.nom}
+    return [
+        (parents[name] if name in parents else getattr(Commune, name)).label(name)
+        for name in schema.__trusted_fields__
+        if name not in exclus
+    ]
 
 
 # =====================
@@ -80,27 +158,32 @@ async def list_provinces(
     Returns the 6 provinces of Madagascar ordered by name,
     with nb_regions and nb_communes counts.
     """
-    provinces = db.query(Province).options(
-        joinedload(Province.regions).joinedload(Region.communes)
-    ).order_by(Province.nom).all()
-
-    ca_counts = _get_commune_ca_counts(db)
-
-    return [
-        ProvinceWithStats(
-            id=p.id,
-            code=p.code,
-            nom=p.nom,
-            nb_regions=len(p.regions),
-            nb_communes=sum(len(r.communes) for r in p.regions),
-            nb_comptes_administratifs=sum(
-                ca_counts.get(c.id, 0)
-                for r in p.regions
-                for c in r.communes
-            )
+    # Comptages agrégés par PostgreSQL en une requête (pas de chargement des
+    # régions et communes)
+    ca = _commune_ca_counts_subquery()
+    provinces = (
+        db.query(
+            Province.id,
+            Province.code,
+            Province.nom,
+            func.count(distinct(Region.id)).label("nb_regions"),
+            func.count(Commune.id).label("nb_communes"),
+            cast(func.coalesce(func.sum(ca.c.nb), 0), Integer).label("nb_comptes_administratifs"),
         )
-        for p in provinces
-    ]
+        .outerjoin(Region, Region.province_id == Province.id)
+        .outerjoin(Commune, Commune.region_id == Region.id)
+        .outerjoin(ca, ca.c.commune_id == Commune.id)
+        .group_by(Province.id)
+        .order_by(Province.nom)
+        .all()
+    )
+
+    return Response(
+        content=dump_list_json(ProvinceWithStats, [
+            ProvinceWithStats.from_orm_trusted(p) for p in provinces
+        ]),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -152,9 +235,22 @@ async def list_regions(
     Optionally filter by province_id.
     Returns regions with nb_communes count and province_nom.
     """
-    query = db.query(Region).options(
-        joinedload(Region.province),
-        joinedload(Region.communes)
+    # Comptages agrégés par PostgreSQL en une requête
+    ca = _commune_ca_counts_subquery()
+    query = (
+        db.query(
+            Region.id,
+            Region.code,
+            Region.nom,
+            Region.province_id,
+            Province.nom.label("province_nom"),
+            func.count(Commune.id).label("nb_communes"),
+            cast(func.coalesce(func.sum(ca.c.nb), 0), Integer).label("nb_comptes_administratifs"),
+        )
+        .outerjoin(Province, Province.id == Region.province_id)
+        .outerjoin(Commune, Commune.region_id == Region.id)
+        .outerjoin(ca, ca.c.commune_id == Commune.id)
+        .group_by(Region.id, Province.nom)
     )
 
     if province_id:
@@ -162,22 +258,12 @@ async def list_regions(
 
     regions = query.order_by(Region.nom).all()
 
-    ca_counts = _get_commune_ca_counts(db)
-
-    return [
-        RegionWithStats(
-            id=r.id,
-            code=r.code,
-            nom=r.nom,
-            province_id=r.province_id,
-            nb_communes=len(r.communes),
-            province_nom=r.province.nom if r.province else None,
-            nb_comptes_administratifs=sum(
-                ca_counts.get(c.id, 0) for c in r.communes
-            )
-        )
-        for r in regions
-    ]
+    return Response(
+        content=dump_list_json(RegionWithStats, [
+            RegionWithStats.from_orm_trusted(r) for r in regions
+        ]),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -262,9 +348,7 @@ async def list_communes(
     query = db.query(Commune)
 
     if province_id:
-        query = query.filter(
-            Commune.region.has(Region.province_id == province_id)
-        )
+        query = query.filter(Commune.province_id == province_id)
 
     if region_id:
         query = query.filter(Commune.region_id == region_id)
@@ -278,31 +362,36 @@ async def list_communes(
     total = query.count()
 
     offset = (page - 1) * limit
-    communes = query.options(
-        joinedload(Commune.region).joinedload(Region.province)
-    ).order_by(Commune.nom).offset(offset).limit(limit).all()
+    # Noms de région et de province projetés dans la même requête (jointures externes)
+    communes = (
+        query
+        .outerjoin(Region, Region.id == Commune.region_id)
+        .outerjoin(Province, Province.id == Commune.province_id)
+        .with_entities(*_colonnes_commune(CommuneWithStats, "nb_comptes_administratifs"))
+        .order_by(Commune.nom)
+        .offset(offset)
+        .limit(limit)
+        .all()
+    )
 
-    ca_counts = _get_commune_ca_counts(db)
+    ca_counts = _get_commune_ca_counts(db, [c.id for c in communes])
 
     items = [
-        CommuneWithStats(
-            id=c.id,
-            code=c.code,
-            nom=c.nom,
-            type_commune=c.type_commune,
-            region_id=c.region_id,
-            region_nom=c.region.nom if c.region else None,
-            province_nom=c.region.province.nom if c.region and c.region.province else None,
+        CommuneWithStats.model_construct(
+            **c._mapping,
             nb_comptes_administratifs=ca_counts.get(c.id, 0)
         )
         for c in communes
     ]
 
-    return PaginatedResponse.create(
-        items=items,
-        total=total,
-        page=page,
-        page_size=limit
+    return Response(
+        content=PaginatedResponse[CommuneWithStats].dump_json(
+            items=items,
+            total=total,
+            page=page,
+            page_size=limit
+        ),
+        media_type="application/json",
     )
 
 
@@ -332,23 +421,23 @@ async def search_communes(
 
     Returns communes matching the search term with their region and province names.
     """
-    communes = db.query(Commune).options(
-        joinedload(Commune.region).joinedload(Region.province)
-    ).filter(
-        Commune.nom.ilike(f"%{q}%")
-    ).order_by(Commune.nom).limit(limit).all()
+    communes = (
+        db.query(Commune)
+        .join(Region, Region.id == Commune.region_id)
+        .join(Province, Province.id == Commune.province_id)
+        .with_entities(*_colonnes_commune(CommuneSearch))
+        .filter(Commune.nom.ilike(f"%{q}%"))
+        .order_by(Commune.nom)
+        .limit(limit)
+        .all()
+    )
 
-    return [
-        CommuneSearch(
-            id=c.id,
-            code=c.code,
-            nom=c.nom,
-            type_commune=c.type_commune,
-            region_nom=c.region.nom,
-            province_nom=c.region.province.nom
-        )
-        for c in communes
-    ]
+    return Response(
+        content=dump_list_json(CommuneSearch, [
+            CommuneSearch.model_construct(**c._mapping) for c in communes
+        ]),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -365,7 +454,7 @@ async def get_commune(
     Get a commune by ID with full geographic context.
     """
     commune = db.query(Commune).options(
-        joinedload(Commune.region).joinedload(Region.province)
+        *Commune.with_full_detail()
     ).filter(Commune.id == commune_id).first()
 
     if not commune:
@@ -396,9 +485,9 @@ async def get_full_hierarchy(
     Returns all provinces with their regions.
     Note: Communes are not included for performance reasons.
     Use /regions/{id} to get communes for a specific region.
+
+    The JSON document is built by PostgreSQL and returned as is.
     """
-    provinces = db.query(Province).options(
-        joinedload(Province.regions)
-    ).order_by(Province.nom).all()
+    hierarchie = db.execute(_HIERARCHIE_JSON).scalar_one()
 
-    return HierarchieGeographique(provinces=provinces)
+    return Response(content=hierarchie.encode(), media_type="application/json")
@@ -20,7 +20,7 @@ from app.models.cms import (
     SectionCMS,
 )
 from app.models.comptabilite import Exercice
-from app.models.geographie import Commune, Region
+from app.models.geographie import Commune
 from app.models.enums import StatutPublication
 from app.schemas.cms import (
     BlocCarteFondRead,
@@ -205,7 +205,7 @@ async def get_page(
 
     # Get commune with full geographic context
     commune = db.query(Commune).options(
-        joinedload(Commune.region).joinedload(Region.province)
+        *Commune.with_full_detail()
     ).filter(Commune.id == commune_id).first()
 
     if not commune:
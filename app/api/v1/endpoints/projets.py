@@ -7,6 +7,8 @@ from decimal import Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy import func
 from sqlalchemy.orm import Session, joinedload
 
@@ -20,6 +22,7 @@ from app.models.projets_miniers import (
     SocieteMiniere,
 )
 from app.models.enums import StatutProjetMinier
+from app.schemas.base import dump_list_json
 from app.schemas.projets_miniers import (
     ProjetCommuneRead,
     ProjetMinierList,
@@ -33,6 +36,8 @@ from app.schemas.projets_miniers import (
 
 router = APIRouter(prefix="/projets", tags=["Projets Miniers"])
 
+_RESUME_ADAPTER = TypeAdapter(ResumeProjetMinier)
+
 
 # =====================
 # Mining Projects Endpoints
@@ -102,7 +107,13 @@ async def list_projets(
         query = query.filter(ProjetMinier.nom.ilike(f"%{search}%"))
 
     projets = query.order_by(ProjetMinier.nom).offset(offset).limit(limit).all()
-    return projets
+
+    return Response(
+        content=dump_list_json(
+            ProjetMinierList, [ProjetMinierList.from_orm_trusted(p) for p in projets]
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -140,8 +151,7 @@ async def get_projet(
     Includes company info and impacted communes.
     """
     projet = db.query(ProjetMinier).options(
-        joinedload(ProjetMinier.societe),
-        joinedload(ProjetMinier.projets_communes).joinedload(ProjetCommune.commune)
+        *ProjetMinier.with_full_detail()
     ).filter(ProjetMinier.id == projet_id).first()
 
     if not projet:
@@ -220,7 +230,7 @@ async def get_projet_resume(
             ).scalar()
             total_revenus = total or Decimal("0.00")
 
-    return ResumeProjetMinier(
+    resume = ResumeProjetMinier(
         projet_id=projet.id,
         projet_nom=projet.nom,
         societe_nom=projet.societe.nom,
@@ -231,6 +241,11 @@ async def get_projet_resume(
         total_revenus_annee=total_revenus
     )
 
+    return Response(
+        content=_RESUME_ADAPTER.dump_json(resume),
+        media_type="application/json",
+    )
+
 
 @router.get(
     "/by-commune/{commune_id}",
@@ -319,7 +334,13 @@ async def list_societes(
         query = query.filter(SocieteMiniere.nom.ilike(f"%{search}%"))
 
     societes = query.order_by(SocieteMiniere.nom).offset(offset).limit(limit).all()
-    return societes
+
+    return Response(
+        content=dump_list_json(
+            SocieteMiniereList, [SocieteMiniereList.from_orm_trusted(s) for s in societes]
+        ),
+        media_type="application/json",
+    )
 
 
 @router.get(
@@ -7,14 +7,17 @@ from decimal import Decimal
 from typing import Optional
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import Response
+from pydantic import TypeAdapter
 from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.orm import Session
 
 from app.api.deps import DbSession, get_db
 from app.models.comptabilite import CompteAdministratif, Exercice
 from app.models.geographie import Commune, Region
-from app.models.projets_miniers import ProjetMinier, RevenuMinier
+from app.models.projets_miniers import ProjetMinier, RevenuMinier, revenus_miniers_agreges
 from app.models.enums import TypeRevenuMinier
+from app.schemas.base import dump_list_json
 from app.schemas.projets_miniers import (
     RevenuMinierList,
     RevenuMinierWithDetails,
@@ -23,6 +26,8 @@ from app.schemas.projets_miniers import (
 
 router = APIRouter(prefix="/revenus", tags=["Revenus Miniers"])
 
+_STATISTIQUES_ADAPTER = TypeAdapter(StatistiquesRevenusMiniers)
+
 
 @router.get(
     "",
@@ -70,13 +75,7 @@ async def list_revenus_miniers(
     - **limit**: Max results (default 100, max 500)
     - **offset**: Skip results for pagination
     """
-    query = db.query(RevenuMinier).options(
-        joinedload(RevenuMinier.commune),
-        joinedload(RevenuMinier.exercice),
-        joinedload(RevenuMinier.projet),
-        joinedload(RevenuMinier.compte),
-        joinedload(RevenuMinier.compte_administratif)
-    )
+    query = db.query(RevenuMinier).options(*RevenuMinier.with_full_detail())
 
     if commune_id:
         query = query.filter(RevenuMinier.commune_id == commune_id)
@@ -110,8 +109,6 @@ async def list_revenus_miniers(
             commentaire=r.commentaire,
             ecart=r.ecart,
             taux_realisation=r.taux_realisation,
-            created_at=r.created_at,
-            updated_at=r.updated_at,
             commune_nom=r.commune.nom,
             exercice_annee=r.exercice.annee,
             projet_nom=r.projet.nom,
@@ -152,37 +149,31 @@ async def get_statistiques_revenus(
             detail=f"Exercice {exercice_annee} non trouvé"
         )
 
-    # Get ristournes totals
-    ristournes = db.query(
-        func.sum(RevenuMinier.montant_prevu).label("prevu"),
-        func.sum(RevenuMinier.montant_recu).label("recu")
-    ).filter(
-        RevenuMinier.commune_id == commune_id,
-        RevenuMinier.exercice_id == exercice.id,
-        RevenuMinier.type_revenu == TypeRevenuMinier.RISTOURNE
-    ).first()
-
-    # Get redevances totals
-    redevances = db.query(
-        func.sum(RevenuMinier.montant_prevu).label("prevu"),
-        func.sum(RevenuMinier.montant_recu).label("recu")
-    ).filter(
-        RevenuMinier.commune_id == commune_id,
-        RevenuMinier.exercice_id == exercice.id,
-        RevenuMinier.type_revenu == TypeRevenuMinier.REDEVANCE
-    ).first()
+    # Pre-aggregated totals by type (materialized view)
+    mv = revenus_miniers_agreges
+    totaux = {
+        row.type_revenu: row
+        for row in db.query(mv.c.type_revenu, mv.c.total_prevu, mv.c.total_recu).filter(
+            mv.c.commune_id == commune_id,
+            mv.c.exercice_id == exercice.id,
+            mv.c.type_revenu.in_([
+                TypeRevenuMinier.RISTOURNE_MINIERE,
+                TypeRevenuMinier.REDEVANCE_MINIERE,
+            ])
+        )
+    }
+    ristournes = totaux.get(TypeRevenuMinier.RISTOURNE_MINIERE)
+    redevances = totaux.get(TypeRevenuMinier.REDEVANCE_MINIERE)
 
-    ristournes_prev = ristournes.prevu or Decimal("0.00")
-    ristournes_recu = ristournes.recu or Decimal("0.00")
-    redevances_prev = redevances.prevu or Decimal("0.00")
-    redevances_recu = redevances.recu or Decimal("0.00")
+    ristournes_prev = ristournes.total_prevu if ristournes else Decimal("0.00")
+    ristournes_recu = ristournes.total_recu if ristournes else Decimal("0.00")
+    redevances_prev = redevances.total_prevu if redevances else Decimal("0.00")
+    redevances_recu = redevances.total_recu if redevances else Decimal("0.00")
 
     total_prevu = ristournes_prev + redevances_prev
     total_recu = ristournes_recu + redevances_recu
-    ecart = total_recu - total_prevu
-    taux = (total_recu / total_prevu * 100) if total_prevu > 0 else None
 
-    return StatistiquesRevenusMiniers(
+    statistiques = StatistiquesRevenusMiniers(
         commune_id=commune_id,
         exercice_annee=exercice_annee,
         ristournes_prevues=ristournes_prev,
@@ -190,9 +181,12 @@ async def get_statistiques_revenus(
         redevances_prevues=redevances_prev,
         redevances_recues=redevances_recu,
         total_prevu=total_prevu,
-        total_recu=total_recu,
-        ecart_total=ecart,
-        taux_realisation=taux
+        total_recu=total_recu
+    )
+
+    return Response(
+        content=_STATISTIQUES_ADAPTER.dump_json(statistiques),
+        media_type="application/json",
     )
 
 
@@ -223,17 +217,19 @@ async def get_statistiques_globales(
             detail=f"Exercice {exercice_annee} non trouvé"
         )
 
+    # Pre-aggregated totals (materialized view)
+    mv = revenus_miniers_agreges
     query = db.query(
-        func.count(RevenuMinier.id).label("nb_revenus"),
-        func.count(func.distinct(RevenuMinier.commune_id)).label("nb_communes"),
-        func.sum(RevenuMinier.montant_prevu).label("total_prevu"),
-        func.sum(RevenuMinier.montant_recu).label("total_recu")
+        func.sum(mv.c.nb_revenus).label("nb_revenus"),
+        func.count(func.distinct(mv.c.commune_id)).label("nb_communes"),
+        func.sum(mv.c.total_prevu).label("total_prevu"),
+        func.sum(mv.c.total_recu).label("total_recu")
     ).filter(
-        RevenuMinier.exercice_id == exercice.id
+        mv.c.exercice_id == exercice.id
     )
 
     if region_id:
-        query = query.join(Commune).filter(Commune.region_id == region_id)
+        query = query.join(Commune, Commune.id == mv.c.commune_id).filter(Commune.region_id == region_id)
 
     stats = query.first()
 
@@ -243,17 +239,17 @@ async def get_statistiques_globales(
 
     # Get breakdown by type
     by_type = db.query(
-        RevenuMinier.type_revenu,
-        func.sum(RevenuMinier.montant_prevu).label("prevu"),
-        func.sum(RevenuMinier.montant_recu).label("recu")
+        mv.c.type_revenu,
+        func.sum(mv.c.total_prevu).label("prevu"),
+        func.sum(mv.c.total_recu).label("recu")
     ).filter(
-        RevenuMinier.exercice_id == exercice.id
+        mv.c.exercice_id == exercice.id
     )
 
     if region_id:
-        by_type = by_type.join(Commune).filter(Commune.region_id == region_id)
+        by_type = by_type.join(Commune, Commune.id == mv.c.commune_id).filter(Commune.region_id == region_id)
 
-    by_type = by_type.group_by(RevenuMinier.type_revenu).all()
+    by_type = by_type.group_by(mv.c.type_revenu).all()
 
     par_type = {
         t.type_revenu.value: {
@@ -311,4 +307,9 @@ async def get_revenus_by_commune(
 
     revenus = query.order_by(RevenuMinier.date_reception.desc()).all()
 
-    return revenus
+    return Response(
+        content=dump_list_json(
+            RevenuMinierList, [RevenuMinierList.from_orm_trusted(r) for r in revenus]
+        ),
+        media_type="application/json",
+    )
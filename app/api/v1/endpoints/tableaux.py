@@ -4,38 +4,56 @@ Administrative accounts data presentation (recettes, depenses, equilibre).
 """
 
 from decimal import Decimal
-from typing import Optional
+from typing import Iterator, Optional, Union
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import func
-from sqlalchemy.orm import Session, joinedload
+from fastapi.responses import Response, StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import Row, func, select
+from sqlalchemy.orm import Session
 
 from app.api.deps import DbSession, get_db
-from app.models.comptabilite import (
-    DonneesDepenses,
-    DonneesRecettes,
-    Exercice,
-    PlanComptable,
-)
-from app.models.geographie import Commune, Region
+from app.models.comptabilite import DonneesDepenses, DonneesRecettes
 from app.models.enums import SectionBudgetaire, TypeMouvement
+from app.schemas.base import en_centimes
 from app.schemas.tableau import (
+    ColonnesDepenses,
+    ColonnesRecettes,
+    ColonnesTableauBase,
     ComparaisonExercices,
     LigneDepenses,
     LigneEquilibre,
     LigneRecettes,
     ResumeFinancier,
+    SectionDepensesColonnes,
+    SectionRecettesColonnes,
     SectionTableauDepenses,
     SectionTableauRecettes,
     StatistiquesRegion,
     TableauComplet,
     TableauDepenses,
+    TableauDepensesColonnes,
     TableauEquilibre,
     TableauRecettes,
+    TableauRecettesColonnes,
 )
+from app.services.cache_service import CommuneRef, ExerciceRef, reference_cache
 
 router = APIRouter(prefix="/tableaux", tags=["Tableaux"])
 
+# Sérialisation directe modèle -> JSON par pydantic-core, sans passer par
+# jsonable_encoder ni par un dict Python intermédiaire
+_COMPLET_ADAPTER = TypeAdapter(TableauComplet)
+_RECETTES_ADAPTER = TypeAdapter(TableauRecettes)
+_DEPENSES_ADAPTER = TypeAdapter(TableauDepenses)
+_EQUILIBRE_ADAPTER = TypeAdapter(TableauEquilibre)
+_RECETTES_COLONNES_ADAPTER = TypeAdapter(TableauRecettesColonnes)
+_DEPENSES_COLONNES_ADAPTER = TypeAdapter(TableauDepensesColonnes)
+_SECTION_RECETTES_ADAPTER = TypeAdapter(SectionTableauRecettes)
+_SECTION_DEPENSES_ADAPTER = TypeAdapter(SectionTableauDepenses)
+_LIGNE_RECETTES_ADAPTER = TypeAdapter(LigneRecettes)
+_LIGNE_DEPENSES_ADAPTER = TypeAdapter(LigneDepenses)
+
 
 def _aggregate_parent_values_recettes(lignes: list[LigneRecettes]) -> list[LigneRecettes]:
     """
@@ -60,18 +78,13 @@ def _aggregate_parent_values_recettes(lignes: list[LigneRecettes]) -> list[Ligne
                 # Vérifier si c'est un enfant direct (un seul niveau de différence)
                 if parent.niveau == ligne.niveau - 1:
                     # Agréger les valeurs
-                    parent.budget_primitif = (parent.budget_primitif or Decimal("0")) + (ligne.budget_primitif or Decimal("0"))
-                    parent.budget_additionnel = (parent.budget_additionnel or Decimal("0")) + (ligne.budget_additionnel or Decimal("0"))
-                    parent.modifications = (parent.modifications or Decimal("0")) + (ligne.modifications or Decimal("0"))
-                    parent.previsions_definitives = (parent.previsions_definitives or Decimal("0")) + (ligne.previsions_definitives or Decimal("0"))
-                    parent.or_admis = (parent.or_admis or Decimal("0")) + (ligne.or_admis or Decimal("0"))
-                    parent.recouvrement = (parent.recouvrement or Decimal("0")) + (ligne.recouvrement or Decimal("0"))
-                    parent.reste_a_recouvrer = (parent.reste_a_recouvrer or Decimal("0")) + (ligne.reste_a_recouvrer or Decimal("0"))
-
-    # Recalculer les taux d'exécution pour les parents
-    for ligne in lignes:
-        if ligne.niveau < 3 and ligne.previsions_definitives and ligne.previsions_definitives > 0:
-            ligne.taux_execution = (ligne.or_admis / ligne.previsions_definitives * 100) if ligne.or_admis else None
+                    parent.budget_primitif += ligne.budget_primitif
+                    parent.budget_additionnel += ligne.budget_additionnel
+                    parent.modifications += ligne.modifications
+                    parent.previsions_definitives += ligne.previsions_definitives
+                    parent.or_admis += ligne.or_admis
+                    parent.recouvrement += ligne.recouvrement
+                    parent.reste_a_recouvrer += ligne.reste_a_recouvrer
 
     return lignes
 
@@ -99,19 +112,14 @@ def _aggregate_parent_values_depenses(lignes: list[LigneDepenses]) -> list[Ligne
                 # Vérifier si c'est un enfant direct (un seul niveau de différence)
                 if parent.niveau == ligne.niveau - 1:
                     # Agréger les valeurs
-                    parent.budget_primitif = (parent.budget_primitif or Decimal("0")) + (ligne.budget_primitif or Decimal("0"))
-                    parent.budget_additionnel = (parent.budget_additionnel or Decimal("0")) + (ligne.budget_additionnel or Decimal("0"))
-                    parent.modifications = (parent.modifications or Decimal("0")) + (ligne.modifications or Decimal("0"))
-                    parent.previsions_definitives = (parent.previsions_definitives or Decimal("0")) + (ligne.previsions_definitives or Decimal("0"))
-                    parent.engagement = (parent.engagement or Decimal("0")) + (ligne.engagement or Decimal("0"))
-                    parent.mandat_admis = (parent.mandat_admis or Decimal("0")) + (ligne.mandat_admis or Decimal("0"))
-                    parent.paiement = (parent.paiement or Decimal("0")) + (ligne.paiement or Decimal("0"))
-                    parent.reste_a_payer = (parent.reste_a_payer or Decimal("0")) + (ligne.reste_a_payer or Decimal("0"))
-
-    # Recalculer les taux d'exécution pour les parents
-    for ligne in lignes:
-        if ligne.niveau < 3 and ligne.previsions_definitives and ligne.previsions_definitives > 0:
-            ligne.taux_execution = (ligne.mandat_admis / ligne.previsions_definitives * 100) if ligne.mandat_admis else None
+                    parent.budget_primitif += ligne.budget_primitif
+                    parent.budget_additionnel += ligne.budget_additionnel
+                    parent.modifications += ligne.modifications
+                    parent.previsions_definitives += ligne.previsions_definitives
+                    parent.engagement += ligne.engagement
+                    parent.mandat_admis += ligne.mandat_admis
+                    parent.paiement += ligne.paiement
+                    parent.reste_a_payer += ligne.reste_a_payer
 
     return lignes
 
@@ -120,11 +128,9 @@ def _get_commune_and_exercice(
     db: Session,
     commune_id: int,
     exercice_annee: int
-) -> tuple[Commune, Exercice]:
+) -> tuple[CommuneRef, ExerciceRef]:
     """Helper to get commune and exercice, raising 404 if not found."""
-    commune = db.query(Commune).options(
-        joinedload(Commune.region).joinedload(Region.province)
-    ).filter(Commune.id == commune_id).first()
+    commune = reference_cache.get_commune(db, commune_id)
 
     if not commune:
         raise HTTPException(
@@ -132,9 +138,7 @@ def _get_commune_and_exercice(
             detail="Commune non trouvée"
         )
 
-    exercice = db.query(Exercice).filter(
-        Exercice.annee == exercice_annee
-    ).first()
+    exercice = reference_cache.get_exercice_by_annee(db, exercice_annee)
 
     if not exercice:
         raise HTTPException(
@@ -145,6 +149,49 @@ def _get_commune_and_exercice(
     return commune, exercice
 
 
+# Colonnes financières lues pour les tableaux
+_COLONNES_RECETTES = (
+    "budget_primitif",
+    "budget_additionnel",
+    "modifications",
+    "previsions_definitives",
+    "or_admis",
+    "recouvrement",
+    "reste_a_recouvrer",
+)
+
+_COLONNES_DEPENSES = (
+    "budget_primitif",
+    "budget_additionnel",
+    "modifications",
+    "previsions_definitives",
+    "engagement",
+    "mandat_admis",
+    "paiement",
+    "reste_a_payer",
+)
+
+
+def _load_montants(
+    db: Session,
+    model: Union[type[DonneesRecettes], type[DonneesDepenses]],
+    colonnes: tuple[str, ...],
+    commune_id: int,
+    exercice_id: int,
+) -> dict[str, Row]:
+    """
+    Charge en une requête les montants d'une commune/exercice, indexés par compte.
+    Projection de colonnes : des tuples légers, sans instance ORM ni identity map.
+    """
+    rows = db.execute(
+        select(model.compte_code, *(getattr(model, c) for c in colonnes)).where(
+            model.commune_id == commune_id,
+            model.exercice_id == exercice_id,
+        )
+    ).all()
+    return {row.compte_code: row for row in rows}
+
+
 def _build_recettes_sections(
     db: Session,
     commune_id: int,
@@ -152,51 +199,43 @@ def _build_recettes_sections(
 ) -> list[SectionTableauRecettes]:
     """Build receipts sections with data."""
     sections = []
+    montants = _load_montants(db, DonneesRecettes, _COLONNES_RECETTES, commune_id, exercice_id)
 
     for section_type in [SectionBudgetaire.FONCTIONNEMENT, SectionBudgetaire.INVESTISSEMENT]:
         # Get plan comptable entries for this section (receipts)
-        comptes = db.query(PlanComptable).filter(
-            PlanComptable.type_mouvement == TypeMouvement.RECETTE,
-            PlanComptable.section == section_type,
-            PlanComptable.actif == True
-        ).order_by(PlanComptable.ordre_affichage, PlanComptable.code).all()
+        comptes = reference_cache.get_comptes(db, TypeMouvement.RECETTE, section_type)
 
         lignes = []
         totals = {
-            'budget_primitif': Decimal("0.00"),
-            'budget_additionnel': Decimal("0.00"),
-            'modifications': Decimal("0.00"),
-            'previsions_definitives': Decimal("0.00"),
-            'or_admis': Decimal("0.00"),
-            'recouvrement': Decimal("0.00"),
-            'reste_a_recouvrer': Decimal("0.00"),
+            'budget_primitif': 0,
+            'budget_additionnel': 0,
+            'modifications': 0,
+            'previsions_definitives': 0,
+            'or_admis': 0,
+            'recouvrement': 0,
+            'reste_a_recouvrer': 0,
         }
 
         for compte in comptes:
             # Get data for this compte
-            donnee = db.query(DonneesRecettes).filter(
-                DonneesRecettes.commune_id == commune_id,
-                DonneesRecettes.exercice_id == exercice_id,
-                DonneesRecettes.compte_code == compte.code
-            ).first()
+            donnee = montants.get(compte.code)
 
             if donnee:
-                prev_def = donnee.previsions_definitives or donnee.previsions_calculees
-                taux = (donnee.or_admis / prev_def * 100) if prev_def > 0 else None
-
+                prev_def = donnee.previsions_definitives or (
+                    donnee.budget_primitif + donnee.budget_additionnel + donnee.modifications
+                )
                 ligne = LigneRecettes(
                     code=compte.code,
                     intitule=compte.intitule,
                     niveau=compte.niveau,
                     est_sommable=compte.est_sommable,
-                    budget_primitif=donnee.budget_primitif,
-                    budget_additionnel=donnee.budget_additionnel,
-                    modifications=donnee.modifications,
-                    previsions_definitives=prev_def,
-                    or_admis=donnee.or_admis,
-                    recouvrement=donnee.recouvrement,
-                    reste_a_recouvrer=donnee.reste_a_recouvrer,
-                    taux_execution=taux
+                    budget_primitif=en_centimes(donnee.budget_primitif),
+                    budget_additionnel=en_centimes(donnee.budget_additionnel),
+                    modifications=en_centimes(donnee.modifications),
+                    previsions_definitives=en_centimes(prev_def),
+                    or_admis=en_centimes(donnee.or_admis),
+                    recouvrement=en_centimes(donnee.recouvrement),
+                    reste_a_recouvrer=en_centimes(donnee.reste_a_recouvrer)
                 )
                 lignes.append(ligne)
             else:
@@ -215,18 +254,13 @@ def _build_recettes_sections(
         # Calculer les totaux à partir des lignes de niveau 1 (après agrégation)
         for ligne in lignes:
             if ligne.niveau == 1 and ligne.est_sommable:
-                totals['budget_primitif'] += ligne.budget_primitif or Decimal("0")
-                totals['budget_additionnel'] += ligne.budget_additionnel or Decimal("0")
-                totals['modifications'] += ligne.modifications or Decimal("0")
-                totals['previsions_definitives'] += ligne.previsions_definitives or Decimal("0")
-                totals['or_admis'] += ligne.or_admis or Decimal("0")
-                totals['recouvrement'] += ligne.recouvrement or Decimal("0")
-                totals['reste_a_recouvrer'] += ligne.reste_a_recouvrer or Decimal("0")
-
-        # Calculate global execution rate
-        taux_global = None
-        if totals['previsions_definitives'] > 0:
-            taux_global = totals['or_admis'] / totals['previsions_definitives'] * 100
+                totals['budget_primitif'] += ligne.budget_primitif
+                totals['budget_additionnel'] += ligne.budget_additionnel
+                totals['modifications'] += ligne.modifications
+                totals['previsions_definitives'] += ligne.previsions_definitives
+                totals['or_admis'] += ligne.or_admis
+                totals['recouvrement'] += ligne.recouvrement
+                totals['reste_a_recouvrer'] += ligne.reste_a_recouvrer
 
         titre = "SECTION DE FONCTIONNEMENT" if section_type == SectionBudgetaire.FONCTIONNEMENT else "SECTION D'INVESTISSEMENT"
 
@@ -240,8 +274,7 @@ def _build_recettes_sections(
             total_previsions_definitives=totals['previsions_definitives'],
             total_or_admis=totals['or_admis'],
             total_recouvrement=totals['recouvrement'],
-            total_reste_a_recouvrer=totals['reste_a_recouvrer'],
-            taux_execution_global=taux_global
+            total_reste_a_recouvrer=totals['reste_a_recouvrer']
         ))
 
     return sections
@@ -254,53 +287,45 @@ def _build_depenses_sections(
 ) -> list[SectionTableauDepenses]:
     """Build expenses sections with data."""
     sections = []
+    montants = _load_montants(db, DonneesDepenses, _COLONNES_DEPENSES, commune_id, exercice_id)
 
     for section_type in [SectionBudgetaire.FONCTIONNEMENT, SectionBudgetaire.INVESTISSEMENT]:
         # Get plan comptable entries for this section (expenses)
-        comptes = db.query(PlanComptable).filter(
-            PlanComptable.type_mouvement == TypeMouvement.DEPENSE,
-            PlanComptable.section == section_type,
-            PlanComptable.actif == True
-        ).order_by(PlanComptable.ordre_affichage, PlanComptable.code).all()
+        comptes = reference_cache.get_comptes(db, TypeMouvement.DEPENSE, section_type)
 
         lignes = []
         totals = {
-            'budget_primitif': Decimal("0.00"),
-            'budget_additionnel': Decimal("0.00"),
-            'modifications': Decimal("0.00"),
-            'previsions_definitives': Decimal("0.00"),
-            'engagement': Decimal("0.00"),
-            'mandat_admis': Decimal("0.00"),
-            'paiement': Decimal("0.00"),
-            'reste_a_payer': Decimal("0.00"),
+            'budget_primitif': 0,
+            'budget_additionnel': 0,
+            'modifications': 0,
+            'previsions_definitives': 0,
+            'engagement': 0,
+            'mandat_admis': 0,
+            'paiement': 0,
+            'reste_a_payer': 0,
         }
 
         for compte in comptes:
             # Get data for this compte
-            donnee = db.query(DonneesDepenses).filter(
-                DonneesDepenses.commune_id == commune_id,
-                DonneesDepenses.exercice_id == exercice_id,
-                DonneesDepenses.compte_code == compte.code
-            ).first()
+            donnee = montants.get(compte.code)
 
             if donnee:
-                prev_def = donnee.previsions_definitives or donnee.previsions_calculees
-                taux = (donnee.mandat_admis / prev_def * 100) if prev_def > 0 else None
-
+                prev_def = donnee.previsions_definitives or (
+                    donnee.budget_primitif + donnee.budget_additionnel + donnee.modifications
+                )
                 ligne = LigneDepenses(
                     code=compte.code,
                     intitule=compte.intitule,
                     niveau=compte.niveau,
                     est_sommable=compte.est_sommable,
-                    budget_primitif=donnee.budget_primitif,
-                    budget_additionnel=donnee.budget_additionnel,
-                    modifications=donnee.modifications,
-                    previsions_definitives=prev_def,
-                    engagement=donnee.engagement,
-                    mandat_admis=donnee.mandat_admis,
-                    paiement=donnee.paiement,
-                    reste_a_payer=donnee.reste_a_payer,
-                    taux_execution=taux
+                    budget_primitif=en_centimes(donnee.budget_primitif),
+                    budget_additionnel=en_centimes(donnee.budget_additionnel),
+                    modifications=en_centimes(donnee.modifications),
+                    previsions_definitives=en_centimes(prev_def),
+                    engagement=en_centimes(donnee.engagement),
+                    mandat_admis=en_centimes(donnee.mandat_admis),
+                    paiement=en_centimes(donnee.paiement),
+                    reste_a_payer=en_centimes(donnee.reste_a_payer)
                 )
                 lignes.append(ligne)
             else:
@@ -319,19 +344,14 @@ def _build_depenses_sections(
         # Calculer les totaux à partir des lignes de niveau 1 (après agrégation)
         for ligne in lignes:
             if ligne.niveau == 1 and ligne.est_sommable:
-                totals['budget_primitif'] += ligne.budget_primitif or Decimal("0")
-                totals['budget_additionnel'] += ligne.budget_additionnel or Decimal("0")
-                totals['modifications'] += ligne.modifications or Decimal("0")
-                totals['previsions_definitives'] += ligne.previsions_definitives or Decimal("0")
-                totals['engagement'] += ligne.engagement or Decimal("0")
-                totals['mandat_admis'] += ligne.mandat_admis or Decimal("0")
-                totals['paiement'] += ligne.paiement or Decimal("0")
-                totals['reste_a_payer'] += ligne.reste_a_payer or Decimal("0")
-
-        # Calculate global execution rate
-        taux_global = None
-        if totals['previsions_definitives'] > 0:
-            taux_global = totals['mandat_admis'] / totals['previsions_definitives'] * 100
+                totals['budget_primitif'] += ligne.budget_primitif
+                totals['budget_additionnel'] += ligne.budget_additionnel
+                totals['modifications'] += ligne.modifications
+                totals['previsions_definitives'] += ligne.previsions_definitives
+                totals['engagement'] += ligne.engagement
+                totals['mandat_admis'] += ligne.mandat_admis
+                totals['paiement'] += ligne.paiement
+                totals['reste_a_payer'] += ligne.reste_a_payer
 
         titre = "SECTION DE FONCTIONNEMENT" if section_type == SectionBudgetaire.FONCTIONNEMENT else "SECTION D'INVESTISSEMENT"
 
@@ -346,13 +366,177 @@ def _build_depenses_sections(
             total_engagement=totals['engagement'],
             total_mandat_admis=totals['mandat_admis'],
             total_paiement=totals['paiement'],
-            total_reste_a_payer=totals['reste_a_payer'],
-            taux_execution_global=taux_global
+            total_reste_a_payer=totals['reste_a_payer']
         ))
 
     return sections
 
 
+# Sections du tableau d'équilibre : (section, libellé de ligne, préfixe des champs)
+_SECTIONS_EQUILIBRE = (
+    (SectionBudgetaire.FONCTIONNEMENT, "Section de fonctionnement", "fonctionnement"),
+    (SectionBudgetaire.INVESTISSEMENT, "Section d'investissement", "investissement"),
+)
+
+
+def _ligne_equilibre(
+    libelle: str,
+    section: Optional[SectionBudgetaire],
+    r_prev: int,
+    r_real: int,
+    d_prev: int,
+    d_real: int,
+) -> LigneEquilibre:
+    """Ligne du tableau d'équilibre, soldes compris."""
+    return LigneEquilibre(
+        libelle=libelle,
+        section=section,
+        recettes_previsions=r_prev,
+        recettes_realisations=r_real,
+        depenses_previsions=d_prev,
+        depenses_realisations=d_real,
+        solde_previsions=r_prev - d_prev,
+        solde_realisations=r_real - d_real,
+    )
+
+
+def _champs_equilibre(prefixe: str, r_prev: int, r_real: int, d_prev: int, d_real: int) -> dict:
+    """Champs `<prefixe>_*` de TableauEquilibre, soldes compris."""
+    return {
+        f"{prefixe}_recettes_prev": r_prev,
+        f"{prefixe}_recettes_real": r_real,
+        f"{prefixe}_depenses_prev": d_prev,
+        f"{prefixe}_depenses_real": d_real,
+        f"{prefixe}_solde_prev": r_prev - d_prev,
+        f"{prefixe}_solde_real": r_real - d_real,
+    }
+
+
+def _build_equilibre(
+    commune_id: int,
+    commune_nom: str,
+    exercice_annee: int,
+    recettes_sections: list[SectionTableauRecettes],
+    depenses_sections: list[SectionTableauDepenses],
+) -> TableauEquilibre:
+    """
+    Tableau d'équilibre à partir des totaux de section déjà calculés.
+    Montants en centimes entiers : les totaux généraux sont la somme exacte
+    des deux sections.
+    """
+    lignes = []
+    champs = {}
+    totaux = (0, 0, 0, 0)
+
+    for i, (section, libelle, prefixe) in enumerate(_SECTIONS_EQUILIBRE):
+        recettes = recettes_sections[i] if len(recettes_sections) > i else None
+        depenses = depenses_sections[i] if len(depenses_sections) > i else None
+        montants = (
+            recettes.total_previsions_definitives if recettes else 0,
+            recettes.total_or_admis if recettes else 0,
+            depenses.total_previsions_definitives if depenses else 0,
+            depenses.total_mandat_admis if depenses else 0,
+        )
+        totaux = tuple(t + m for t, m in zip(totaux, montants))
+        lignes.append(_ligne_equilibre(libelle, section, *montants))
+        champs.update(_champs_equilibre(prefixe, *montants))
+
+    lignes.append(_ligne_equilibre("TOTAL GÉNÉRAL", None, *totaux))
+    champs.update(_champs_equilibre("total", *totaux))
+
+    return TableauEquilibre(
+        commune_id=commune_id,
+        commune_nom=commune_nom,
+        exercice_annee=exercice_annee,
+        lignes=lignes,
+        **champs,
+    )
+
+
+def _tableau_recettes(db: Session, commune_id: int, exercice_annee: int) -> TableauRecettes:
+    """Receipts table of a commune/year (both sections and grand totals)."""
+    commune, exercice = _get_commune_and_exercice(db, commune_id, exercice_annee)
+
+    sections = _build_recettes_sections(db, commune_id, exercice.id)
+
+    total_prev = sum(s.total_previsions_definitives for s in sections)
+    total_or = sum(s.total_or_admis for s in sections)
+    total_recouv = sum(s.total_recouvrement for s in sections)
+
+    return TableauRecettes(
+        commune_id=commune_id,
+        commune_nom=commune.nom,
+        exercice_annee=exercice_annee,
+        sections=sections,
+        total_general_previsions=total_prev,
+        total_general_or_admis=total_or,
+        total_general_recouvrement=total_recouv
+    )
+
+
+def _tableau_depenses(db: Session, commune_id: int, exercice_annee: int) -> TableauDepenses:
+    """Expenses table of a commune/year (both sections and grand totals)."""
+    commune, exercice = _get_commune_and_exercice(db, commune_id, exercice_annee)
+
+    sections = _build_depenses_sections(db, commune_id, exercice.id)
+
+    total_prev = sum(s.total_previsions_definitives for s in sections)
+    total_mandat = sum(s.total_mandat_admis for s in sections)
+    total_paiement = sum(s.total_paiement for s in sections)
+
+    return TableauDepenses(
+        commune_id=commune_id,
+        commune_nom=commune.nom,
+        exercice_annee=exercice_annee,
+        sections=sections,
+        total_general_previsions=total_prev,
+        total_general_mandat_admis=total_mandat,
+        total_general_paiement=total_paiement
+    )
+
+
+def _en_colonnes(
+    tableau: Union[TableauRecettes, TableauDepenses],
+    tableau_cls: Union[type[TableauRecettesColonnes], type[TableauDepensesColonnes]],
+    section_cls: Union[type[SectionRecettesColonnes], type[SectionDepensesColonnes]],
+    colonnes_cls: type[ColonnesTableauBase],
+):
+    """
+    Même tableau, lignes de chaque section transposées en colonnes.
+    Les valeurs sont déjà validées : construction sans re-validation.
+    """
+    return tableau_cls.model_construct(**{
+        **dict(tableau),
+        "sections": [
+            section_cls.model_construct(**{
+                **dict(section),
+                "lignes": colonnes_cls.from_lignes(section.lignes),
+            })
+            for section in tableau.sections
+        ],
+    })
+
+
+def _flux_tableau(
+    tableau: Union[TableauRecettes, TableauDepenses],
+    tableau_adapter: TypeAdapter,
+    section_adapter: TypeAdapter,
+    ligne_adapter: TypeAdapter,
+) -> Iterator[bytes]:
+    """
+    Sérialise un tableau section par section, en morceaux successifs.
+    Le document complet n'est jamais assemblé en mémoire : chaque section est
+    émise dès que ses lignes sont sérialisées. Même contenu JSON que
+    tableau_adapter.dump_json(tableau), clé "sections" en tête.
+    """
+    yield b'{"sections":['
+    for i, section in enumerate(tableau.sections):
+        lignes = b",".join(ligne_adapter.dump_json(ligne) for ligne in section.lignes)
+        entete = section_adapter.dump_json(section, exclude={"lignes"})
+        yield (b"," if i else b"") + b'{"lignes":[' + lignes + b"]," + entete[1:]
+    yield b"]," + tableau_adapter.dump_json(tableau, exclude={"sections"})[1:]
+
+
 # =====================
 # Main Endpoints
 # =====================
@@ -390,7 +574,6 @@ async def get_tableau_complet(
     total_depenses_paiement = sum(s.total_paiement for s in depenses_sections)
 
     # Build recettes table
-    taux_recettes = (total_recettes_or / total_recettes_prev * 100) if total_recettes_prev > 0 else None
     tableau_recettes = TableauRecettes(
         commune_id=commune_id,
         commune_nom=commune.nom,
@@ -398,12 +581,10 @@ async def get_tableau_complet(
         sections=recettes_sections,
         total_general_previsions=total_recettes_prev,
         total_general_or_admis=total_recettes_or,
-        total_general_recouvrement=total_recettes_recouv,
-        taux_execution_global=taux_recettes
+        total_general_recouvrement=total_recettes_recouv
     )
 
     # Build depenses table
-    taux_depenses = (total_depenses_mandat / total_depenses_prev * 100) if total_depenses_prev > 0 else None
     tableau_depenses = TableauDepenses(
         commune_id=commune_id,
         commune_nom=commune.nom,
@@ -411,86 +592,16 @@ async def get_tableau_complet(
         sections=depenses_sections,
         total_general_previsions=total_depenses_prev,
         total_general_mandat_admis=total_depenses_mandat,
-        total_general_paiement=total_depenses_paiement,
-        taux_execution_global=taux_depenses
+        total_general_paiement=total_depenses_paiement
     )
 
     # Build equilibre table
-    fonct_recettes = recettes_sections[0] if recettes_sections else None
-    fonct_depenses = depenses_sections[0] if depenses_sections else None
-    invest_recettes = recettes_sections[1] if len(recettes_sections) > 1 else None
-    invest_depenses = depenses_sections[1] if len(depenses_sections) > 1 else None
-
-    fonct_r_prev = fonct_recettes.total_previsions_definitives if fonct_recettes else Decimal("0.00")
-    fonct_r_real = fonct_recettes.total_or_admis if fonct_recettes else Decimal("0.00")
-    fonct_d_prev = fonct_depenses.total_previsions_definitives if fonct_depenses else Decimal("0.00")
-    fonct_d_real = fonct_depenses.total_mandat_admis if fonct_depenses else Decimal("0.00")
-
-    invest_r_prev = invest_recettes.total_previsions_definitives if invest_recettes else Decimal("0.00")
-    invest_r_real = invest_recettes.total_or_admis if invest_recettes else Decimal("0.00")
-    invest_d_prev = invest_depenses.total_previsions_definitives if invest_depenses else Decimal("0.00")
-    invest_d_real = invest_depenses.total_mandat_admis if invest_depenses else Decimal("0.00")
-
-    lignes_equilibre = [
-        LigneEquilibre(
-            libelle="Section de fonctionnement",
-            section=SectionBudgetaire.FONCTIONNEMENT,
-            recettes_previsions=fonct_r_prev,
-            recettes_realisations=fonct_r_real,
-            depenses_previsions=fonct_d_prev,
-            depenses_realisations=fonct_d_real,
-            solde_previsions=fonct_r_prev - fonct_d_prev,
-            solde_realisations=fonct_r_real - fonct_d_real,
-        ),
-        LigneEquilibre(
-            libelle="Section d'investissement",
-            section=SectionBudgetaire.INVESTISSEMENT,
-            recettes_previsions=invest_r_prev,
-            recettes_realisations=invest_r_real,
-            depenses_previsions=invest_d_prev,
-            depenses_realisations=invest_d_real,
-            solde_previsions=invest_r_prev - invest_d_prev,
-            solde_realisations=invest_r_real - invest_d_real,
-        ),
-        LigneEquilibre(
-            libelle="TOTAL GÉNÉRAL",
-            section=None,
-            recettes_previsions=total_recettes_prev,
-            recettes_realisations=total_recettes_or,
-            depenses_previsions=total_depenses_prev,
-            depenses_realisations=total_depenses_mandat,
-            solde_previsions=total_recettes_prev - total_depenses_prev,
-            solde_realisations=total_recettes_or - total_depenses_mandat,
-        ),
-    ]
-
-    tableau_equilibre = TableauEquilibre(
-        commune_id=commune_id,
-        commune_nom=commune.nom,
-        exercice_annee=exercice_annee,
-        lignes=lignes_equilibre,
-        fonctionnement_recettes_prev=fonct_r_prev,
-        fonctionnement_recettes_real=fonct_r_real,
-        fonctionnement_depenses_prev=fonct_d_prev,
-        fonctionnement_depenses_real=fonct_d_real,
-        fonctionnement_solde_prev=fonct_r_prev - fonct_d_prev,
-        fonctionnement_solde_real=fonct_r_real - fonct_d_real,
-        investissement_recettes_prev=invest_r_prev,
-        investissement_recettes_real=invest_r_real,
-        investissement_depenses_prev=invest_d_prev,
-        investissement_depenses_real=invest_d_real,
-        investissement_solde_prev=invest_r_prev - invest_d_prev,
-        investissement_solde_real=invest_r_real - invest_d_real,
-        total_recettes_prev=total_recettes_prev,
-        total_recettes_real=total_recettes_or,
-        total_depenses_prev=total_depenses_prev,
-        total_depenses_real=total_depenses_mandat,
-        total_solde_prev=total_recettes_prev - total_depenses_prev,
-        total_solde_real=total_recettes_or - total_depenses_mandat,
+    tableau_equilibre = _build_equilibre(
+        commune_id, commune.nom, exercice_annee, recettes_sections, depenses_sections
     )
 
     from datetime import datetime
-    return TableauComplet(
+    tableau = TableauComplet(
         commune_id=commune_id,
         commune_nom=commune.nom,
         commune_code=commune.code,
@@ -506,6 +617,11 @@ async def get_tableau_complet(
         validee=False  # TODO: check if all data is validated
     )
 
+    return Response(
+        content=_COMPLET_ADAPTER.dump_json(tableau),
+        media_type="application/json",
+    )
+
 
 @router.get(
     "/recettes",
@@ -520,25 +636,46 @@ async def get_tableau_recettes(
 ):
     """
     Get only the receipts table.
+
+    The JSON is streamed section by section rather than built in one piece.
     """
-    commune, exercice = _get_commune_and_exercice(db, commune_id, exercice_annee)
+    tableau = _tableau_recettes(db, commune_id, exercice_annee)
+    return StreamingResponse(
+        _flux_tableau(
+            tableau, _RECETTES_ADAPTER, _SECTION_RECETTES_ADAPTER, _LIGNE_RECETTES_ADAPTER
+        ),
+        media_type="application/json",
+    )
 
-    sections = _build_recettes_sections(db, commune_id, exercice.id)
 
-    total_prev = sum(s.total_previsions_definitives for s in sections)
-    total_or = sum(s.total_or_admis for s in sections)
-    total_recouv = sum(s.total_recouvrement for s in sections)
-    taux = (total_or / total_prev * 100) if total_prev > 0 else None
+@router.get(
+    "/recettes/colonnes",
+    response_model=TableauRecettesColonnes,
+    summary="Tableau des recettes en colonnes",
+    description="Retourne le tableau des recettes, lignes de chaque section présentées par colonne."
+)
+async def get_tableau_recettes_colonnes(
+    commune_id: int = Query(..., description="ID de la commune"),
+    exercice_annee: int = Query(..., description="Année de l'exercice"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get the receipts table with a columnar row layout.
 
-    return TableauRecettes(
-        commune_id=commune_id,
-        commune_nom=commune.nom,
-        exercice_annee=exercice_annee,
-        sections=sections,
-        total_general_previsions=total_prev,
-        total_general_or_admis=total_or,
-        total_general_recouvrement=total_recouv,
-        taux_execution_global=taux
+    Same content as /recettes, but each section's `lignes` is one object
+    holding a list per field (code, intitule, budget_primitif...), the
+    rows being at the same index in every list.
+    """
+    tableau = _en_colonnes(
+        _tableau_recettes(db, commune_id, exercice_annee),
+        TableauRecettesColonnes,
+        SectionRecettesColonnes,
+        ColonnesRecettes,
+    )
+
+    return Response(
+        content=_RECETTES_COLONNES_ADAPTER.dump_json(tableau),
+        media_type="application/json",
     )
 
 
@@ -555,25 +692,44 @@ async def get_tableau_depenses(
 ):
     """
     Get only the expenses table.
+
+    The JSON is streamed section by section rather than built in one piece.
     """
-    commune, exercice = _get_commune_and_exercice(db, commune_id, exercice_annee)
+    tableau = _tableau_depenses(db, commune_id, exercice_annee)
+    return StreamingResponse(
+        _flux_tableau(
+            tableau, _DEPENSES_ADAPTER, _SECTION_DEPENSES_ADAPTER, _LIGNE_DEPENSES_ADAPTER
+        ),
+        media_type="application/json",
+    )
 
-    sections = _build_depenses_sections(db, commune_id, exercice.id)
 
-    total_prev = sum(s.total_previsions_definitives for s in sections)
-    total_mandat = sum(s.total_mandat_admis for s in sections)
-    total_paiement = sum(s.total_paiement for s in sections)
-    taux = (total_mandat / total_prev * 100) if total_prev > 0 else None
+@router.get(
+    "/depenses/colonnes",
+    response_model=TableauDepensesColonnes,
+    summary="Tableau des dépenses en colonnes",
+    description="Retourne le tableau des dépenses, lignes de chaque section présentées par colonne."
+)
+async def get_tableau_depenses_colonnes(
+    commune_id: int = Query(..., description="ID de la commune"),
+    exercice_annee: int = Query(..., description="Année de l'exercice"),
+    db: Session = Depends(get_db),
+):
+    """
+    Get the expenses table with a columnar row layout.
 
-    return TableauDepenses(
-        commune_id=commune_id,
-        commune_nom=commune.nom,
-        exercice_annee=exercice_annee,
-        sections=sections,
-        total_general_previsions=total_prev,
-        total_general_mandat_admis=total_mandat,
-        total_general_paiement=total_paiement,
-        taux_execution_global=taux
+    Same content as /depenses, with each section's `lignes` by column.
+    """
+    tableau = _en_colonnes(
+        _tableau_depenses(db, commune_id, exercice_annee),
+        TableauDepensesColonnes,
+        SectionDepensesColonnes,
+        ColonnesDepenses,
+    )
+
+    return Response(
+        content=_DEPENSES_COLONNES_ADAPTER.dump_json(tableau),
+        media_type="application/json",
     )
 
 
@@ -596,83 +752,13 @@ async def get_tableau_equilibre(
     recettes_sections = _build_recettes_sections(db, commune_id, exercice.id)
     depenses_sections = _build_depenses_sections(db, commune_id, exercice.id)
 
-    # Get section totals
-    fonct_recettes = recettes_sections[0] if recettes_sections else None
-    fonct_depenses = depenses_sections[0] if depenses_sections else None
-    invest_recettes = recettes_sections[1] if len(recettes_sections) > 1 else None
-    invest_depenses = depenses_sections[1] if len(depenses_sections) > 1 else None
-
-    fonct_r_prev = fonct_recettes.total_previsions_definitives if fonct_recettes else Decimal("0.00")
-    fonct_r_real = fonct_recettes.total_or_admis if fonct_recettes else Decimal("0.00")
-    fonct_d_prev = fonct_depenses.total_previsions_definitives if fonct_depenses else Decimal("0.00")
-    fonct_d_real = fonct_depenses.total_mandat_admis if fonct_depenses else Decimal("0.00")
-
-    invest_r_prev = invest_recettes.total_previsions_definitives if invest_recettes else Decimal("0.00")
-    invest_r_real = invest_recettes.total_or_admis if invest_recettes else Decimal("0.00")
-    invest_d_prev = invest_depenses.total_previsions_definitives if invest_depenses else Decimal("0.00")
-    invest_d_real = invest_depenses.total_mandat_admis if invest_depenses else Decimal("0.00")
-
-    total_r_prev = fonct_r_prev + invest_r_prev
-    total_r_real = fonct_r_real + invest_r_real
-    total_d_prev = fonct_d_prev + invest_d_prev
-    total_d_real = fonct_d_real + invest_d_real
-
-    lignes = [
-        LigneEquilibre(
-            libelle="Section de fonctionnement",
-            section=SectionBudgetaire.FONCTIONNEMENT,
-            recettes_previsions=fonct_r_prev,
-            recettes_realisations=fonct_r_real,
-            depenses_previsions=fonct_d_prev,
-            depenses_realisations=fonct_d_real,
-            solde_previsions=fonct_r_prev - fonct_d_prev,
-            solde_realisations=fonct_r_real - fonct_d_real,
-        ),
-        LigneEquilibre(
-            libelle="Section d'investissement",
-            section=SectionBudgetaire.INVESTISSEMENT,
-            recettes_previsions=invest_r_prev,
-            recettes_realisations=invest_r_real,
-            depenses_previsions=invest_d_prev,
-            depenses_realisations=invest_d_real,
-            solde_previsions=invest_r_prev - invest_d_prev,
-            solde_realisations=invest_r_real - invest_d_real,
-        ),
-        LigneEquilibre(
-            libelle="TOTAL GÉNÉRAL",
-            section=None,
-            recettes_previsions=total_r_prev,
-            recettes_realisations=total_r_real,
-            depenses_previsions=total_d_prev,
-            depenses_realisations=total_d_real,
-            solde_previsions=total_r_prev - total_d_prev,
-            solde_realisations=total_r_real - total_d_real,
-        ),
-    ]
+    tableau = _build_equilibre(
+        commune_id, commune.nom, exercice_annee, recettes_sections, depenses_sections
+    )
 
-    return TableauEquilibre(
-        commune_id=commune_id,
-        commune_nom=commune.nom,
-        exercice_annee=exercice_annee,
-        lignes=lignes,
-        fonctionnement_recettes_prev=fonct_r_prev,
-        fonctionnement_recettes_real=fonct_r_real,
-        fonctionnement_depenses_prev=fonct_d_prev,
-        fonctionnement_depenses_real=fonct_d_real,
-        fonctionnement_solde_prev=fonct_r_prev - fonct_d_prev,
-        fonctionnement_solde_real=fonct_r_real - fonct_d_real,
-        investissement_recettes_prev=invest_r_prev,
-        investissement_recettes_real=invest_r_real,
-        investissement_depenses_prev=invest_d_prev,
-        investissement_depenses_real=invest_d_real,
-        investissement_solde_prev=invest_r_prev - invest_d_prev,
-        investissement_solde_real=invest_r_real - invest_d_real,
-        total_recettes_prev=total_r_prev,
-        total_recettes_real=total_r_real,
-        total_depenses_prev=total_d_prev,
-        total_depenses_real=total_d_real,
-        total_solde_prev=total_r_prev - total_d_prev,
-        total_solde_real=total_r_real - total_d_real,
+    return Response(
+        content=_EQUILIBRE_ADAPTER.dump_json(tableau),
+        media_type="application/json",
     )
 
 
@@ -714,24 +800,17 @@ async def get_resume_financier(
         DonneesDepenses.exercice_id == exercice.id
     ).first()
 
-    recettes_prev = recettes_totals.prevues or Decimal("0.00")
-    recettes_real = recettes_totals.realisees or Decimal("0.00")
-    depenses_prev = depenses_totals.prevues or Decimal("0.00")
-    depenses_real = depenses_totals.realisees or Decimal("0.00")
-
-    taux_recettes = (recettes_real / recettes_prev * 100) if recettes_prev > 0 else None
-    taux_depenses = (depenses_real / depenses_prev * 100) if depenses_prev > 0 else None
+    recettes_real = en_centimes(recettes_totals.realisees)
+    depenses_real = en_centimes(depenses_totals.realisees)
 
     return ResumeFinancier(
         commune_id=commune_id,
         exercice_annee=exercice_annee,
-        total_recettes_prevues=recettes_prev,
+        total_recettes_prevues=en_centimes(recettes_totals.prevues),
         total_recettes_realisees=recettes_real,
-        total_depenses_prevues=depenses_prev,
+        total_depenses_prevues=en_centimes(depenses_totals.prevues),
         total_depenses_realisees=depenses_real,
         solde_budgetaire=recettes_real - depenses_real,
-        taux_execution_recettes=taux_recettes,
-        taux_execution_depenses=taux_depenses
     )
 
 
@@ -750,15 +829,15 @@ async def get_comparaison_exercices(
     """
     Compare financial data between two fiscal years.
     """
-    commune = db.query(Commune).filter(Commune.id == commune_id).first()
+    commune = reference_cache.get_commune(db, commune_id)
     if not commune:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Commune non trouvée"
         )
 
-    exercice_1 = db.query(Exercice).filter(Exercice.annee == annee_1).first()
-    exercice_2 = db.query(Exercice).filter(Exercice.annee == annee_2).first()
+    exercice_1 = reference_cache.get_exercice_by_annee(db, annee_1)
+    exercice_2 = reference_cache.get_exercice_by_annee(db, annee_2)
 
     if not exercice_1 or not exercice_2:
         raise HTTPException(
@@ -766,32 +845,26 @@ async def get_comparaison_exercices(
             detail="Un ou plusieurs exercices non trouvés"
         )
 
-    def get_totals(exercice_id: int):
+    def get_totals(exercice_id: int) -> tuple[int, int]:
         recettes = db.query(
             func.sum(DonneesRecettes.or_admis)
         ).filter(
             DonneesRecettes.commune_id == commune_id,
             DonneesRecettes.exercice_id == exercice_id
-        ).scalar() or Decimal("0.00")
+        ).scalar()
 
         depenses = db.query(
             func.sum(DonneesDepenses.mandat_admis)
         ).filter(
             DonneesDepenses.commune_id == commune_id,
             DonneesDepenses.exercice_id == exercice_id
-        ).scalar() or Decimal("0.00")
+        ).scalar()
 
-        return recettes, depenses
+        return en_centimes(recettes), en_centimes(depenses)
 
     recettes_1, depenses_1 = get_totals(exercice_1.id)
     recettes_2, depenses_2 = get_totals(exercice_2.id)
 
-    var_recettes = recettes_2 - recettes_1
-    var_depenses = depenses_2 - depenses_1
-
-    var_recettes_pct = (var_recettes / recettes_1 * 100) if recettes_1 > 0 else None
-    var_depenses_pct = (var_depenses / depenses_1 * 100) if depenses_1 > 0 else None
-
     return ComparaisonExercices(
         commune_id=commune_id,
         commune_nom=commune.nom,
@@ -799,12 +872,8 @@ async def get_comparaison_exercices(
         exercice_annee_2=annee_2,
         recettes_annee_1=recettes_1,
         recettes_annee_2=recettes_2,
-        variation_recettes=var_recettes,
-        variation_recettes_pct=var_recettes_pct,
         depenses_annee_1=depenses_1,
         depenses_annee_2=depenses_2,
-        variation_depenses=var_depenses,
-        variation_depenses_pct=var_depenses_pct
     )
 
 
@@ -822,14 +891,14 @@ async def get_statistiques_region(
     """
     Get aggregated statistics for a region.
     """
-    region = db.query(Region).filter(Region.id == region_id).first()
+    region = reference_cache.get_region(db, region_id)
     if not region:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Région non trouvée"
         )
 
-    exercice = db.query(Exercice).filter(Exercice.annee == exercice_annee).first()
+    exercice = reference_cache.get_exercice_by_annee(db, exercice_annee)
     if not exercice:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -837,7 +906,7 @@ async def get_statistiques_region(
         )
 
     # Get communes in this region
-    communes = db.query(Commune).filter(Commune.region_id == region_id).all()
+    communes = reference_cache.get_communes_region(db, region_id)
     commune_ids = [c.id for c in communes]
 
     if not commune_ids:
@@ -846,50 +915,42 @@ async def get_statistiques_region(
             region_nom=region.nom,
             exercice_annee=exercice_annee,
             nb_communes=0,
-            total_recettes=Decimal("0.00"),
-            total_depenses=Decimal("0.00"),
-            moyenne_recettes_commune=Decimal("0.00"),
-            moyenne_depenses_commune=Decimal("0.00"),
-            taux_execution_moyen=None
         )
 
     # Aggregate recettes
-    total_recettes = db.query(
+    total_recettes = en_centimes(db.query(
         func.sum(DonneesRecettes.or_admis)
     ).filter(
         DonneesRecettes.commune_id.in_(commune_ids),
         DonneesRecettes.exercice_id == exercice.id
-    ).scalar() or Decimal("0.00")
+    ).scalar())
 
     # Aggregate depenses
-    total_depenses = db.query(
+    total_depenses = en_centimes(db.query(
         func.sum(DonneesDepenses.mandat_admis)
     ).filter(
         DonneesDepenses.commune_id.in_(commune_ids),
         DonneesDepenses.exercice_id == exercice.id
-    ).scalar() or Decimal("0.00")
+    ).scalar())
 
     # Aggregate previsions for execution rate
-    total_prev_recettes = db.query(
+    total_prev_recettes = en_centimes(db.query(
         func.sum(DonneesRecettes.previsions_definitives)
     ).filter(
         DonneesRecettes.commune_id.in_(commune_ids),
         DonneesRecettes.exercice_id == exercice.id
-    ).scalar() or Decimal("0.00")
+    ).scalar())
 
-    nb_communes = len(communes)
-    moyenne_recettes = total_recettes / nb_communes if nb_communes > 0 else Decimal("0.00")
-    moyenne_depenses = total_depenses / nb_communes if nb_communes > 0 else Decimal("0.00")
-    taux_execution = (total_recettes / total_prev_recettes * 100) if total_prev_recettes > 0 else None
+    taux_execution = (
+        Decimal(total_recettes) / total_prev_recettes * 100 if total_prev_recettes > 0 else None
+    )
 
     return StatistiquesRegion(
         region_id=region_id,
         region_nom=region.nom,
         exercice_annee=exercice_annee,
-        nb_communes=nb_communes,
+        nb_communes=len(communes),
         total_recettes=total_recettes,
         total_depenses=total_depenses,
-        moyenne_recettes_commune=moyenne_recettes,
-        moyenne_depenses_commune=moyenne_depenses,
         taux_execution_moyen=taux_execution
     )
@@ -3,18 +3,20 @@ Public Tracking API endpoints.
 Track page visits and document downloads.
 """
 
-from datetime import date, datetime
+from datetime import date
 from typing import Optional
 
-from fastapi import APIRouter, Body, Depends, Header, Query, Request, status
+from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, Request, status
+from loguru import logger
 from pydantic import BaseModel, Field
 from sqlalchemy import func
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_db
-from app.models.annexes import StatistiqueVisite
+from app.api.deps import get_db, json_body, json_body_openapi
+from app.database import LogSessionLocal
 from app.models.documents import Document
 from app.schemas.base import Message
+from app.services.visit_buffer import increment_statistiques, visit_buffer
 
 
 class VisitEntry(BaseModel):
@@ -46,6 +48,34 @@ def anonymize_ip(ip: str) -> str:
         return ip
 
 
+def _record_download(
+    document_id: int,
+    commune_id: Optional[int],
+    ip_address: Optional[str],
+    user_agent: Optional[str],
+) -> None:
+    """Enregistre un téléchargement après la réponse, sur le pool de journalisation."""
+    try:
+        with LogSessionLocal() as db:
+            # Incrément atomique du compteur, sans charger le document
+            db.query(Document).filter(Document.id == document_id).update(
+                {Document.nb_telechargements: func.coalesce(Document.nb_telechargements, 0) + 1},
+                synchronize_session=False,
+            )
+            increment_statistiques(db, {
+                (date.today(), f"/documents/{document_id}", commune_id): (0, 1, ip_address, user_agent)
+            })
+            db.commit()
+    except Exception as e:
+        logger.warning(f"Échec de l'enregistrement du téléchargement {document_id} : {e}")
+
+
+def _client_ip(request: Request) -> Optional[str]:
+    """Adresse IP du client, anonymisée."""
+    client_ip = request.client.host if request.client else None
+    return anonymize_ip(client_ip) if client_ip else None
+
+
 @router.post(
     "/visit",
     response_model=Message,
@@ -58,39 +88,14 @@ async def track_visit(
     page: str = Query(..., max_length=255, description="Chemin de la page"),
     commune_id: Optional[int] = Query(None, description="ID de la commune consultée"),
     user_agent: Optional[str] = Header(None),
-    db: Session = Depends(get_db),
 ):
     """
     Track a page visit.
 
     Creates or increments the visit counter for the page/commune/date combination.
+    The visit is buffered in memory and written in batches on the dedicated log pool.
     """
-    today = date.today()
-    client_ip = request.client.host if request.client else None
-    anonymized_ip = anonymize_ip(client_ip) if client_ip else None
-
-    # Check if we already have a record for this page/commune/date
-    existing = db.query(StatistiqueVisite).filter(
-        StatistiqueVisite.date_visite == today,
-        StatistiqueVisite.page == page,
-        StatistiqueVisite.commune_id == commune_id,
-    ).first()
-
-    if existing:
-        existing.nb_visites += 1
-        db.commit()
-    else:
-        visite = StatistiqueVisite(
-            date_visite=today,
-            page=page,
-            commune_id=commune_id,
-            nb_visites=1,
-            nb_telechargements=0,
-            ip_address=anonymized_ip,
-            user_agent=user_agent[:500] if user_agent else None,
-        )
-        db.add(visite)
-        db.commit()
+    visit_buffer.add([(page, commune_id)], _client_ip(request), user_agent)
 
     return Message(message="Visite enregistrée")
 
@@ -101,9 +106,10 @@ async def track_visit(
     summary="Enregistrer un téléchargement",
     description="Enregistre le téléchargement d'un document.",
 )
-async def track_download(
+def track_download(
     request: Request,
     document_id: int,
+    background_tasks: BackgroundTasks,
     user_agent: Optional[str] = Header(None),
     db: Session = Depends(get_db),
 ):
@@ -111,44 +117,18 @@ async def track_download(
     Track a document download.
 
     Increments the download counter on the document and records in statistics.
+    The writes happen after the response is sent, on the dedicated log pool.
     """
-    # Get the document
-    document = db.query(Document).filter(Document.id == document_id).first()
+    document = db.query(Document.id, Document.commune_id).filter(
+        Document.id == document_id
+    ).first()
 
     if not document:
         return Message(message="Document non trouvé")
 
-    # Increment document download counter
-    document.nb_telechargements = (document.nb_telechargements or 0) + 1
-
-    # Record in statistics
-    today = date.today()
-    client_ip = request.client.host if request.client else None
-    anonymized_ip = anonymize_ip(client_ip) if client_ip else None
-
-    # Find or create statistics entry for document page
-    page = f"/documents/{document_id}"
-    existing = db.query(StatistiqueVisite).filter(
-        StatistiqueVisite.date_visite == today,
-        StatistiqueVisite.page == page,
-        StatistiqueVisite.commune_id == document.commune_id,
-    ).first()
-
-    if existing:
-        existing.nb_telechargements += 1
-    else:
-        visite = StatistiqueVisite(
-            date_visite=today,
-            page=page,
-            commune_id=document.commune_id,
-            nb_visites=0,
-            nb_telechargements=1,
-            ip_address=anonymized_ip,
-            user_agent=user_agent[:500] if user_agent else None,
-        )
-        db.add(visite)
-
-    db.commit()
+    background_tasks.add_task(
+        _record_download, document_id, document.commune_id, _client_ip(request), user_agent
+    )
 
     return Message(message="Téléchargement enregistré")
 
@@ -158,52 +138,26 @@ async def track_download(
     response_model=Message,
     summary="Enregistrer plusieurs visites",
     description="Enregistre plusieurs visites en une seule requête.",
+    openapi_extra=json_body_openapi(BatchVisitRequest),
 )
 async def track_batch(
     request: Request,
-    batch: BatchVisitRequest = Body(...),
+    batch: BatchVisitRequest = Depends(json_body(BatchVisitRequest)),
     user_agent: Optional[str] = Header(None),
-    db: Session = Depends(get_db),
 ):
     """
     Track multiple page visits in a single request.
 
     Useful for client-side analytics batching.
+    The visits are buffered in memory and written in batches on the dedicated log pool.
     """
-    today = date.today()
-    client_ip = request.client.host if request.client else None
-    anonymized_ip = anonymize_ip(client_ip) if client_ip else None
-
-    count = 0
-    for visit in batch.visits:
-        page = visit.page[:255]
-        commune_id = visit.commune_id
-
-        if not page:
-            continue
-
-        existing = db.query(StatistiqueVisite).filter(
-            StatistiqueVisite.date_visite == today,
-            StatistiqueVisite.page == page,
-            StatistiqueVisite.commune_id == commune_id,
-        ).first()
-
-        if existing:
-            existing.nb_visites += 1
-        else:
-            visite = StatistiqueVisite(
-                date_visite=today,
-                page=page,
-                commune_id=commune_id,
-                nb_visites=1,
-                nb_telechargements=0,
-                ip_address=anonymized_ip,
-                user_agent=user_agent[:500] if user_agent else None,
-            )
-            db.add(visite)
-
-        count += 1
+    visits = [
+        (visit.page[:255], visit.commune_id)
+        for visit in batch.visits
+        if visit.page
+    ]
 
-    db.commit()
+    if visits:
+        visit_buffer.add(visits, _client_ip(request), user_agent)
 
-    return Message(message=f"{count} visite(s) enregistrée(s)")
+    return Message(message=f"{len(visits)} visite(s) enregistrée(s)")
@@ -48,12 +48,38 @@ class Settings(BaseSettings):
             f"@{self.POSTGRES_SERVER}:{self.POSTGRES_PORT}/{self.POSTGRES_DB}"
         )
 
+    # Pool de connexions (requêtes applicatives)
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    # Cache des requêtes SQL compilées (SQLAlchemy, par engine)
+    DB_QUERY_CACHE_SIZE: int = 1200
+
+    # Pool dédié aux écritures de journalisation (visites, téléchargements)
+    LOG_DB_POOL_SIZE: int = 5
+    LOG_DB_MAX_OVERFLOW: int = 5
+
+    # Tampon des visites : écriture par lots (compteurs distincts / secondes)
+    VISIT_BUFFER_MAX_SIZE: int = 500
+    VISIT_BUFFER_FLUSH_SECONDS: float = 2.0
+
+    # Rafraîchissement de la vue matérialisée des revenus miniers (secondes)
+    MV_REVENUS_MINIERS_REFRESH_SECONDS: float = 300.0
+
+    # Création des partitions mensuelles (audit_log, statistiques_visites) (secondes)
+    PARTITIONS_MENSUELLES_INTERVAL_SECONDS: float = 86400.0
+
     # JWT Security
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 1440  # 24 hours
     REFRESH_TOKEN_EXPIRE_MINUTES: int = 10080  # 7 days
 
+    # Hachage des mots de passe (argon2id) : ~50 ms par hachage avec ces valeurs
+    ARGON2_MEMORY_COST_KIB: int = 65536  # 64 Mio
+    ARGON2_TIME_COST: int = 2
+    ARGON2_PARALLELISM: int = 2
+
     # CORS
     BACKEND_CORS_ORIGINS: List[str] = []
 
@@ -85,6 +111,9 @@ class Settings(BaseSettings):
                 return [ext.strip() for ext in v.split(",") if ext.strip()]
         return v
 
+    # Reference data cache (exercices, plan comptable)
+    REFERENCE_CACHE_TTL_SECONDS: int = 60
+
     # Email (SMTP) - optional
     SMTP_HOST: str = ""
     SMTP_PORT: int = 587
@@ -3,17 +3,31 @@ Security module for authentication.
 Handles password hashing and JWT token operations.
 """
 
+import hashlib
 import secrets
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
-from typing import Any, Optional
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional
 
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 
-# Password hashing context using bcrypt
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Password hashing context: argon2id for new hashes, bcrypt kept to verify
+# existing hashes (upgraded to argon2id on next successful login)
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__memory_cost=settings.ARGON2_MEMORY_COST_KIB,
+    argon2__time_cost=settings.ARGON2_TIME_COST,
+    argon2__parallelism=settings.ARGON2_PARALLELISM,
+)
 
 
 # =====================
@@ -25,11 +39,35 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, Optional[str]]:
+    """
+    Verify a password and return a new hash if the stored one is outdated
+    (bcrypt or older argon2 parameters), None otherwise.
+    """
+    return pwd_context.verify_and_update(plain_password, hashed_password)
+
+
 def get_password_hash(password: str) -> str:
-    """Generate a bcrypt hash of a password."""
+    """Generate an argon2id hash of a password."""
     return pwd_context.hash(password)
 
 
+@lru_cache(maxsize=1)
+def _dummy_password_hash() -> str:
+    """Argon2id hash of a random secret, computed once on first use."""
+    return pwd_context.hash(secrets.token_urlsafe(16))
+
+
+def dummy_verify_password(plain_password: str) -> None:
+    """
+    Run a full verification against a throwaway hash so that an unknown
+    email takes as long as a wrong password (no account enumeration).
+    """
+    pwd_context.verify(plain_password, _dummy_password_hash())
+
+
 # =====================
 # JWT Token Utilities
 # =====================
@@ -82,6 +120,7 @@ def create_access_token(
 def create_refresh_token(
     subject: int,
     expires_delta: Optional[timedelta] = None,
+    expires_at: Optional[datetime] = None,
 ) -> str:
     """
     Create a JWT refresh token.
@@ -89,11 +128,14 @@ def create_refresh_token(
     Args:
         subject: User ID
         expires_delta: Optional custom expiration time
+        expires_at: Optional absolute expiration (takes precedence over expires_delta)
 
     Returns:
         Encoded JWT refresh token string
     """
-    if expires_delta:
+    if expires_at:
+        expire = expires_at
+    elif expires_delta:
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(
@@ -137,18 +179,63 @@ def decode_token(token: str) -> Optional[dict[str, Any]]:
         return None
 
 
-def verify_access_token(token: str) -> Optional[dict[str, Any]]:
+class _VerifiedTokenCache:
+    """
+    Bounded LRU of verified access token payloads, keyed by token digest.
+    Entries expire at the token's own exp, capped at `ttl` seconds.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[bytes, tuple[float, Mapping[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: bytes) -> Optional[Mapping[str, Any]]:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            if entry[0] <= time.time():
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return entry[1]
+
+    def put(self, key: bytes, payload: Mapping[str, Any]) -> None:
+        expires = min(float(payload.get("exp", 0)), time.time() + self.ttl)
+        with self._lock:
+            self._data[key] = (expires, payload)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+
+_verified_access_tokens = _VerifiedTokenCache(maxsize=10_000, ttl=60)
+
+
+def verify_access_token(token: str) -> Optional[Mapping[str, Any]]:
     """
     Verify an access token and return payload.
 
+    The signature is checked once per token and cached briefly: clients
+    reusing the same access token skip the HMAC on subsequent requests.
+
     Args:
         token: JWT access token string
 
     Returns:
-        Token payload dict or None if invalid
+        Read-only token payload or None if invalid
     """
-    payload = decode_token(token)
-    if payload and payload.get("type") == "access":
+    key = hashlib.blake2b(token.encode(), digest_size=16).digest()
+    payload = _verified_access_tokens.get(key)
+    if payload is not None:
+        return payload
+
+    decoded = decode_token(token)
+    if decoded and decoded.get("type") == "access":
+        payload = MappingProxyType(decoded)
+        _verified_access_tokens.put(key, payload)
         return payload
     return None
 
@@ -169,6 +256,19 @@ def verify_refresh_token(token: str) -> Optional[dict[str, Any]]:
     return None
 
 
+def hash_refresh_token(token: str) -> bytes:
+    """
+    Digest under which a refresh token is stored and looked up (BLAKE2b-256).
+
+    Args:
+        token: JWT refresh token string
+
+    Returns:
+        32-byte digest
+    """
+    return hashlib.blake2b(token.encode(), digest_size=32).digest()
+
+
 def get_token_expiry(token: str) -> Optional[datetime]:
     """
     Get the expiration datetime of a token.
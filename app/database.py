@@ -13,11 +13,26 @@ from app.core.config import settings
 engine = create_engine(
     settings.DATABASE_URL,
     pool_pre_ping=True,  # Verify connections before using them
-    pool_size=10,  # Number of connections to keep in the pool
-    max_overflow=20,  # Max connections beyond pool_size
+    pool_size=settings.DB_POOL_SIZE,  # Number of connections to keep in the pool
+    max_overflow=settings.DB_MAX_OVERFLOW,  # Max connections beyond pool_size
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,  # Renew connections before server-side timeouts
+    pool_use_lifo=True,  # Reuse the most recent connection, let idle ones expire
+    query_cache_size=settings.DB_QUERY_CACHE_SIZE,  # Compiled SQL kept across requests
     echo=settings.DEBUG,  # Log SQL queries in debug mode
 )
 
+# Engine dédié aux écritures de journalisation (visites, téléchargements) :
+# un pic de tracking ne peut pas épuiser le pool des requêtes applicatives.
+log_engine = create_engine(
+    settings.DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=settings.LOG_DB_POOL_SIZE,
+    max_overflow=settings.LOG_DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+    pool_use_lifo=True,
+    echo=settings.DEBUG,
+)
+
 # Create session factory
 SessionLocal = sessionmaker(
     autocommit=False,
@@ -25,6 +40,13 @@ SessionLocal = sessionmaker(
     bind=engine,
 )
 
+# Session factory for log writes
+LogSessionLocal = sessionmaker(
+    autocommit=False,
+    autoflush=False,
+    bind=log_engine,
+)
+
 # Base class for SQLAlchemy models
 Base = declarative_base()
 
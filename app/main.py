@@ -3,16 +3,21 @@ FastAPI Application Entry Point.
 Configures CORS, logging, and API routers.
 """
 
+import asyncio
 import sys
 from pathlib import Path
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
+from sqlalchemy.orm import configure_mappers
 
 from app.core.config import settings
 from app.api.v1.router import api_router
+from app.services.maintenance import creation_partitions_mensuelles, rafraichissement_revenus_miniers
+from app.services.visit_buffer import visit_buffer
 
 
 # Configure Loguru logging
@@ -69,10 +74,28 @@ async def lifespan(app: FastAPI):
     logger.info(f"Debug mode: {settings.DEBUG}")
     logger.info(f"API docs available at: {settings.BACKEND_URL}/docs")
 
+    # Résolution des relations ORM une seule fois au démarrage,
+    # plutôt qu'à la première requête servie
+    configure_mappers()
+
+    # Écriture par lots des visites mises en tampon par /tracking
+    visit_task = asyncio.create_task(visit_buffer.run())
+
+    # Maintenance périodique de la base (vue matérialisée des revenus miniers,
+    # partitions mensuelles des journaux)
+    maintenance_tasks = [
+        asyncio.create_task(rafraichissement_revenus_miniers.run()),
+        asyncio.create_task(creation_partitions_mensuelles.run()),
+    ]
+
     yield
 
     # Shutdown
     logger.info("Shutting down application")
+    visit_task.cancel()
+    for task in maintenance_tasks:
+        task.cancel()
+    await visit_buffer.flush()
 
 
 # Create FastAPI application
@@ -84,6 +107,8 @@ app = FastAPI(
     docs_url="/docs",
     redoc_url="/redoc",
     lifespan=lifespan,
+    # Sérialisation JSON en C (orjson) pour toutes les réponses
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
@@ -93,6 +118,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],  # Pagination par curseur (documents)
 )
 
 # Include API v1 router
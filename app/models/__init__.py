@@ -43,6 +43,7 @@ from app.models.projets_miniers import (
     ProjetMinier,
     ProjetCommune,
     RevenuMinier,
+    revenus_miniers_agreges,
 )
 
 # Document model
@@ -101,6 +102,7 @@ __all__ = [
     "ProjetMinier",
     "ProjetCommune",
     "RevenuMinier",
+    "revenus_miniers_agreges",
     # Documents
     "Document",
     # CMS
@@ -5,17 +5,22 @@ Auxiliary models: Newsletter, Statistics, Audit.
 from datetime import date, datetime
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import Boolean, Date, DateTime, Enum, ForeignKey, Index, Integer, String, Text
+from sqlalchemy import BigInteger, Boolean, Date, DateTime, Enum, ForeignKey, Index, Integer, SmallInteger, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
+from app.models.base import LAZY
 from app.models.enums import ActionAudit
 
 if TYPE_CHECKING:
     from app.models.geographie import Commune
     from app.models.utilisateurs import Utilisateur
 
+# Nombre de compartiments par compteur page/commune/jour : les incréments
+# concurrents se répartissent sur plusieurs lignes au lieu de verrouiller la même
+NB_COMPARTIMENTS_STATS = 16
+
 
 class NewsletterAbonne(Base):
     """
@@ -23,8 +28,7 @@ class NewsletterAbonne(Base):
     """
     __tablename__ = "newsletter_abonnes"
     __table_args__ = (
-        Index("idx_newsletter_email", "email"),
-        Index("idx_newsletter_actif", "actif", postgresql_where="actif = TRUE"),
+        Index("idx_newsletter_actifs_email", "email", postgresql_where="actif = TRUE"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -33,7 +37,7 @@ class NewsletterAbonne(Base):
     actif: Mapped[bool] = mapped_column(Boolean, default=True)
     date_inscription: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        default=func.now(),
         nullable=False
     )
     date_desinscription: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
@@ -62,23 +66,38 @@ class StatistiqueVisite(Base):
         Index("idx_stats_date", "date_visite"),
         Index("idx_stats_commune", "commune_id"),
         Index("idx_stats_page", "page"),
+        # Cible de l'upsert des compteurs (INSERT ... ON CONFLICT DO UPDATE) ;
+        # COALESCE : les compteurs sans commune (NULL) partagent la même ligne
+        Index(
+            "uk_stats_compteur", "date_visite", "page", text("COALESCE(commune_id, 0)"), "compartiment",
+            unique=True
+        ),
+        # Une partition par mois (voir creer_partitions_mensuelles dans schema.sql)
+        {"postgresql_partition_by": "RANGE (date_visite)"},
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    date_visite: Mapped[date] = mapped_column(Date, nullable=False)
+    # Table en ajout seul : clé séquentielle 64 bits (insertions en fin d'index)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
+    # Clé de partition : fait partie de la clé primaire
+    date_visite: Mapped[date] = mapped_column(Date, primary_key=True)
     page: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     commune_id: Mapped[Optional[int]] = mapped_column(
         Integer,
         ForeignKey("communes.id", ondelete="SET NULL"),
         nullable=True
     )
+    # Compartiment du compteur (0..NB_COMPARTIMENTS_STATS-1) ; les lectures font SUM()
+    compartiment: Mapped[int] = mapped_column(SmallInteger, nullable=False, default=0)
     nb_visites: Mapped[int] = mapped_column(Integer, default=1)
     nb_telechargements: Mapped[int] = mapped_column(Integer, default=0)
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
-    user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    # Stockage EXTERNAL (sans compression) dans schema.sql
+    user_agent: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, info={"postgresql_storage": "external"}
+    )
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        default=func.now(),
         nullable=False
     )
 
@@ -103,9 +122,12 @@ class AuditLog(Base):
         Index("idx_audit_record", "table_name", "record_id"),
         Index("idx_audit_date", "created_at"),
         Index("idx_audit_utilisateur", "utilisateur_id"),
+        # Une partition par mois (voir creer_partitions_mensuelles dans schema.sql)
+        {"postgresql_partition_by": "RANGE (created_at)"},
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    # Table en ajout seul : clé séquentielle 64 bits (insertions en fin d'index)
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True, autoincrement=True)
     table_name: Mapped[str] = mapped_column(String(100), nullable=False)
     record_id: Mapped[int] = mapped_column(Integer, nullable=False)
     action: Mapped[ActionAudit] = mapped_column(
@@ -120,16 +142,18 @@ class AuditLog(Base):
         nullable=True
     )
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
+    # Clé de partition : fait partie de la clé primaire
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        nullable=False
+        default=func.now(),
+        primary_key=True
     )
 
     # Relations
     utilisateur: Mapped[Optional["Utilisateur"]] = relationship(
         "Utilisateur",
-        back_populates="audit_logs"
+        back_populates="audit_logs",
+        lazy=LAZY
     )
 
     def __repr__(self) -> str:
@@ -5,6 +5,7 @@ Base classes and mixins for SQLAlchemy models.
 from datetime import datetime
 from sqlalchemy import DateTime, func
 from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.types import UserDefinedType
 
 
 class TimestampMixin:
@@ -12,6 +13,7 @@ class TimestampMixin:
     Mixin that adds created_at and updated_at timestamp columns.
     Automatically sets created_at on insert and updated_at on update.
     """
+
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
         default=func.now(),
@@ -23,3 +25,36 @@ class TimestampMixin:
         onupdate=func.now(),
         nullable=False
     )
+
+
+class FastRepr:
+    """
+    Mixin fournissant un __repr__ léger basé sur la clé primaire.
+    Lit l'état déjà chargé de l'instance : n'émet jamais de requête SQL.
+    Les modèles qui définissent leur propre __repr__ lisent aussi __dict__.
+    """
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} id={self.__dict__.get('id')}>"
+
+
+# Stratégie de chargement par défaut des relations : tout accès non préchargé
+# qui déclencherait une requête SQL lève une erreur au lieu d'un N+1 silencieux.
+# Les requêtes doivent déclarer explicitement selectinload/joinedload.
+LAZY = "raise_on_sql"
+
+# Groupe des colonnes texte volumineuses, chargées en différé (deferred).
+# Les listes ne les lisent pas ; les vues détail utilisent undefer_group(DETAIL).
+DETAIL = "detail"
+
+
+class LTREE(UserDefinedType):
+    """
+    Type PostgreSQL ltree (extension ltree) : chemin hiérarchique "a.b.c".
+    Transmis tel quel sous forme de chaîne ; les opérateurs (<@, @>, ~)
+    s'utilisent via column.op().
+    """
+    cache_ok = True
+
+    def get_col_spec(self, **kw) -> str:
+        return "LTREE"
@@ -8,7 +8,7 @@ from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy import (
     Boolean, Date, DateTime, Enum, ForeignKey, Index,
-    Integer, String, Text, UniqueConstraint
+    Integer, String, Text, UniqueConstraint, func
 )
 from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -39,6 +39,8 @@ class PageCompteAdministratif(Base, TimestampMixin):
             "statut", "date_publication",
             postgresql_where="statut = 'publie'"
         ),
+        Index("idx_pages_ca_cree_par", "cree_par", postgresql_where="cree_par IS NOT NULL"),
+        Index("idx_pages_ca_modifie_par", "modifie_par", postgresql_where="modifie_par IS NOT NULL"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -68,8 +70,8 @@ class PageCompteAdministratif(Base, TimestampMixin):
     date_publication: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     date_mise_a_jour: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow
+        default=func.now(),
+        onupdate=func.now()
     )
 
     # Options d'affichage
@@ -8,13 +8,16 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy import (
-    Boolean, CheckConstraint, Date, DateTime, Enum, ForeignKey,
-    Index, Integer, Numeric, String, Text, UniqueConstraint
+    Boolean, CheckConstraint, Date, DateTime, Enum, FetchedValue, ForeignKey,
+    Index, Integer, Numeric, String, Text, UniqueConstraint, case, func, select
+)
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import (
+    Mapped, joinedload, mapped_column, relationship, selectinload, undefer_group
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
 
 from app.database import Base
-from app.models.base import TimestampMixin
+from app.models.base import DETAIL, LAZY, LTREE, FastRepr, TimestampMixin
 from app.models.enums import SectionBudgetaire, TypeMouvement
 
 if TYPE_CHECKING:
@@ -25,7 +28,7 @@ if TYPE_CHECKING:
     from app.models.cms import PageCompteAdministratif
 
 
-class PlanComptable(Base, TimestampMixin):
+class PlanComptable(Base, TimestampMixin, FastRepr):
     """
     Plan comptable hiérarchique des collectivités territoriales.
     Structure à 3 niveaux: catégorie principale, sous-catégorie, ligne détail.
@@ -33,7 +36,12 @@ class PlanComptable(Base, TimestampMixin):
     __tablename__ = "plan_comptable"
     __table_args__ = (
         Index("idx_plan_comptable_parent", "parent_code"),
-        Index("idx_plan_comptable_type", "type_mouvement", "section"),
+        Index("idx_plan_comptable_chemin", "chemin", postgresql_using="gist"),
+        Index(
+            "idx_plan_comptable_actifs",
+            "type_mouvement", "section", "ordre_affichage", "code",
+            postgresql_where="actif = TRUE"
+        ),
         Index("idx_plan_comptable_niveau", "niveau"),
         Index("idx_plan_comptable_ordre", "type_mouvement", "section", "ordre_affichage"),
         CheckConstraint("niveau BETWEEN 1 AND 3", name="chk_niveau_1_3"),
@@ -56,6 +64,14 @@ class PlanComptable(Base, TimestampMixin):
         ForeignKey("plan_comptable.code", ondelete="SET NULL"),
         nullable=True
     )
+    # Chemin ltree depuis la racine (ex. "70.708.7080"), maintenu par trigger
+    # à partir de parent_code : un sous-arbre se lit en une seule requête indexée
+    chemin: Mapped[str] = mapped_column(
+        LTREE,
+        nullable=False,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue()
+    )
     est_sommable: Mapped[bool] = mapped_column(Boolean, default=True)
     ordre_affichage: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     actif: Mapped[bool] = mapped_column(Boolean, default=True)
@@ -65,33 +81,50 @@ class PlanComptable(Base, TimestampMixin):
         "PlanComptable",
         remote_side=[code],
         foreign_keys=[parent_code],
-        back_populates="enfants"
+        back_populates="enfants",
+        lazy=LAZY
     )
     enfants: Mapped[List["PlanComptable"]] = relationship(
         "PlanComptable",
         back_populates="parent",
-        foreign_keys=[parent_code]
+        foreign_keys=[parent_code],
+        lazy=LAZY
     )
 
     # Relations vers données financières
     donnees_recettes: Mapped[List["DonneesRecettes"]] = relationship(
         "DonneesRecettes",
-        back_populates="compte"
+        back_populates="compte",
+        lazy=LAZY
     )
     donnees_depenses: Mapped[List["DonneesDepenses"]] = relationship(
         "DonneesDepenses",
-        back_populates="compte"
+        back_populates="compte",
+        lazy=LAZY
     )
     revenus_miniers: Mapped[List["RevenuMinier"]] = relationship(
         "RevenuMinier",
-        back_populates="compte"
+        back_populates="compte",
+        lazy=LAZY
     )
 
     def __repr__(self) -> str:
-        return f"<PlanComptable(code='{self.code}', intitule='{self.intitule[:30]}...')>"
+        etat = self.__dict__
+        return f"<PlanComptable(code='{etat.get('code')}', intitule='{(etat.get('intitule') or '')[:30]}...')>"
 
+    @classmethod
+    def with_full_detail(cls) -> tuple:
+        """Options de chargement pour le détail : parent et enfants directs."""
+        return (joinedload(cls.parent), selectinload(cls.enfants))
 
-class Exercice(Base, TimestampMixin):
+    @classmethod
+    def sous_arbre(cls, code: str):
+        """Condition : compte `code` et tous ses descendants (index GiST idx_plan_comptable_chemin)."""
+        racine = select(cls.chemin).where(cls.code == code).scalar_subquery()
+        return cls.chemin.op("<@")(racine)
+
+
+class Exercice(Base, TimestampMixin, FastRepr):
     """
     Exercices budgétaires annuels.
     Représente une année fiscale.
@@ -112,30 +145,36 @@ class Exercice(Base, TimestampMixin):
     # Relations
     donnees_recettes: Mapped[List["DonneesRecettes"]] = relationship(
         "DonneesRecettes",
-        back_populates="exercice"
+        back_populates="exercice",
+        lazy=LAZY
     )
     donnees_depenses: Mapped[List["DonneesDepenses"]] = relationship(
         "DonneesDepenses",
-        back_populates="exercice"
+        back_populates="exercice",
+        lazy=LAZY
     )
     revenus_miniers: Mapped[List["RevenuMinier"]] = relationship(
         "RevenuMinier",
-        back_populates="exercice"
+        back_populates="exercice",
+        lazy=LAZY
     )
     documents: Mapped[List["Document"]] = relationship(
         "Document",
-        back_populates="exercice"
+        back_populates="exercice",
+        lazy=LAZY
     )
     pages_compte_administratif: Mapped[List["PageCompteAdministratif"]] = relationship(
         "PageCompteAdministratif",
-        back_populates="exercice"
+        back_populates="exercice",
+        lazy=LAZY
     )
 
     def __repr__(self) -> str:
-        return f"<Exercice(annee={self.annee}, cloture={self.cloture})>"
+        etat = self.__dict__
+        return f"<Exercice(annee={etat.get('annee')}, cloture={etat.get('cloture')})>"
 
 
-class DonneesRecettes(Base, TimestampMixin):
+class DonneesRecettes(Base, TimestampMixin, FastRepr):
     """
     Données financières des recettes par commune/exercice/compte.
     Colonnes: budget primitif, additionnel, modifications, OR admis, recouvrement.
@@ -150,24 +189,42 @@ class DonneesRecettes(Base, TimestampMixin):
         Index("idx_recettes_exercice", "exercice_id"),
         Index("idx_recettes_compte", "compte_code"),
         Index("idx_recettes_commune_exercice", "commune_id", "exercice_id"),
+        Index("idx_recettes_exercice_section", "exercice_id", "section", "commune_id"),
+        # Données en attente de validation (minorité des lignes)
+        Index(
+            "idx_recettes_non_validees", "exercice_id", "commune_id",
+            postgresql_where="valide = FALSE"
+        ),
+        Index("idx_recettes_valide_par", "valide_par", postgresql_where="valide_par IS NOT NULL"),
+        # Une partition par exercice (voir creer_partitions_exercice dans schema.sql)
+        {"postgresql_partition_by": "LIST (exercice_id)"},
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     commune_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("communes.id", ondelete="CASCADE"),
         nullable=False
     )
+    # Clé de partition : fait partie de la clé primaire
     exercice_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("exercices.id", ondelete="CASCADE"),
-        nullable=False
+        primary_key=True
     )
     compte_code: Mapped[str] = mapped_column(
         String(10),
         ForeignKey("plan_comptable.code", ondelete="CASCADE"),
         nullable=False
     )
+    # Section dénormalisée depuis le plan comptable, maintenue par trigger (schema.sql) :
+    # agrégation par section sans jointure sur plan_comptable
+    section: Mapped[SectionBudgetaire] = mapped_column(
+        Enum(SectionBudgetaire, name="section_budgetaire", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue()
+    )
 
     # Colonnes financières (en Ariary - MGA)
     budget_primitif: Mapped[Decimal] = mapped_column(
@@ -193,7 +250,9 @@ class DonneesRecettes(Base, TimestampMixin):
     )
 
     # Métadonnées
-    commentaire: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    commentaire: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group=DETAIL
+    )
     valide: Mapped[bool] = mapped_column(Boolean, default=False)
     valide_par: Mapped[Optional[int]] = mapped_column(
         Integer,
@@ -205,24 +264,39 @@ class DonneesRecettes(Base, TimestampMixin):
     # Relations
     commune: Mapped["Commune"] = relationship(
         "Commune",
-        back_populates="donnees_recettes"
+        back_populates="donnees_recettes",
+        lazy=LAZY
     )
     exercice: Mapped["Exercice"] = relationship(
         "Exercice",
-        back_populates="donnees_recettes"
+        back_populates="donnees_recettes",
+        lazy=LAZY
     )
     compte: Mapped["PlanComptable"] = relationship(
         "PlanComptable",
-        back_populates="donnees_recettes"
+        back_populates="donnees_recettes",
+        lazy=LAZY
     )
     validateur: Mapped[Optional["Utilisateur"]] = relationship(
         "Utilisateur",
         back_populates="recettes_validees",
-        foreign_keys=[valide_par]
+        foreign_keys=[valide_par],
+        lazy=LAZY
     )
 
     def __repr__(self) -> str:
-        return f"<DonneesRecettes(commune_id={self.commune_id}, exercice_id={self.exercice_id}, compte='{self.compte_code}')>"
+        etat = self.__dict__
+        return f"<DonneesRecettes(commune_id={etat.get('commune_id')}, exercice_id={etat.get('exercice_id')}, compte='{etat.get('compte_code')}')>"
+
+    @classmethod
+    def with_full_detail(cls) -> tuple:
+        """Options de chargement pour le détail : commune, exercice, compte, commentaire."""
+        return (
+            joinedload(cls.commune),
+            joinedload(cls.exercice),
+            joinedload(cls.compte),
+            undefer_group(DETAIL),
+        )
 
     @property
     def previsions_calculees(self) -> Decimal:
@@ -234,16 +308,36 @@ class DonneesRecettes(Base, TimestampMixin):
         """Calcule le reste à recouvrer."""
         return self.or_admis - self.recouvrement
 
-    @property
+    @hybrid_property
+    def previsions_effectives(self) -> Decimal:
+        """Prévisions définitives saisies, à défaut prévisions calculées."""
+        return self.previsions_definitives or self.previsions_calculees
+
+    @previsions_effectives.inplace.expression
+    @classmethod
+    def _previsions_effectives_expression(cls):
+        return func.coalesce(
+            func.nullif(cls.previsions_definitives, 0),
+            cls.budget_primitif + cls.budget_additionnel + cls.modifications,
+        )
+
+    @hybrid_property
     def taux_execution(self) -> Decimal:
         """Calcule le taux d'exécution en pourcentage."""
-        prev = self.previsions_definitives or self.previsions_calculees
+        prev = self.previsions_effectives
         if prev > 0:
             return (self.or_admis / prev) * 100
         return Decimal("0.00")
 
+    @taux_execution.inplace.expression
+    @classmethod
+    def _taux_execution_expression(cls):
+        # Même règle qu'en Python, calculée par PostgreSQL pour les listes
+        prev = cls.previsions_effectives
+        return case((prev > 0, cls.or_admis / prev * 100), else_=Decimal("0.00"))
 
-class DonneesDepenses(Base, TimestampMixin):
+
+class DonneesDepenses(Base, TimestampMixin, FastRepr):
     """
     Données financières des dépenses par commune/exercice/compte.
     Colonnes: budget primitif, additionnel, modifications, engagement, mandat, paiement.
@@ -258,24 +352,42 @@ class DonneesDepenses(Base, TimestampMixin):
         Index("idx_depenses_exercice", "exercice_id"),
         Index("idx_depenses_compte", "compte_code"),
         Index("idx_depenses_commune_exercice", "commune_id", "exercice_id"),
+        Index("idx_depenses_exercice_section", "exercice_id", "section", "commune_id"),
+        # Données en attente de validation (minorité des lignes)
+        Index(
+            "idx_depenses_non_validees", "exercice_id", "commune_id",
+            postgresql_where="valide = FALSE"
+        ),
+        Index("idx_depenses_valide_par", "valide_par", postgresql_where="valide_par IS NOT NULL"),
+        # Une partition par exercice (voir creer_partitions_exercice dans schema.sql)
+        {"postgresql_partition_by": "LIST (exercice_id)"},
     )
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     commune_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("communes.id", ondelete="CASCADE"),
         nullable=False
     )
+    # Clé de partition : fait partie de la clé primaire
     exercice_id: Mapped[int] = mapped_column(
         Integer,
         ForeignKey("exercices.id", ondelete="CASCADE"),
-        nullable=False
+        primary_key=True
     )
     compte_code: Mapped[str] = mapped_column(
         String(10),
         ForeignKey("plan_comptable.code", ondelete="CASCADE"),
         nullable=False
     )
+    # Section dénormalisée depuis le plan comptable, maintenue par trigger (schema.sql) :
+    # agrégation par section sans jointure sur plan_comptable
+    section: Mapped[SectionBudgetaire] = mapped_column(
+        Enum(SectionBudgetaire, name="section_budgetaire", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        nullable=False,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue()
+    )
 
     # Colonnes financières (en Ariary - MGA)
     budget_primitif: Mapped[Decimal] = mapped_column(
@@ -305,7 +417,9 @@ class DonneesDepenses(Base, TimestampMixin):
 
     # Métadonnées
     programme: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    commentaire: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    commentaire: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group=DETAIL
+    )
     valide: Mapped[bool] = mapped_column(Boolean, default=False)
     valide_par: Mapped[Optional[int]] = mapped_column(
         Integer,
@@ -317,24 +431,39 @@ class DonneesDepenses(Base, TimestampMixin):
     # Relations
     commune: Mapped["Commune"] = relationship(
         "Commune",
-        back_populates="donnees_depenses"
+        back_populates="donnees_depenses",
+        lazy=LAZY
     )
     exercice: Mapped["Exercice"] = relationship(
         "Exercice",
-        back_populates="donnees_depenses"
+        back_populates="donnees_depenses",
+        lazy=LAZY
     )
     compte: Mapped["PlanComptable"] = relationship(
         "PlanComptable",
-        back_populates="donnees_depenses"
+        back_populates="donnees_depenses",
+        lazy=LAZY
     )
     validateur: Mapped[Optional["Utilisateur"]] = relationship(
         "Utilisateur",
         back_populates="depenses_validees",
-        foreign_keys=[valide_par]
+        foreign_keys=[valide_par],
+        lazy=LAZY
     )
 
     def __repr__(self) -> str:
-        return f"<DonneesDepenses(commune_id={self.commune_id}, exercice_id={self.exercice_id}, compte='{self.compte_code}')>"
+        etat = self.__dict__
+        return f"<DonneesDepenses(commune_id={etat.get('commune_id')}, exercice_id={etat.get('exercice_id')}, compte='{etat.get('compte_code')}')>"
+
+    @classmethod
+    def with_full_detail(cls) -> tuple:
+        """Options de chargement pour le détail : commune, exercice, compte, commentaire."""
+        return (
+            joinedload(cls.commune),
+            joinedload(cls.exercice),
+            joinedload(cls.compte),
+            undefer_group(DETAIL),
+        )
 
     @property
     def previsions_calculees(self) -> Decimal:
@@ -346,16 +475,36 @@ class DonneesDepenses(Base, TimestampMixin):
         """Calcule le reste à payer."""
         return self.mandat_admis - self.paiement
 
-    @property
+    @hybrid_property
+    def previsions_effectives(self) -> Decimal:
+        """Prévisions définitives saisies, à défaut prévisions calculées."""
+        return self.previsions_definitives or self.previsions_calculees
+
+    @previsions_effectives.inplace.expression
+    @classmethod
+    def _previsions_effectives_expression(cls):
+        return func.coalesce(
+            func.nullif(cls.previsions_definitives, 0),
+            cls.budget_primitif + cls.budget_additionnel + cls.modifications,
+        )
+
+    @hybrid_property
     def taux_execution(self) -> Decimal:
         """Calcule le taux d'exécution en pourcentage."""
-        prev = self.previsions_definitives or self.previsions_calculees
+        prev = self.previsions_effectives
         if prev > 0:
             return (self.mandat_admis / prev) * 100
         return Decimal("0.00")
 
+    @taux_execution.inplace.expression
+    @classmethod
+    def _taux_execution_expression(cls):
+        # Même règle qu'en Python, calculée par PostgreSQL pour les listes
+        prev = cls.previsions_effectives
+        return case((prev > 0, cls.mandat_admis / prev * 100), else_=Decimal("0.00"))
 
-class ColonneDynamique(Base, TimestampMixin):
+
+class ColonneDynamique(Base, TimestampMixin, FastRepr):
     """
     Colonnes dynamiques pour les tableaux de recettes et dépenses.
     Permet de définir les colonnes affichées dans les comptes administratifs.
@@ -389,11 +538,8 @@ class ColonneDynamique(Base, TimestampMixin):
     est_systeme: Mapped[bool] = mapped_column(Boolean, default=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
 
-    def __repr__(self) -> str:
-        return f"<ColonneDynamique(cle='{self.cle}', label='{self.label}')>"
 
-
-class CompteAdministratif(Base, TimestampMixin):
+class CompteAdministratif(Base, TimestampMixin, FastRepr):
     """
     Enregistrement persistant d'un compte administratif (commune + exercice).
     Permet de suivre les comptes créés même sans données financières.
@@ -406,6 +552,7 @@ class CompteAdministratif(Base, TimestampMixin):
         ),
         Index("idx_compte_admin_commune", "commune_id"),
         Index("idx_compte_admin_exercice", "exercice_id"),
+        Index("idx_compte_admin_created_by", "created_by", postgresql_where="created_by IS NOT NULL"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -419,7 +566,9 @@ class CompteAdministratif(Base, TimestampMixin):
         ForeignKey("exercices.id", ondelete="CASCADE"),
         nullable=False
     )
-    notes: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    notes: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group=DETAIL
+    )
     created_by: Mapped[Optional[int]] = mapped_column(
         Integer,
         ForeignKey("utilisateurs.id", ondelete="SET NULL"),
@@ -437,6 +586,3 @@ class CompteAdministratif(Base, TimestampMixin):
         "RevenuMinier",
         back_populates="compte_administratif"
     )
-
-    def __repr__(self) -> str:
-        return f"<CompteAdministratif(commune_id={self.commune_id}, exercice_id={self.exercice_id})>"
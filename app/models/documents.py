@@ -4,11 +4,14 @@ Document model for file attachments.
 
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import BigInteger, Boolean, Enum, ForeignKey, Index, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    BigInteger, Boolean, Computed, Enum, ForeignKey, Index, Integer, String, Text, func, text
+)
+from sqlalchemy.dialects.postgresql import TSVECTOR
+from sqlalchemy.orm import Mapped, joinedload, mapped_column, relationship, undefer_group
 
 from app.database import Base
-from app.models.base import TimestampMixin
+from app.models.base import DETAIL, LAZY, FastRepr, TimestampMixin
 from app.models.enums import TypeDocument
 
 if TYPE_CHECKING:
@@ -16,8 +19,7 @@ if TYPE_CHECKING:
     from app.models.comptabilite import Exercice
     from app.models.utilisateurs import Utilisateur
 
-
-class Document(Base, TimestampMixin):
+class Document(Base, TimestampMixin, FastRepr):
     """
     Documents et pièces justificatives.
     Stocke les métadonnées des fichiers uploadés.
@@ -27,7 +29,14 @@ class Document(Base, TimestampMixin):
         Index("idx_documents_commune", "commune_id"),
         Index("idx_documents_exercice", "exercice_id"),
         Index("idx_documents_type", "type_document"),
-        Index("idx_documents_public", "public", postgresql_where="public = TRUE"),
+        # Documents publics, du plus récent au plus ancien (pagination par curseur)
+        Index(
+            "idx_documents_public_recents",
+            text("created_at DESC"), text("id DESC"),
+            postgresql_where="public = TRUE"
+        ),
+        Index("idx_documents_fts", "recherche_tsv", postgresql_using="gin"),
+        Index("idx_documents_uploade_par", "uploade_par", postgresql_where="uploade_par IS NOT NULL"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -46,9 +55,13 @@ class Document(Base, TimestampMixin):
         nullable=False
     )
     titre: Mapped[str] = mapped_column(String(255), nullable=False)
-    description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
+    description: Mapped[Optional[str]] = mapped_column(
+        Text, nullable=True, deferred=True, deferred_group=DETAIL
+    )
     nom_fichier: Mapped[str] = mapped_column(String(255), nullable=False)
-    chemin_fichier: Mapped[str] = mapped_column(String(500), nullable=False)
+    chemin_fichier: Mapped[str] = mapped_column(
+        String(500), nullable=False, deferred=True, deferred_group=DETAIL
+    )
     taille_octets: Mapped[Optional[int]] = mapped_column(BigInteger, nullable=True)
     mime_type: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     uploade_par: Mapped[Optional[int]] = mapped_column(
@@ -59,40 +72,70 @@ class Document(Base, TimestampMixin):
     nb_telechargements: Mapped[int] = mapped_column(Integer, default=0)
     public: Mapped[bool] = mapped_column(Boolean, default=True)
 
+    # Champs d'affichage calculés par PostgreSQL à l'écriture, pas à chaque lecture.
+    # Taille lisible : unité en puissance de 1024 (o, Ko, Mo, Go, To), une décimale
+    taille_formatee: Mapped[str] = mapped_column(
+        String(20),
+        Computed(
+            "CASE"
+            " WHEN taille_octets IS NULL THEN 'Inconnu'"
+            " WHEN taille_octets < 1024 THEN round(taille_octets::numeric, 1)::text || ' o'"
+            " WHEN taille_octets < 1048576 THEN round(taille_octets::numeric / 1024, 1)::text || ' Ko'"
+            " WHEN taille_octets < 1073741824 THEN round(taille_octets::numeric / 1048576, 1)::text || ' Mo'"
+            " WHEN taille_octets < 1099511627776 THEN round(taille_octets::numeric / 1073741824, 1)::text || ' Go'"
+            " ELSE round(taille_octets::numeric / 1099511627776, 1)::text || ' To' END",
+            persisted=True
+        )
+    )
+    # Extension en minuscules (texte après le dernier point), vide sans point
+    extension: Mapped[str] = mapped_column(
+        String(255),
+        Computed(
+            "lower(coalesce(substring(nom_fichier from '\\.([^.]*)$'), ''))",
+            persisted=True
+        )
+    )
+
+    # Vecteur de recherche plein texte, calculé par PostgreSQL (jamais chargé par défaut)
+    recherche_tsv: Mapped[Optional[str]] = mapped_column(
+        TSVECTOR,
+        Computed(
+            "to_tsvector('french'::regconfig, "
+            "coalesce(titre, '') || ' ' || coalesce(description, '') || ' ' || coalesce(nom_fichier, ''))",
+            persisted=True
+        ),
+        deferred=True
+    )
+
     # Relations
     commune: Mapped[Optional["Commune"]] = relationship(
         "Commune",
-        back_populates="documents"
+        back_populates="documents",
+        lazy=LAZY
     )
     exercice: Mapped[Optional["Exercice"]] = relationship(
         "Exercice",
-        back_populates="documents"
+        back_populates="documents",
+        lazy=LAZY
     )
     uploadeur: Mapped[Optional["Utilisateur"]] = relationship(
         "Utilisateur",
         back_populates="documents_uploades",
-        foreign_keys=[uploade_par]
+        foreign_keys=[uploade_par],
+        lazy=LAZY
     )
 
-    def __repr__(self) -> str:
-        return f"<Document(id={self.id}, titre='{self.titre}', type='{self.type_document.value}')>"
-
-    @property
-    def taille_formatee(self) -> str:
-        """Retourne la taille du fichier formatée (Ko, Mo, Go)."""
-        if self.taille_octets is None:
-            return "Inconnu"
-
-        size = self.taille_octets
-        for unit in ["o", "Ko", "Mo", "Go"]:
-            if size < 1024:
-                return f"{size:.1f} {unit}"
-            size /= 1024
-        return f"{size:.1f} To"
+    @classmethod
+    def with_full_detail(cls) -> tuple:
+        """Options de chargement pour le détail : commune, exercice, uploadeur, colonnes différées."""
+        return (
+            joinedload(cls.commune),
+            joinedload(cls.exercice),
+            joinedload(cls.uploadeur),
+            undefer_group(DETAIL),
+        )
 
-    @property
-    def extension(self) -> str:
-        """Retourne l'extension du fichier."""
-        if "." in self.nom_fichier:
-            return self.nom_fichier.rsplit(".", 1)[1].lower()
-        return ""
+    @classmethod
+    def recherche(cls, terme: str):
+        """Condition de recherche plein texte (index GIN idx_documents_fts)."""
+        return cls.recherche_tsv.op("@@")(func.plainto_tsquery("french", terme))
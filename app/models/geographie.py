@@ -6,11 +6,11 @@ Province → Region → Commune
 from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Enum, ForeignKey, Index, Integer, Numeric, String
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import Enum, FetchedValue, ForeignKey, Index, Integer, Numeric, String
+from sqlalchemy.orm import Mapped, joinedload, mapped_column, relationship
 
 from app.database import Base
-from app.models.base import TimestampMixin
+from app.models.base import LAZY, FastRepr, TimestampMixin
 from app.models.enums import TypeCommune
 
 if TYPE_CHECKING:
@@ -22,7 +22,7 @@ if TYPE_CHECKING:
     from app.models.annexes import StatistiqueVisite
 
 
-class Province(Base, TimestampMixin):
+class Province(Base, TimestampMixin, FastRepr):
     """
     Les 6 provinces de Madagascar.
     Premier niveau de la hiérarchie administrative.
@@ -40,11 +40,8 @@ class Province(Base, TimestampMixin):
         cascade="all, delete-orphan"
     )
 
-    def __repr__(self) -> str:
-        return f"<Province(id={self.id}, code='{self.code}', nom='{self.nom}')>"
 
-
-class Region(Base, TimestampMixin):
+class Region(Base, TimestampMixin, FastRepr):
     """
     Les 22 régions de Madagascar.
     Deuxième niveau de la hiérarchie administrative.
@@ -74,11 +71,8 @@ class Region(Base, TimestampMixin):
         cascade="all, delete-orphan"
     )
 
-    def __repr__(self) -> str:
-        return f"<Region(id={self.id}, code='{self.code}', nom='{self.nom}')>"
-
 
-class Commune(Base, TimestampMixin):
+class Commune(Base, TimestampMixin, FastRepr):
     """
     Communes de Madagascar (collectivités territoriales).
     Troisième niveau de la hiérarchie administrative.
@@ -87,6 +81,7 @@ class Commune(Base, TimestampMixin):
     __table_args__ = (
         Index("idx_communes_region", "region_id"),
         Index("idx_communes_nom", "nom"),
+        Index("idx_communes_province_region", "province_id", "region_id"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -101,6 +96,15 @@ class Commune(Base, TimestampMixin):
         ForeignKey("regions.id", ondelete="CASCADE"),
         nullable=False
     )
+    # Province dénormalisée depuis la région, maintenue par trigger (schema.sql) :
+    # filtre par province sans jointure sur regions. Pas de clé étrangère :
+    # la valeur est toujours copiée de regions.province_id, déjà contrainte.
+    province_id: Mapped[int] = mapped_column(
+        Integer,
+        nullable=False,
+        server_default=FetchedValue(),
+        server_onupdate=FetchedValue()
+    )
     population: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
     superficie_km2: Mapped[Optional[Decimal]] = mapped_column(
         Numeric(10, 2),
@@ -110,42 +114,53 @@ class Commune(Base, TimestampMixin):
     # Relations
     region: Mapped["Region"] = relationship(
         "Region",
-        back_populates="communes"
+        back_populates="communes",
+        lazy=LAZY
     )
 
     # Relations vers autres tables (définies dans les autres modules)
     utilisateurs: Mapped[List["Utilisateur"]] = relationship(
         "Utilisateur",
-        back_populates="commune"
+        back_populates="commune",
+        lazy=LAZY
     )
     donnees_recettes: Mapped[List["DonneesRecettes"]] = relationship(
         "DonneesRecettes",
-        back_populates="commune"
+        back_populates="commune",
+        lazy=LAZY
     )
     donnees_depenses: Mapped[List["DonneesDepenses"]] = relationship(
         "DonneesDepenses",
-        back_populates="commune"
+        back_populates="commune",
+        lazy=LAZY
     )
     projets_communes: Mapped[List["ProjetCommune"]] = relationship(
         "ProjetCommune",
-        back_populates="commune"
+        back_populates="commune",
+        lazy=LAZY
     )
     revenus_miniers: Mapped[List["RevenuMinier"]] = relationship(
         "RevenuMinier",
-        back_populates="commune"
+        back_populates="commune",
+        lazy=LAZY
     )
     documents: Mapped[List["Document"]] = relationship(
         "Document",
-        back_populates="commune"
+        back_populates="commune",
+        lazy=LAZY
     )
     pages_compte_administratif: Mapped[List["PageCompteAdministratif"]] = relationship(
         "PageCompteAdministratif",
-        back_populates="commune"
+        back_populates="commune",
+        lazy=LAZY
     )
     statistiques_visites: Mapped[List["StatistiqueVisite"]] = relationship(
         "StatistiqueVisite",
-        back_populates="commune"
+        back_populates="commune",
+        lazy=LAZY
     )
 
-    def __repr__(self) -> str:
-        return f"<Commune(id={self.id}, code='{self.code}', nom='{self.nom}')>"
+    @classmethod
+    def with_full_detail(cls) -> tuple:
+        """Options de chargement pour le détail : région et province."""
+        return (joinedload(cls.region).joinedload(Region.province),)
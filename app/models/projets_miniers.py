@@ -8,13 +8,13 @@ from decimal import Decimal
 from typing import TYPE_CHECKING, List, Optional
 
 from sqlalchemy import (
-    Boolean, Date, Enum, ForeignKey, Index, Integer,
-    Numeric, String, Text, UniqueConstraint
+    Boolean, Column, Computed, Date, Enum, ForeignKey, Index, Integer, MetaData,
+    Numeric, String, Table, Text, UniqueConstraint
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, joinedload, mapped_column, relationship, selectinload
 
 from app.database import Base
-from app.models.base import TimestampMixin
+from app.models.base import LAZY, TimestampMixin
 from app.models.enums import StatutProjetMinier, TypeRevenuMinier
 
 if TYPE_CHECKING:
@@ -44,7 +44,8 @@ class SocieteMiniere(Base, TimestampMixin):
     # Relations
     projets: Mapped[List["ProjetMinier"]] = relationship(
         "ProjetMinier",
-        back_populates="societe"
+        back_populates="societe",
+        lazy=LAZY
     )
 
     def __repr__(self) -> str:
@@ -80,21 +81,32 @@ class ProjetMinier(Base, TimestampMixin):
     # Relations
     societe: Mapped["SocieteMiniere"] = relationship(
         "SocieteMiniere",
-        back_populates="projets"
+        back_populates="projets",
+        lazy=LAZY
     )
     projets_communes: Mapped[List["ProjetCommune"]] = relationship(
         "ProjetCommune",
         back_populates="projet",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        lazy=LAZY
     )
     revenus_miniers: Mapped[List["RevenuMinier"]] = relationship(
         "RevenuMinier",
-        back_populates="projet"
+        back_populates="projet",
+        lazy=LAZY
     )
 
     def __repr__(self) -> str:
         return f"<ProjetMinier(id={self.id}, nom='{self.nom}')>"
 
+    @classmethod
+    def with_full_detail(cls) -> tuple:
+        """Options de chargement pour le détail : société et communes impactées."""
+        return (
+            joinedload(cls.societe),
+            selectinload(cls.projets_communes).joinedload(ProjetCommune.commune),
+        )
+
     @property
     def communes(self) -> List["Commune"]:
         """Retourne la liste des communes impactées."""
@@ -135,11 +147,13 @@ class ProjetCommune(Base):
     # Relations
     projet: Mapped["ProjetMinier"] = relationship(
         "ProjetMinier",
-        back_populates="projets_communes"
+        back_populates="projets_communes",
+        lazy=LAZY
     )
     commune: Mapped["Commune"] = relationship(
         "Commune",
-        back_populates="projets_communes"
+        back_populates="projets_communes",
+        lazy=LAZY
     )
 
     def __repr__(self) -> str:
@@ -153,11 +167,24 @@ class RevenuMinier(Base, TimestampMixin):
     """
     __tablename__ = "revenus_miniers"
     __table_args__ = (
-        Index("idx_revenus_miniers_commune", "commune_id"),
-        Index("idx_revenus_miniers_exercice", "exercice_id"),
+        # Index couvrants des agrégations (commune/exercice, exercice/type) :
+        # les montants sont lus depuis l'index (index-only scan).
+        # Ils remplacent les index simples sur commune_id et exercice_id.
+        Index(
+            "idx_revenus_miniers_commune_exercice",
+            "commune_id", "exercice_id", "type_revenu",
+            postgresql_include=["montant_prevu", "montant_recu"]
+        ),
+        Index(
+            "idx_revenus_miniers_exercice_type",
+            "exercice_id", "type_revenu",
+            postgresql_include=["commune_id", "montant_prevu", "montant_recu"]
+        ),
         Index("idx_revenus_miniers_projet", "projet_id"),
+        Index("idx_revenus_miniers_compte", "compte_code", postgresql_where="compte_code IS NOT NULL"),
         Index("idx_revenus_miniers_type", "type_revenu"),
         Index("idx_revenus_miniers_compte_admin", "compte_administratif_id"),
+        Index("idx_revenus_miniers_ecart", "ecart"),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -188,6 +215,20 @@ class RevenuMinier(Base, TimestampMixin):
         Numeric(18, 2),
         default=Decimal("0.00")
     )
+    # Colonnes calculées et stockées par PostgreSQL (GENERATED ALWAYS AS ... STORED)
+    ecart: Mapped[Decimal] = mapped_column(
+        Numeric(18, 2),
+        Computed("COALESCE(montant_recu, 0) - COALESCE(montant_prevu, 0)", persisted=True)
+    )
+    # NUMERIC sans précision : le taux n'est pas borné (montant reçu >> montant prévu)
+    taux_realisation: Mapped[Decimal] = mapped_column(
+        Numeric,
+        Computed(
+            "CASE WHEN montant_prevu > 0 "
+            "THEN ROUND(COALESCE(montant_recu, 0) / montant_prevu * 100, 2) ELSE 0 END",
+            persisted=True
+        )
+    )
     date_reception: Mapped[Optional[date]] = mapped_column(Date, nullable=True)
     reference_paiement: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
     compte_code: Mapped[str] = mapped_column(
@@ -205,36 +246,58 @@ class RevenuMinier(Base, TimestampMixin):
     # Relations
     commune: Mapped["Commune"] = relationship(
         "Commune",
-        back_populates="revenus_miniers"
+        back_populates="revenus_miniers",
+        lazy=LAZY
     )
     exercice: Mapped["Exercice"] = relationship(
         "Exercice",
-        back_populates="revenus_miniers"
+        back_populates="revenus_miniers",
+        lazy=LAZY
     )
     projet: Mapped["ProjetMinier"] = relationship(
         "ProjetMinier",
-        back_populates="revenus_miniers"
+        back_populates="revenus_miniers",
+        lazy=LAZY
     )
     compte: Mapped["PlanComptable"] = relationship(
         "PlanComptable",
-        back_populates="revenus_miniers"
+        back_populates="revenus_miniers",
+        lazy=LAZY
     )
     compte_administratif: Mapped["CompteAdministratif"] = relationship(
         "CompteAdministratif",
-        back_populates="revenus_miniers"
+        back_populates="revenus_miniers",
+        lazy=LAZY
     )
 
     def __repr__(self) -> str:
         return f"<RevenuMinier(id={self.id}, type='{self.type_revenu.value}', commune_id={self.commune_id})>"
 
-    @property
-    def ecart(self) -> Decimal:
-        """Calcule l'écart entre prévu et reçu."""
-        return self.montant_recu - self.montant_prevu
+    @classmethod
+    def with_full_detail(cls) -> tuple:
+        """Options de chargement pour le détail : commune, exercice, projet et compte."""
+        return (
+            joinedload(cls.commune),
+            joinedload(cls.exercice),
+            joinedload(cls.projet),
+            joinedload(cls.compte),
+        )
 
-    @property
-    def taux_realisation(self) -> Decimal:
-        """Calcule le taux de réalisation en pourcentage."""
-        if self.montant_prevu > 0:
-            return (self.montant_recu / self.montant_prevu) * 100
-        return Decimal("0.00")
+
+# Vue matérialisée mv_revenus_miniers_commune_exercice (voir schema.sql).
+# Déclarée hors de Base.metadata : create_all ne doit jamais la créer comme une table.
+revenus_miniers_agreges = Table(
+    "mv_revenus_miniers_commune_exercice",
+    MetaData(),
+    Column("commune_id", Integer, primary_key=True),
+    Column("exercice_id", Integer, primary_key=True),
+    Column(
+        "type_revenu",
+        Enum(TypeRevenuMinier, name="type_revenu_minier", create_type=False, values_callable=lambda x: [e.value for e in x]),
+        primary_key=True
+    ),
+    Column("nb_revenus", Integer),
+    Column("total_prevu", Numeric(18, 2)),
+    Column("total_recu", Numeric(18, 2)),
+    info={"is_view": True},
+)
@@ -6,11 +6,14 @@ Utilisateur and Session tables.
 from datetime import datetime
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import Boolean, DateTime, Enum, ForeignKey, Index, Integer, String, Text
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy import (
+    Boolean, DateTime, Enum, ForeignKey, Index, Integer, LargeBinary, String, Text, case, func, text
+)
+from sqlalchemy.ext.hybrid import hybrid_property
+from sqlalchemy.orm import Mapped, joinedload, mapped_column, relationship
 
 from app.database import Base
-from app.models.base import TimestampMixin
+from app.models.base import LAZY, TimestampMixin
 from app.models.enums import RoleUtilisateur
 
 if TYPE_CHECKING:
@@ -28,13 +31,16 @@ class Utilisateur(Base, TimestampMixin):
     """
     __tablename__ = "utilisateurs"
     __table_args__ = (
-        Index("idx_utilisateurs_email", "email"),
+        Index("uk_utilisateurs_email_lower", text("lower(email)"), unique=True),
         Index("idx_utilisateurs_commune", "commune_id"),
-        Index("idx_utilisateurs_role", "role"),
     )
+    # created_at / updated_at relus via RETURNING lors du flush : la réponse de
+    # connexion les lit sans SELECT supplémentaire (AuthService.login)
+    __mapper_args__ = {"eager_defaults": True}
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
-    email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
+    # Unicité insensible à la casse : index uk_utilisateurs_email_lower
+    email: Mapped[str] = mapped_column(String(255), nullable=False)
     mot_de_passe_hash: Mapped[str] = mapped_column(String(255), nullable=False)
     nom: Mapped[str] = mapped_column(String(100), nullable=False)
     prenom: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
@@ -63,71 +69,106 @@ class Utilisateur(Base, TimestampMixin):
     # Relations
     commune: Mapped[Optional["Commune"]] = relationship(
         "Commune",
-        back_populates="utilisateurs"
+        back_populates="utilisateurs",
+        lazy=LAZY
     )
     sessions: Mapped[List["Session"]] = relationship(
         "Session",
         back_populates="utilisateur",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy=LAZY
     )
 
     # Relations vers tables avec valide_par
     recettes_validees: Mapped[List["DonneesRecettes"]] = relationship(
         "DonneesRecettes",
         back_populates="validateur",
-        foreign_keys="DonneesRecettes.valide_par"
+        foreign_keys="DonneesRecettes.valide_par",
+        lazy=LAZY
     )
     depenses_validees: Mapped[List["DonneesDepenses"]] = relationship(
         "DonneesDepenses",
         back_populates="validateur",
-        foreign_keys="DonneesDepenses.valide_par"
+        foreign_keys="DonneesDepenses.valide_par",
+        lazy=LAZY
     )
 
     # Relations vers documents uploadés
     documents_uploades: Mapped[List["Document"]] = relationship(
         "Document",
         back_populates="uploadeur",
-        foreign_keys="Document.uploade_par"
+        foreign_keys="Document.uploade_par",
+        lazy=LAZY
     )
 
     # Relations vers pages CMS
     pages_creees: Mapped[List["PageCompteAdministratif"]] = relationship(
         "PageCompteAdministratif",
         back_populates="createur",
-        foreign_keys="PageCompteAdministratif.cree_par"
+        foreign_keys="PageCompteAdministratif.cree_par",
+        lazy=LAZY
     )
     pages_modifiees: Mapped[List["PageCompteAdministratif"]] = relationship(
         "PageCompteAdministratif",
         back_populates="modificateur",
-        foreign_keys="PageCompteAdministratif.modifie_par"
+        foreign_keys="PageCompteAdministratif.modifie_par",
+        lazy=LAZY
     )
 
     # Relations vers audit log
     audit_logs: Mapped[List["AuditLog"]] = relationship(
         "AuditLog",
-        back_populates="utilisateur"
+        back_populates="utilisateur",
+        lazy=LAZY
     )
 
     def __repr__(self) -> str:
         return f"<Utilisateur(id={self.id}, email='{self.email}', role='{self.role.value}')>"
 
-    @property
+    # Propriétés hybrides : calcul Python sur une instance chargée, expression SQL
+    # au niveau de la classe (projection ou filtre sans charger les objets)
+
+    @hybrid_property
     def nom_complet(self) -> str:
         """Retourne le nom complet de l'utilisateur."""
         if self.prenom:
             return f"{self.prenom} {self.nom}"
         return self.nom
 
-    @property
+    @nom_complet.inplace.expression
+    @classmethod
+    def _nom_complet_expression(cls):
+        return case(
+            (func.coalesce(cls.prenom, "") != "", cls.prenom + " " + cls.nom),
+            else_=cls.nom,
+        )
+
+    @hybrid_property
     def is_admin(self) -> bool:
         """Vérifie si l'utilisateur est admin."""
         return self.role == RoleUtilisateur.ADMIN
 
-    @property
+    @hybrid_property
     def is_editor(self) -> bool:
         """Vérifie si l'utilisateur peut éditer (admin ou éditeur)."""
         return self.role in (RoleUtilisateur.ADMIN, RoleUtilisateur.EDITEUR)
 
+    @is_editor.inplace.expression
+    @classmethod
+    def _is_editor_expression(cls):
+        return cls.role.in_((RoleUtilisateur.ADMIN, RoleUtilisateur.EDITEUR))
+
+    @classmethod
+    def with_full_detail(cls) -> tuple:
+        """Options de chargement pour le détail : commune de rattachement."""
+        return (joinedload(cls.commune),)
+
+    @classmethod
+    def par_email(cls, email: str):
+        """Condition de recherche par email, insensible à la casse (index uk_utilisateurs_email_lower)."""
+        return func.lower(cls.email) == email.lower()
+
 
 class Session(Base):
     """
@@ -137,8 +178,19 @@ class Session(Base):
     __tablename__ = "sessions"
     __table_args__ = (
         Index("idx_sessions_utilisateur", "utilisateur_id"),
-        Index("idx_sessions_token", "refresh_token"),
-        Index("idx_sessions_expires", "expires_at"),
+        # Index couvrant : la vérification d'un refresh token est un index-only scan
+        Index(
+            "uk_sessions_token_hash",
+            "refresh_token_hash",
+            unique=True,
+            postgresql_include=["id", "utilisateur_id"]
+        ),
+        Index(
+            "idx_sessions_expires_brin",
+            "expires_at",
+            postgresql_using="brin",
+            postgresql_with={"pages_per_range": 32}
+        ),
     )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
@@ -147,20 +199,23 @@ class Session(Base):
         ForeignKey("utilisateurs.id", ondelete="CASCADE"),
         nullable=False
     )
-    refresh_token: Mapped[str] = mapped_column(String(500), nullable=False)
+    # Empreinte BLAKE2b-256 du refresh token (32 octets) : le token lui-même n'est
+    # jamais stocké, et l'index porte sur une clé courte de taille fixe
+    refresh_token_hash: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
     expires_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     ip_address: Mapped[Optional[str]] = mapped_column(String(45), nullable=True)
     user_agent: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        default=func.now(),
         nullable=False
     )
 
     # Relations
     utilisateur: Mapped["Utilisateur"] = relationship(
         "Utilisateur",
-        back_populates="sessions"
+        back_populates="sessions",
+        lazy=LAZY
     )
 
     def __repr__(self) -> str:
@@ -8,9 +8,12 @@ from app.schemas.base import (
     BaseSchema,
     ErrorDetail,
     Message,
+    MontantAffiche,
     PaginatedResponse,
+    ReadSchema,
     SuccessResponse,
     TimestampSchema,
+    dump_list_json,
 )
 
 # Geographic schemas
@@ -64,18 +67,24 @@ from app.schemas.comptabilite import (
 
 # Table display schemas
 from app.schemas.tableau import (
+    ColonnesDepenses,
+    ColonnesRecettes,
     ComparaisonExercices,
     LigneDepenses,
     LigneEquilibre,
     LigneRecettes,
     ResumeFinancier,
+    SectionDepensesColonnes,
+    SectionRecettesColonnes,
     SectionTableauDepenses,
     SectionTableauRecettes,
     StatistiquesRegion,
     TableauComplet,
     TableauDepenses,
+    TableauDepensesColonnes,
     TableauEquilibre,
     TableauRecettes,
+    TableauRecettesColonnes,
 )
 
 # Mining project schemas
@@ -182,9 +191,12 @@ __all__ = [
     "BaseSchema",
     "TimestampSchema",
     "PaginatedResponse",
+    "ReadSchema",
     "Message",
     "ErrorDetail",
     "SuccessResponse",
+    "MontantAffiche",
+    "dump_list_json",
     # Geographie
     "ProvinceCreate",
     "ProvinceUpdate",
@@ -232,10 +244,16 @@ __all__ = [
     "LigneRecettes",
     "LigneDepenses",
     "LigneEquilibre",
+    "ColonnesRecettes",
+    "ColonnesDepenses",
     "SectionTableauRecettes",
     "SectionTableauDepenses",
+    "SectionRecettesColonnes",
+    "SectionDepensesColonnes",
     "TableauRecettes",
     "TableauDepenses",
+    "TableauRecettesColonnes",
+    "TableauDepensesColonnes",
     "TableauEquilibre",
     "TableauComplet",
     "ResumeFinancier",
@@ -3,13 +3,40 @@ Pydantic schemas for authentication.
 Token, User schemas.
 """
 
+import re
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
-from pydantic import EmailStr, Field, field_validator
+from pydantic import AfterValidator, EmailStr, Field
 
 from app.models.enums import RoleUtilisateur
-from app.schemas.base import BaseSchema, TimestampSchema
+from app.schemas.base import BaseSchema, ReadSchema, Str100, TimestampSchema, make_partial
+
+
+# =====================
+# Password Types
+# =====================
+
+# Majuscule, minuscule et chiffre en une seule passe sur la chaîne
+_STRONG_PASSWORD_RE = re.compile(r"(?=.*[A-Z])(?=.*[a-z])(?=.*\d)", re.DOTALL)
+
+
+def _check_password_strength(v: str) -> str:
+    """Validate password strength (detailed message only on failure)."""
+    if _STRONG_PASSWORD_RE.match(v):
+        return v
+    if not any(c.isupper() for c in v):
+        raise ValueError("Le mot de passe doit contenir au moins une majuscule")
+    if not any(c.islower() for c in v):
+        raise ValueError("Le mot de passe doit contenir au moins une minuscule")
+    raise ValueError("Le mot de passe doit contenir au moins un chiffre")
+
+
+# Mot de passe saisi par l'utilisateur : 8 à 100 caractères
+Password = Annotated[str, Field(min_length=8, max_length=100)]
+
+# Mot de passe avec exigences de complexité
+StrongPassword = Annotated[Password, AfterValidator(_check_password_strength)]
 
 
 # =====================
@@ -63,26 +90,12 @@ class UserLoginResponse(BaseSchema):
 class UserRegister(BaseSchema):
     """User registration (admin only)."""
     email: EmailStr
-    password: str = Field(..., min_length=8, max_length=100)
+    password: StrongPassword
     nom: str = Field(..., min_length=1, max_length=100)
-    prenom: Optional[str] = Field(None, max_length=100)
+    prenom: Optional[Str100] = None
     role: RoleUtilisateur = RoleUtilisateur.LECTEUR
     commune_id: Optional[int] = None
 
-    @field_validator("password")
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Le mot de passe doit contenir au moins 8 caractères")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Le mot de passe doit contenir au moins une majuscule")
-        if not any(c.islower() for c in v):
-            raise ValueError("Le mot de passe doit contenir au moins une minuscule")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Le mot de passe doit contenir au moins un chiffre")
-        return v
-
 
 # =====================
 # User CRUD Schemas
@@ -90,9 +103,10 @@ class UserRegister(BaseSchema):
 
 class UserBase(BaseSchema):
     """Base user schema."""
-    email: EmailStr
+    # Lecture seule (UserRead) : l'email a été validé à l'écriture
+    email: str
     nom: str = Field(..., min_length=1, max_length=100)
-    prenom: Optional[str] = Field(None, max_length=100)
+    prenom: Optional[Str100] = None
     role: RoleUtilisateur = RoleUtilisateur.LECTEUR
     commune_id: Optional[int] = None
     actif: bool = True
@@ -102,32 +116,23 @@ class UserBase(BaseSchema):
 class UserCreate(BaseSchema):
     """Schema for creating a user."""
     email: EmailStr
-    password: str = Field(..., min_length=8, max_length=100)
+    password: Password
     nom: str = Field(..., min_length=1, max_length=100)
-    prenom: Optional[str] = Field(None, max_length=100)
+    prenom: Optional[Str100] = None
     role: RoleUtilisateur = RoleUtilisateur.LECTEUR
     commune_id: Optional[int] = None
 
-    @field_validator("password")
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Le mot de passe doit contenir au moins 8 caractères")
-        return v
-
 
-class UserUpdate(BaseSchema):
-    """Schema for updating a user."""
-    email: Optional[EmailStr] = None
-    nom: Optional[str] = Field(None, min_length=1, max_length=100)
-    prenom: Optional[str] = Field(None, max_length=100)
-    role: Optional[RoleUtilisateur] = None
-    commune_id: Optional[int] = None
-    actif: Optional[bool] = None
+UserUpdate = make_partial(
+    UserBase,
+    "UserUpdate",
+    "Schema for updating a user.",
+    exclude=("email_verifie",),
+    email=(Optional[EmailStr], None),
+)
 
 
-class UserRead(UserBase, TimestampSchema):
+class UserRead(UserBase, TimestampSchema, ReadSchema):
     """Schema for reading a user."""
     id: int
     derniere_connexion: Optional[datetime] = None
@@ -137,7 +142,7 @@ class UserRead(UserBase, TimestampSchema):
     is_editor: Optional[bool] = None
 
 
-class UserList(BaseSchema):
+class UserList(ReadSchema):
     """Simplified schema for listing users."""
     id: int
     email: str
@@ -160,21 +165,7 @@ class UserWithCommune(UserRead):
 class PasswordChange(BaseSchema):
     """Schema for changing password."""
     current_password: str
-    new_password: str = Field(..., min_length=8, max_length=100)
-
-    @field_validator("new_password")
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Le mot de passe doit contenir au moins 8 caractères")
-        if not any(c.isupper() for c in v):
-            raise ValueError("Le mot de passe doit contenir au moins une majuscule")
-        if not any(c.islower() for c in v):
-            raise ValueError("Le mot de passe doit contenir au moins une minuscule")
-        if not any(c.isdigit() for c in v):
-            raise ValueError("Le mot de passe doit contenir au moins un chiffre")
-        return v
+    new_password: StrongPassword
 
 
 class PasswordReset(BaseSchema):
@@ -185,22 +176,14 @@ class PasswordReset(BaseSchema):
 class PasswordResetConfirm(BaseSchema):
     """Schema for confirming password reset."""
     token: str
-    new_password: str = Field(..., min_length=8, max_length=100)
-
-    @field_validator("new_password")
-    @classmethod
-    def validate_password(cls, v: str) -> str:
-        """Validate password strength."""
-        if len(v) < 8:
-            raise ValueError("Le mot de passe doit contenir au moins 8 caractères")
-        return v
+    new_password: Password
 
 
 # =====================
 # Session Schemas
 # =====================
 
-class SessionRead(BaseSchema):
+class SessionRead(ReadSchema):
     """Schema for reading a session."""
     id: int
     ip_address: Optional[str] = None
@@ -210,7 +193,7 @@ class SessionRead(BaseSchema):
     is_expired: bool
 
 
-class SessionList(BaseSchema):
+class SessionList(ReadSchema):
     """Schema for listing sessions."""
     id: int
     ip_address: Optional[str] = None
@@ -3,9 +3,73 @@ Base Pydantic configuration and shared schemas.
 """
 
 from datetime import datetime
-from typing import Any, Generic, List, Optional, TypeVar
-
-from pydantic import BaseModel, ConfigDict
+from decimal import Decimal
+from functools import cache, lru_cache
+from typing import Annotated, Any, ClassVar, Final, Generic, List, Optional, TypeVar
+
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    StringConstraints,
+    TypeAdapter,
+    create_model,
+)
+from typing_extensions import Self
+
+_MISSING = object()
+
+# Chaînes bornées partagées par les schémas (une seule définition par longueur)
+Str10 = Annotated[str, StringConstraints(max_length=10)]
+Str50 = Annotated[str, StringConstraints(max_length=50)]
+Str100 = Annotated[str, StringConstraints(max_length=100)]
+Str200 = Annotated[str, StringConstraints(max_length=200)]
+Str255 = Annotated[str, StringConstraints(max_length=255)]
+Str500 = Annotated[str, StringConstraints(max_length=500)]
+
+# Codes, noms et libellés obligatoires (non vides)
+Code10 = Annotated[str, StringConstraints(min_length=1, max_length=10)]
+Code20 = Annotated[str, StringConstraints(min_length=1, max_length=20)]
+Nom100 = Annotated[str, StringConstraints(min_length=1, max_length=100)]
+Nom150 = Annotated[str, StringConstraints(min_length=1, max_length=150)]
+Nom200 = Annotated[str, StringConstraints(min_length=1, max_length=200)]
+Libelle255 = Annotated[str, StringConstraints(min_length=1, max_length=255)]
+
+# Nombres bornés partagés (montants, pourcentages, niveaux du plan comptable)
+MontantPositif = Annotated[Decimal, Field(ge=0)]
+Pourcentage = Annotated[Decimal, Field(ge=0, le=100)]
+EntierPositif = Annotated[int, Field(ge=0)]
+NiveauCompte = Annotated[int, Field(ge=1, le=3)]
+
+# Zéro monétaire partagé par défaut des champs Decimal (immuable : partage sûr)
+ZERO_DEC: Final[Decimal] = Decimal("0.00")
+
+# Montant ou taux en lecture seule : float (validation et JSON plus rapides que
+# Decimal), arrondi au centime à la sortie. Les schémas d'écriture gardent Decimal.
+MontantAffiche = Annotated[
+    float, PlainSerializer(lambda v: round(float(v), 2), return_type=float)
+]
+
+
+
+def _centimes_json(centimes: int) -> str:
+    """Centimes rendus comme un Decimal à deux décimales (ex. "-1234.50")."""
+    signe = "-" if centimes < 0 else ""
+    unites, reste = divmod(abs(centimes), 100)
+    return f"{signe}{unites}.{reste:02d}"
+
+
+# Montant en centimes entiers : additions exactes, validation et sérialisation
+# plus rapides que Decimal. Le JSON reste celui d'un Decimal à deux décimales.
+Centimes = Annotated[
+    int, PlainSerializer(_centimes_json, return_type=str, when_used="json")
+]
+
+
+def en_centimes(montant: Optional[Decimal]) -> int:
+    """Montant en unités (colonne Numeric à deux décimales) converti en centimes."""
+    return int(montant * 100) if montant else 0
 
 
 class BaseSchema(BaseModel):
@@ -17,6 +81,42 @@ class BaseSchema(BaseModel):
         use_enum_values=True,
     )
 
+    # Noms des champs, figés une fois la classe construite (from_orm_trusted)
+    __trusted_fields__: ClassVar[tuple[str, ...]] = ()
+
+    @classmethod
+    def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+        super().__pydantic_init_subclass__(**kwargs)
+        cls.__trusted_fields__ = tuple(cls.model_fields)
+
+    @classmethod
+    def from_orm_trusted(cls, obj: Any, **values: Any) -> Self:
+        """
+        Build a response schema from a trusted ORM object without validation.
+
+        Fields missing from `values` are read from `obj` attributes, then
+        from field defaults. Reserved for flat output schemas: input data
+        must go through model_validate.
+        """
+        for name in cls.__trusted_fields__:
+            if name not in values:
+                value = getattr(obj, name, _MISSING)
+                if value is not _MISSING:
+                    values[name] = value
+        return cls.model_construct(**values)
+
+
+class ReadSchema(BaseSchema):
+    """
+    Base for response-only schemas (*Read, *List, *WithStats...).
+
+    Instances are never modified once built, and the core schema is only
+    built on first use, so workers that never serve a schema skip its cost.
+    Nested instances (sections of a page, société of a project...) are
+    taken as they are, never validated again.
+    """
+    model_config = ConfigDict(frozen=True, defer_build=True, revalidate_instances="never")
+
 
 class TimestampSchema(BaseSchema):
     """Schema with timestamp fields."""
@@ -24,6 +124,41 @@ class TimestampSchema(BaseSchema):
     updated_at: Optional[datetime] = None
 
 
+@cache
+def make_partial(
+    model: type[BaseModel],
+    name: str,
+    doc: Optional[str] = None,
+    exclude: tuple[str, ...] = (),
+    **overrides: Any,
+) -> type[BaseSchema]:
+    """
+    Build an update schema from `model`: same fields and constraints, all
+    optional with a None default, except those in `exclude`.
+
+    `overrides` replace a field definition, as (annotation, default) like
+    create_model. The model's validators are not carried over: a partial
+    payload only checks the fields it sends.
+    """
+    champs = {}
+    for nom, champ in model.model_fields.items():
+        if nom in exclude:
+            continue
+        annotation = (
+            Annotated[(champ.annotation, *champ.metadata)] if champ.metadata else champ.annotation
+        )
+        champs[nom] = (Optional[annotation], Field(None, description=champ.description))
+    champs.update(overrides)
+
+    return create_model(
+        name,
+        __base__=BaseSchema,
+        __module__=model.__module__,
+        __doc__=doc,
+        **champs,
+    )
+
+
 # Generic type for pagination
 T = TypeVar("T")
 
@@ -54,6 +189,46 @@ class PaginatedResponse(BaseModel, Generic[T]):
             pages=pages
         )
 
+    @classmethod
+    def dump_json(
+        cls,
+        items: List[T],
+        total: int,
+        page: int,
+        page_size: int
+    ) -> bytes:
+        """
+        Page serialized to JSON bytes by pydantic-core, without validation.
+
+        Call on the parametrized class (PaginatedResponse[Item].dump_json)
+        and return the bytes in a Response with media_type="application/json":
+        FastAPI then neither re-validates nor re-encodes the page.
+        """
+        pages = (total + page_size - 1) // page_size if page_size > 0 else 0
+        return _adapter(cls).dump_json(cls.model_construct(
+            items=items,
+            total=total,
+            page=page,
+            page_size=page_size,
+            pages=pages
+        ))
+
+
+@lru_cache(maxsize=None)
+def _adapter(type_: Any) -> TypeAdapter:
+    """TypeAdapter for a type, built once and reused across requests."""
+    return TypeAdapter(type_)
+
+
+def dump_list_json(item_type: type[T], items: List[T]) -> bytes:
+    """
+    List of response items serialized to JSON bytes in one pass.
+
+    Meant to be returned in a Response with media_type="application/json",
+    so that FastAPI does not dump, re-validate and encode the items again.
+    """
+    return _adapter(List[item_type]).dump_json(items)
+
 
 class Message(BaseSchema):
     """Simple message response."""
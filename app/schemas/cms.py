@@ -6,10 +6,10 @@ PageCompteAdministratif, SectionCMS, and content blocks.
 from datetime import date, datetime
 from typing import Any, Dict, List, Optional
 
-from pydantic import Field, HttpUrl
+from pydantic import Field
 
 from app.models.enums import StatutPublication, TypeCarte, TypeSectionCMS
-from app.schemas.base import BaseSchema, TimestampSchema
+from app.schemas.base import BaseSchema, ReadSchema, Str100, Str255, Str50, Str500, TimestampSchema, make_partial
 
 
 # =====================
@@ -21,7 +21,7 @@ class BoutonSchema(BaseSchema):
     texte: str = Field(..., max_length=100)
     url: str = Field(..., max_length=500)
     type: str = Field(default="primary", max_length=50)  # primary, secondary, outline
-    icone: Optional[str] = Field(None, max_length=50)
+    icone: Optional[Str50] = None
     ouvrir_nouvel_onglet: bool = True
 
 
@@ -40,13 +40,18 @@ class ContenuEditorJSCreate(ContenuEditorJSBase):
     section_id: int
 
 
-class ContenuEditorJSUpdate(BaseSchema):
-    """Schema for updating EditorJS content."""
-    contenu: Optional[Dict[str, Any]] = None
+ContenuEditorJSUpdate = make_partial(
+    ContenuEditorJSBase,
+    "ContenuEditorJSUpdate",
+    "Schema for updating EditorJS content.",
+    exclude=("version",),
+)
 
 
-class ContenuEditorJSRead(ContenuEditorJSBase, TimestampSchema):
+class ContenuEditorJSRead(ContenuEditorJSBase, TimestampSchema, ReadSchema):
     """Schema for reading EditorJS content."""
+    # JSONB relu tel quel depuis la base : pas de validation ni de copie du document
+    contenu: Any
     id: int
     section_id: int
 
@@ -57,18 +62,18 @@ class ContenuEditorJSRead(ContenuEditorJSBase, TimestampSchema):
 
 class BlocImageTexteBase(BaseSchema):
     """Base schema for image-text block."""
-    titre: Optional[str] = Field(None, max_length=255)
-    sous_titre: Optional[str] = Field(None, max_length=255)
+    titre: Optional[Str255] = None
+    sous_titre: Optional[Str255] = None
     contenu: Optional[str] = None
     contenu_html: Optional[str] = None
     image_url: str = Field(..., max_length=500)
-    image_alt: Optional[str] = Field(None, max_length=255)
-    legende_image: Optional[str] = Field(None, max_length=500)
+    image_alt: Optional[Str255] = None
+    legende_image: Optional[Str500] = None
     boutons: List[BoutonSchema] = []
     note: Optional[str] = None
-    note_source: Optional[str] = Field(None, max_length=255)
-    couleur_fond: Optional[str] = Field(None, max_length=50)
-    icone_titre: Optional[str] = Field(None, max_length=50)
+    note_source: Optional[Str255] = None
+    couleur_fond: Optional[Str50] = None
+    icone_titre: Optional[Str50] = None
 
 
 class BlocImageTexteCreate(BlocImageTexteBase):
@@ -76,23 +81,14 @@ class BlocImageTexteCreate(BlocImageTexteBase):
     section_id: int
 
 
-class BlocImageTexteUpdate(BaseSchema):
-    """Schema for updating image-text block."""
-    titre: Optional[str] = Field(None, max_length=255)
-    sous_titre: Optional[str] = Field(None, max_length=255)
-    contenu: Optional[str] = None
-    contenu_html: Optional[str] = None
-    image_url: Optional[str] = Field(None, max_length=500)
-    image_alt: Optional[str] = Field(None, max_length=255)
-    legende_image: Optional[str] = Field(None, max_length=500)
-    boutons: Optional[List[BoutonSchema]] = None
-    note: Optional[str] = None
-    note_source: Optional[str] = Field(None, max_length=255)
-    couleur_fond: Optional[str] = Field(None, max_length=50)
-    icone_titre: Optional[str] = Field(None, max_length=50)
+BlocImageTexteUpdate = make_partial(
+    BlocImageTexteBase,
+    "BlocImageTexteUpdate",
+    "Schema for updating image-text block.",
+)
 
 
-class BlocImageTexteRead(BlocImageTexteBase, TimestampSchema):
+class BlocImageTexteRead(BlocImageTexteBase, TimestampSchema, ReadSchema):
     """Schema for reading image-text block."""
     id: int
     section_id: int
@@ -105,10 +101,10 @@ class BlocImageTexteRead(BlocImageTexteBase, TimestampSchema):
 class BlocCarteFondBase(BaseSchema):
     """Base schema for background card block."""
     image_url: str = Field(..., max_length=500)
-    image_alt: Optional[str] = Field(None, max_length=255)
-    badge_texte: Optional[str] = Field(None, max_length=100)
-    badge_icone: Optional[str] = Field(None, max_length=50)
-    titre: Optional[str] = Field(None, max_length=255)
+    image_alt: Optional[Str255] = None
+    badge_texte: Optional[Str100] = None
+    badge_icone: Optional[Str50] = None
+    titre: Optional[Str255] = None
     contenu: Optional[str] = None
     boutons: List[BoutonSchema] = []
     hauteur_min: int = Field(default=400, ge=100, le=1000)
@@ -120,20 +116,14 @@ class BlocCarteFondCreate(BlocCarteFondBase):
     section_id: int
 
 
-class BlocCarteFondUpdate(BaseSchema):
-    """Schema for updating background card block."""
-    image_url: Optional[str] = Field(None, max_length=500)
-    image_alt: Optional[str] = Field(None, max_length=255)
-    badge_texte: Optional[str] = Field(None, max_length=100)
-    badge_icone: Optional[str] = Field(None, max_length=50)
-    titre: Optional[str] = Field(None, max_length=255)
-    contenu: Optional[str] = None
-    boutons: Optional[List[BoutonSchema]] = None
-    hauteur_min: Optional[int] = Field(None, ge=100, le=1000)
-    opacite_overlay: Optional[int] = Field(None, ge=0, le=100)
+BlocCarteFondUpdate = make_partial(
+    BlocCarteFondBase,
+    "BlocCarteFondUpdate",
+    "Schema for updating background card block.",
+)
 
 
-class BlocCarteFondRead(BlocCarteFondBase, TimestampSchema):
+class BlocCarteFondRead(BlocCarteFondBase, TimestampSchema, ReadSchema):
     """Schema for reading background card block."""
     id: int
     section_id: int
@@ -148,29 +138,29 @@ class CarteInformativeBase(BaseSchema):
     ordre: int = Field(default=0, ge=0)
     type_carte: TypeCarte = TypeCarte.IMAGE
     # Image content
-    image_url: Optional[str] = Field(None, max_length=500)
-    image_alt: Optional[str] = Field(None, max_length=255)
+    image_url: Optional[Str500] = None
+    image_alt: Optional[Str255] = None
     # Statistic content
-    stat_valeur: Optional[str] = Field(None, max_length=50)
-    stat_unite: Optional[str] = Field(None, max_length=50)
-    stat_evolution: Optional[str] = Field(None, max_length=50)
-    stat_icone: Optional[str] = Field(None, max_length=50)
+    stat_valeur: Optional[Str50] = None
+    stat_unite: Optional[Str50] = None
+    stat_evolution: Optional[Str50] = None
+    stat_icone: Optional[Str50] = None
     # Badge
-    badge_texte: Optional[str] = Field(None, max_length=100)
-    badge_icone: Optional[str] = Field(None, max_length=50)
-    badge_couleur: Optional[str] = Field(None, max_length=50)
+    badge_texte: Optional[Str100] = None
+    badge_icone: Optional[Str50] = None
+    badge_couleur: Optional[Str50] = None
     # Text
-    titre: Optional[str] = Field(None, max_length=255)
+    titre: Optional[Str255] = None
     description: Optional[str] = None
     # Link
-    lien_texte: Optional[str] = Field(None, max_length=100)
-    lien_url: Optional[str] = Field(None, max_length=500)
+    lien_texte: Optional[Str100] = None
+    lien_url: Optional[Str500] = None
     # Note
-    note: Optional[str] = Field(None, max_length=255)
+    note: Optional[Str255] = None
     # Style
-    couleur_fond: Optional[str] = Field(None, max_length=50)
-    couleur_gradient_debut: Optional[str] = Field(None, max_length=50)
-    couleur_gradient_fin: Optional[str] = Field(None, max_length=50)
+    couleur_fond: Optional[Str50] = None
+    couleur_gradient_debut: Optional[Str50] = None
+    couleur_gradient_fin: Optional[Str50] = None
 
 
 class CarteInformativeCreate(CarteInformativeBase):
@@ -178,30 +168,14 @@ class CarteInformativeCreate(CarteInformativeBase):
     section_id: int
 
 
-class CarteInformativeUpdate(BaseSchema):
-    """Schema for updating informative card."""
-    ordre: Optional[int] = Field(None, ge=0)
-    type_carte: Optional[TypeCarte] = None
-    image_url: Optional[str] = Field(None, max_length=500)
-    image_alt: Optional[str] = Field(None, max_length=255)
-    stat_valeur: Optional[str] = Field(None, max_length=50)
-    stat_unite: Optional[str] = Field(None, max_length=50)
-    stat_evolution: Optional[str] = Field(None, max_length=50)
-    stat_icone: Optional[str] = Field(None, max_length=50)
-    badge_texte: Optional[str] = Field(None, max_length=100)
-    badge_icone: Optional[str] = Field(None, max_length=50)
-    badge_couleur: Optional[str] = Field(None, max_length=50)
-    titre: Optional[str] = Field(None, max_length=255)
-    description: Optional[str] = None
-    lien_texte: Optional[str] = Field(None, max_length=100)
-    lien_url: Optional[str] = Field(None, max_length=500)
-    note: Optional[str] = Field(None, max_length=255)
-    couleur_fond: Optional[str] = Field(None, max_length=50)
-    couleur_gradient_debut: Optional[str] = Field(None, max_length=50)
-    couleur_gradient_fin: Optional[str] = Field(None, max_length=50)
+CarteInformativeUpdate = make_partial(
+    CarteInformativeBase,
+    "CarteInformativeUpdate",
+    "Schema for updating informative card.",
+)
 
 
-class CarteInformativeRead(CarteInformativeBase, TimestampSchema):
+class CarteInformativeRead(CarteInformativeBase, TimestampSchema, ReadSchema):
     """Schema for reading informative card."""
     id: int
     section_id: int
@@ -215,13 +189,13 @@ class PhotoGalerieBase(BaseSchema):
     """Base schema for gallery photo."""
     ordre: int = Field(default=0, ge=0)
     image_url: str = Field(..., max_length=500)
-    image_alt: Optional[str] = Field(None, max_length=255)
-    image_thumbnail_url: Optional[str] = Field(None, max_length=500)
-    titre: Optional[str] = Field(None, max_length=255)
-    description: Optional[str] = Field(None, max_length=500)
+    image_alt: Optional[Str255] = None
+    image_thumbnail_url: Optional[Str500] = None
+    titre: Optional[Str255] = None
+    description: Optional[Str500] = None
     date_prise: Optional[date] = None
-    lieu: Optional[str] = Field(None, max_length=255)
-    credit_photo: Optional[str] = Field(None, max_length=255)
+    lieu: Optional[Str255] = None
+    credit_photo: Optional[Str255] = None
 
 
 class PhotoGalerieCreate(PhotoGalerieBase):
@@ -229,20 +203,14 @@ class PhotoGalerieCreate(PhotoGalerieBase):
     section_id: int
 
 
-class PhotoGalerieUpdate(BaseSchema):
-    """Schema for updating gallery photo."""
-    ordre: Optional[int] = Field(None, ge=0)
-    image_url: Optional[str] = Field(None, max_length=500)
-    image_alt: Optional[str] = Field(None, max_length=255)
-    image_thumbnail_url: Optional[str] = Field(None, max_length=500)
-    titre: Optional[str] = Field(None, max_length=255)
-    description: Optional[str] = Field(None, max_length=500)
-    date_prise: Optional[date] = None
-    lieu: Optional[str] = Field(None, max_length=255)
-    credit_photo: Optional[str] = Field(None, max_length=255)
+PhotoGalerieUpdate = make_partial(
+    PhotoGalerieBase,
+    "PhotoGalerieUpdate",
+    "Schema for updating gallery photo.",
+)
 
 
-class PhotoGalerieRead(PhotoGalerieBase, TimestampSchema):
+class PhotoGalerieRead(PhotoGalerieBase, TimestampSchema, ReadSchema):
     """Schema for reading gallery photo."""
     id: int
     section_id: int
@@ -256,11 +224,11 @@ class LienUtileBase(BaseSchema):
     """Base schema for useful link."""
     ordre: int = Field(default=0, ge=0)
     titre: str = Field(..., min_length=1, max_length=255)
-    description: Optional[str] = Field(None, max_length=500)
+    description: Optional[Str500] = None
     url: str = Field(..., max_length=500)
-    icone: Optional[str] = Field(None, max_length=50)
-    couleur: Optional[str] = Field(None, max_length=50)
-    couleur_fond: Optional[str] = Field(None, max_length=50)
+    icone: Optional[Str50] = None
+    couleur: Optional[Str50] = None
+    couleur_fond: Optional[Str50] = None
     ouvrir_nouvel_onglet: bool = True
 
 
@@ -269,19 +237,14 @@ class LienUtileCreate(LienUtileBase):
     section_id: int
 
 
-class LienUtileUpdate(BaseSchema):
-    """Schema for updating useful link."""
-    ordre: Optional[int] = Field(None, ge=0)
-    titre: Optional[str] = Field(None, min_length=1, max_length=255)
-    description: Optional[str] = Field(None, max_length=500)
-    url: Optional[str] = Field(None, max_length=500)
-    icone: Optional[str] = Field(None, max_length=50)
-    couleur: Optional[str] = Field(None, max_length=50)
-    couleur_fond: Optional[str] = Field(None, max_length=50)
-    ouvrir_nouvel_onglet: Optional[bool] = None
+LienUtileUpdate = make_partial(
+    LienUtileBase,
+    "LienUtileUpdate",
+    "Schema for updating useful link.",
+)
 
 
-class LienUtileRead(LienUtileBase, TimestampSchema):
+class LienUtileRead(LienUtileBase, TimestampSchema, ReadSchema):
     """Schema for reading useful link."""
     id: int
     section_id: int
@@ -294,7 +257,7 @@ class LienUtileRead(LienUtileBase, TimestampSchema):
 class SectionCMSBase(BaseSchema):
     """Base schema for CMS section."""
     type_section: TypeSectionCMS
-    titre: Optional[str] = Field(None, max_length=255)
+    titre: Optional[Str255] = None
     ordre: int = Field(default=0, ge=0)
     visible: bool = True
     visible_accueil: bool = False
@@ -306,18 +269,16 @@ class SectionCMSCreate(SectionCMSBase):
     page_id: int
 
 
-class SectionCMSUpdate(BaseSchema):
-    """Schema for updating CMS section."""
-    type_section: Optional[TypeSectionCMS] = None
-    titre: Optional[str] = Field(None, max_length=255)
-    ordre: Optional[int] = Field(None, ge=0)
-    visible: Optional[bool] = None
-    visible_accueil: Optional[bool] = None
-    config: Optional[Dict[str, Any]] = None
+SectionCMSUpdate = make_partial(
+    SectionCMSBase,
+    "SectionCMSUpdate",
+    "Schema for updating CMS section.",
+)
 
 
-class SectionCMSRead(SectionCMSBase, TimestampSchema):
+class SectionCMSRead(SectionCMSBase, TimestampSchema, ReadSchema):
     """Schema for reading CMS section."""
+    config: Any = None
     id: int
     page_id: int
 
@@ -340,10 +301,10 @@ class PageCompteAdministratifBase(BaseSchema):
     """Base schema for administrative account page."""
     commune_id: int
     exercice_id: int
-    titre: Optional[str] = Field(None, max_length=255)
-    sous_titre: Optional[str] = Field(None, max_length=500)
+    titre: Optional[Str255] = None
+    sous_titre: Optional[Str500] = None
     meta_description: Optional[str] = None
-    image_hero_url: Optional[str] = Field(None, max_length=500)
+    image_hero_url: Optional[Str500] = None
     statut: StatutPublication = StatutPublication.BROUILLON
     afficher_tableau_financier: bool = True
     afficher_graphiques: bool = True
@@ -354,18 +315,15 @@ class PageCompteAdministratifCreate(PageCompteAdministratifBase):
     pass
 
 
-class PageCompteAdministratifUpdate(BaseSchema):
-    """Schema for updating administrative account page."""
-    titre: Optional[str] = Field(None, max_length=255)
-    sous_titre: Optional[str] = Field(None, max_length=500)
-    meta_description: Optional[str] = None
-    image_hero_url: Optional[str] = Field(None, max_length=500)
-    statut: Optional[StatutPublication] = None
-    afficher_tableau_financier: Optional[bool] = None
-    afficher_graphiques: Optional[bool] = None
+PageCompteAdministratifUpdate = make_partial(
+    PageCompteAdministratifBase,
+    "PageCompteAdministratifUpdate",
+    "Schema for updating administrative account page.",
+    exclude=("commune_id", "exercice_id"),
+)
 
 
-class PageCompteAdministratifRead(PageCompteAdministratifBase, TimestampSchema):
+class PageCompteAdministratifRead(PageCompteAdministratifBase, TimestampSchema, ReadSchema):
     """Schema for reading administrative account page."""
     id: int
     date_publication: Optional[datetime] = None
@@ -375,7 +333,7 @@ class PageCompteAdministratifRead(PageCompteAdministratifBase, TimestampSchema):
     is_published: bool = False
 
 
-class PageCompteAdministratifList(BaseSchema):
+class PageCompteAdministratifList(ReadSchema):
     """Simplified schema for listing pages."""
     id: int
     commune_id: int
@@ -405,9 +363,3 @@ class PageCompteAdministratifDetail(PageCompteAdministratifRead):
 class PagePublish(BaseSchema):
     """Schema for publishing a page."""
     statut: StatutPublication
-
-
-# Update forward references
-SectionCMSWithContent.model_rebuild()
-PageCompteAdministratifWithSections.model_rebuild()
-PageCompteAdministratifDetail.model_rebuild()
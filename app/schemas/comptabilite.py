@@ -7,10 +7,25 @@ from datetime import date, datetime
 from decimal import Decimal
 from typing import List, Optional
 
-from pydantic import Field, field_validator
+from pydantic import Field, model_validator
+from typing_extensions import Self
 
 from app.models.enums import SectionBudgetaire, TypeMouvement
-from app.schemas.base import BaseSchema, TimestampSchema
+from app.schemas.base import (
+    BaseSchema,
+    Code10,
+    Libelle255,
+    MontantAffiche,
+    MontantPositif,
+    NiveauCompte,
+    ReadSchema,
+    Str10,
+    Str100,
+    Str50,
+    TimestampSchema,
+    ZERO_DEC,
+    make_partial,
+)
 
 
 # =====================
@@ -19,12 +34,12 @@ from app.schemas.base import BaseSchema, TimestampSchema
 
 class PlanComptableBase(BaseSchema):
     """Base schema for PlanComptable."""
-    code: str = Field(..., min_length=1, max_length=10)
-    intitule: str = Field(..., min_length=1, max_length=255)
-    niveau: int = Field(..., ge=1, le=3)
+    code: Code10
+    intitule: Libelle255
+    niveau: NiveauCompte
     type_mouvement: TypeMouvement
     section: SectionBudgetaire
-    parent_code: Optional[str] = Field(None, max_length=10)
+    parent_code: Optional[Str10] = None
     est_sommable: bool = True
     ordre_affichage: Optional[int] = None
     actif: bool = True
@@ -35,21 +50,20 @@ class PlanComptableCreate(PlanComptableBase):
     pass
 
 
-class PlanComptableUpdate(BaseSchema):
-    """Schema for updating a PlanComptable entry."""
-    intitule: Optional[str] = Field(None, min_length=1, max_length=255)
-    parent_code: Optional[str] = Field(None, max_length=10)
-    est_sommable: Optional[bool] = None
-    ordre_affichage: Optional[int] = None
-    actif: Optional[bool] = None
+PlanComptableUpdate = make_partial(
+    PlanComptableBase,
+    "PlanComptableUpdate",
+    "Schema for updating a PlanComptable entry.",
+    exclude=("code", "niveau", "type_mouvement", "section"),
+)
 
 
-class PlanComptableRead(PlanComptableBase, TimestampSchema):
+class PlanComptableRead(PlanComptableBase, TimestampSchema, ReadSchema):
     """Schema for reading a PlanComptable entry."""
     id: int
 
 
-class PlanComptableList(BaseSchema):
+class PlanComptableList(ReadSchema):
     """Simplified schema for listing."""
     code: str
     intitule: str
@@ -59,8 +73,9 @@ class PlanComptableList(BaseSchema):
     parent_code: Optional[str] = None
 
 
-class PlanComptableTree(PlanComptableRead):
-    """PlanComptable with children for tree structure."""
+class PlanComptableTree(PlanComptableBase, ReadSchema):
+    """PlanComptable with children for tree structure (no timestamps: full chart)."""
+    id: int
     enfants: List["PlanComptableTree"] = []
 
 
@@ -71,18 +86,17 @@ class PlanComptableTree(PlanComptableRead):
 class ExerciceBase(BaseSchema):
     """Base schema for Exercice."""
     annee: int = Field(..., ge=2000, le=2100)
-    libelle: Optional[str] = Field(None, max_length=50)
+    libelle: Optional[Str50] = None
     date_debut: date
     date_fin: date
     cloture: bool = False
 
-    @field_validator("date_fin")
-    @classmethod
-    def validate_dates(cls, v: date, info) -> date:
+    @model_validator(mode="after")
+    def validate_dates(self) -> Self:
         """Ensure date_fin > date_debut."""
-        if "date_debut" in info.data and v <= info.data["date_debut"]:
+        if self.date_fin <= self.date_debut:
             raise ValueError("date_fin doit être postérieure à date_debut")
-        return v
+        return self
 
 
 class ExerciceCreate(ExerciceBase):
@@ -90,20 +104,20 @@ class ExerciceCreate(ExerciceBase):
     pass
 
 
-class ExerciceUpdate(BaseSchema):
-    """Schema for updating an Exercice."""
-    libelle: Optional[str] = Field(None, max_length=50)
-    date_debut: Optional[date] = None
-    date_fin: Optional[date] = None
-    cloture: Optional[bool] = None
+ExerciceUpdate = make_partial(
+    ExerciceBase,
+    "ExerciceUpdate",
+    "Schema for updating an Exercice.",
+    exclude=("annee",),
+)
 
 
-class ExerciceRead(ExerciceBase, TimestampSchema):
+class ExerciceRead(ExerciceBase, TimestampSchema, ReadSchema):
     """Schema for reading an Exercice."""
     id: int
 
 
-class ExerciceList(BaseSchema):
+class ExerciceList(ReadSchema):
     """Simplified schema for listing exercices."""
     id: int
     annee: int
@@ -119,14 +133,14 @@ class DonneesRecettesBase(BaseSchema):
     """Base schema for DonneesRecettes."""
     commune_id: int
     exercice_id: int
-    compte_code: str = Field(..., min_length=1, max_length=10)
-    budget_primitif: Decimal = Field(default=Decimal("0.00"), ge=0)
-    budget_additionnel: Decimal = Field(default=Decimal("0.00"))
-    modifications: Decimal = Field(default=Decimal("0.00"))
-    previsions_definitives: Decimal = Field(default=Decimal("0.00"), ge=0)
-    or_admis: Decimal = Field(default=Decimal("0.00"), ge=0)
-    recouvrement: Decimal = Field(default=Decimal("0.00"), ge=0)
-    reste_a_recouvrer: Decimal = Field(default=Decimal("0.00"), ge=0)
+    compte_code: Code10
+    budget_primitif: MontantPositif = ZERO_DEC
+    budget_additionnel: Decimal = ZERO_DEC
+    modifications: Decimal = ZERO_DEC
+    previsions_definitives: MontantPositif = ZERO_DEC
+    or_admis: MontantPositif = ZERO_DEC
+    recouvrement: MontantPositif = ZERO_DEC
+    reste_a_recouvrer: MontantPositif = ZERO_DEC
     commentaire: Optional[str] = None
 
 
@@ -135,35 +149,31 @@ class DonneesRecettesCreate(DonneesRecettesBase):
     pass
 
 
-class DonneesRecettesUpdate(BaseSchema):
-    """Schema for updating DonneesRecettes."""
-    budget_primitif: Optional[Decimal] = Field(None, ge=0)
-    budget_additionnel: Optional[Decimal] = None
-    modifications: Optional[Decimal] = None
-    previsions_definitives: Optional[Decimal] = Field(None, ge=0)
-    or_admis: Optional[Decimal] = Field(None, ge=0)
-    recouvrement: Optional[Decimal] = Field(None, ge=0)
-    reste_a_recouvrer: Optional[Decimal] = Field(None, ge=0)
-    commentaire: Optional[str] = None
+DonneesRecettesUpdate = make_partial(
+    DonneesRecettesBase,
+    "DonneesRecettesUpdate",
+    "Schema for updating DonneesRecettes.",
+    exclude=("commune_id", "exercice_id", "compte_code"),
+)
 
 
-class DonneesRecettesRead(DonneesRecettesBase, TimestampSchema):
+class DonneesRecettesRead(DonneesRecettesBase, TimestampSchema, ReadSchema):
     """Schema for reading DonneesRecettes."""
     id: int
     valide: bool = False
     valide_par: Optional[int] = None
     valide_le: Optional[datetime] = None
     # Calculated fields
-    taux_execution: Optional[Decimal] = None
+    taux_execution: Optional[MontantAffiche] = None
 
 
-class DonneesRecettesList(BaseSchema):
+class DonneesRecettesList(ReadSchema):
     """Simplified schema for listing."""
     id: int
     compte_code: str
-    previsions_definitives: Decimal
-    or_admis: Decimal
-    recouvrement: Decimal
+    previsions_definitives: MontantAffiche
+    or_admis: MontantAffiche
+    recouvrement: MontantAffiche
 
 
 class DonneesRecettesWithCompte(DonneesRecettesRead):
@@ -185,16 +195,16 @@ class DonneesDepensesBase(BaseSchema):
     """Base schema for DonneesDepenses."""
     commune_id: int
     exercice_id: int
-    compte_code: str = Field(..., min_length=1, max_length=10)
-    budget_primitif: Decimal = Field(default=Decimal("0.00"), ge=0)
-    budget_additionnel: Decimal = Field(default=Decimal("0.00"))
-    modifications: Decimal = Field(default=Decimal("0.00"))
-    previsions_definitives: Decimal = Field(default=Decimal("0.00"), ge=0)
-    engagement: Decimal = Field(default=Decimal("0.00"), ge=0)
-    mandat_admis: Decimal = Field(default=Decimal("0.00"), ge=0)
-    paiement: Decimal = Field(default=Decimal("0.00"), ge=0)
-    reste_a_payer: Decimal = Field(default=Decimal("0.00"), ge=0)
-    programme: Optional[str] = Field(None, max_length=100)
+    compte_code: Code10
+    budget_primitif: MontantPositif = ZERO_DEC
+    budget_additionnel: Decimal = ZERO_DEC
+    modifications: Decimal = ZERO_DEC
+    previsions_definitives: MontantPositif = ZERO_DEC
+    engagement: MontantPositif = ZERO_DEC
+    mandat_admis: MontantPositif = ZERO_DEC
+    paiement: MontantPositif = ZERO_DEC
+    reste_a_payer: MontantPositif = ZERO_DEC
+    programme: Optional[Str100] = None
     commentaire: Optional[str] = None
 
 
@@ -203,37 +213,31 @@ class DonneesDepensesCreate(DonneesDepensesBase):
     pass
 
 
-class DonneesDepensesUpdate(BaseSchema):
-    """Schema for updating DonneesDepenses."""
-    budget_primitif: Optional[Decimal] = Field(None, ge=0)
-    budget_additionnel: Optional[Decimal] = None
-    modifications: Optional[Decimal] = None
-    previsions_definitives: Optional[Decimal] = Field(None, ge=0)
-    engagement: Optional[Decimal] = Field(None, ge=0)
-    mandat_admis: Optional[Decimal] = Field(None, ge=0)
-    paiement: Optional[Decimal] = Field(None, ge=0)
-    reste_a_payer: Optional[Decimal] = Field(None, ge=0)
-    programme: Optional[str] = Field(None, max_length=100)
-    commentaire: Optional[str] = None
+DonneesDepensesUpdate = make_partial(
+    DonneesDepensesBase,
+    "DonneesDepensesUpdate",
+    "Schema for updating DonneesDepenses.",
+    exclude=("commune_id", "exercice_id", "compte_code"),
+)
 
 
-class DonneesDepensesRead(DonneesDepensesBase, TimestampSchema):
+class DonneesDepensesRead(DonneesDepensesBase, TimestampSchema, ReadSchema):
     """Schema for reading DonneesDepenses."""
     id: int
     valide: bool = False
     valide_par: Optional[int] = None
     valide_le: Optional[datetime] = None
     # Calculated fields
-    taux_execution: Optional[Decimal] = None
+    taux_execution: Optional[MontantAffiche] = None
 
 
-class DonneesDepensesList(BaseSchema):
+class DonneesDepensesList(ReadSchema):
     """Simplified schema for listing."""
     id: int
     compte_code: str
-    previsions_definitives: Decimal
-    mandat_admis: Decimal
-    paiement: Decimal
+    previsions_definitives: MontantAffiche
+    mandat_admis: MontantAffiche
+    paiement: MontantAffiche
 
 
 class DonneesDepensesWithCompte(DonneesDepensesRead):
@@ -245,7 +249,3 @@ class DonneesDepensesValidation(BaseSchema):
     """Schema for validating DonneesDepenses."""
     valide: bool
     commentaire: Optional[str] = None
-
-
-# Update forward references
-PlanComptableTree.model_rebuild()
@@ -9,7 +9,7 @@ from typing import Optional
 from pydantic import Field
 
 from app.models.enums import TypeDocument
-from app.schemas.base import BaseSchema, TimestampSchema
+from app.schemas.base import BaseSchema, ReadSchema, Str100, Str500, TimestampSchema, make_partial
 
 
 # =====================
@@ -31,20 +31,13 @@ class DocumentCreate(DocumentBase):
     nom_fichier: str = Field(..., min_length=1, max_length=255)
     chemin_fichier: str = Field(..., min_length=1, max_length=500)
     taille_octets: Optional[int] = Field(None, ge=0)
-    mime_type: Optional[str] = Field(None, max_length=100)
+    mime_type: Optional[Str100] = None
 
 
-class DocumentUpdate(BaseSchema):
-    """Schema for updating a Document."""
-    commune_id: Optional[int] = None
-    exercice_id: Optional[int] = None
-    type_document: Optional[TypeDocument] = None
-    titre: Optional[str] = Field(None, min_length=1, max_length=255)
-    description: Optional[str] = None
-    public: Optional[bool] = None
+DocumentUpdate = make_partial(DocumentBase, "DocumentUpdate", "Schema for updating a Document.")
 
 
-class DocumentRead(DocumentBase, TimestampSchema):
+class DocumentRead(DocumentBase, TimestampSchema, ReadSchema):
     """Schema for reading a Document."""
     id: int
     nom_fichier: str
@@ -58,7 +51,7 @@ class DocumentRead(DocumentBase, TimestampSchema):
     extension: Optional[str] = None
 
 
-class DocumentList(BaseSchema):
+class DocumentList(ReadSchema):
     """Simplified schema for listing documents."""
     id: int
     type_document: TypeDocument
@@ -110,7 +103,7 @@ class DocumentFilter(BaseSchema):
     exercice_id: Optional[int] = None
     type_document: Optional[TypeDocument] = None
     public: Optional[bool] = None
-    search: Optional[str] = Field(None, max_length=100)
+    search: Optional[Str100] = None
 
 
 # =====================
@@ -120,7 +113,7 @@ class DocumentFilter(BaseSchema):
 class NewsletterAbonneBase(BaseSchema):
     """Base schema for newsletter subscriber."""
     email: str = Field(..., max_length=255)
-    nom: Optional[str] = Field(None, max_length=100)
+    nom: Optional[Str100] = None
     actif: bool = True
 
 
@@ -129,14 +122,14 @@ class NewsletterAbonneCreate(NewsletterAbonneBase):
     pass
 
 
-class NewsletterAbonneRead(NewsletterAbonneBase, TimestampSchema):
+class NewsletterAbonneRead(NewsletterAbonneBase, TimestampSchema, ReadSchema):
     """Schema for reading a subscriber."""
     id: int
     date_inscription: datetime
     date_desinscription: Optional[datetime] = None
 
 
-class StatistiqueVisiteRead(BaseSchema):
+class StatistiqueVisiteRead(ReadSchema):
     """Schema for reading visit statistics."""
     id: int
     commune_id: Optional[int] = None
@@ -155,10 +148,10 @@ class StatistiqueVisiteCreate(BaseSchema):
     page_url: str = Field(..., max_length=500)
     ip_anonymisee: Optional[str] = Field(None, max_length=45)
     user_agent: Optional[str] = None
-    referrer: Optional[str] = Field(None, max_length=500)
+    referrer: Optional[Str500] = None
 
 
-class AuditLogRead(BaseSchema):
+class AuditLogRead(ReadSchema):
     """Schema for reading audit log entry."""
     id: int
     table_name: str
@@ -3,13 +3,21 @@ Pydantic schemas for geographic models.
 Province, Region, Commune.
 """
 
-from decimal import Decimal
 from typing import List, Optional
 
-from pydantic import Field
-
 from app.models.enums import TypeCommune
-from app.schemas.base import BaseSchema, TimestampSchema
+from app.schemas.base import (
+    BaseSchema,
+    Code10,
+    Code20,
+    EntierPositif,
+    MontantPositif,
+    Nom100,
+    Nom150,
+    ReadSchema,
+    TimestampSchema,
+    make_partial,
+)
 
 
 # =====================
@@ -18,8 +26,8 @@ from app.schemas.base import BaseSchema, TimestampSchema
 
 class ProvinceBase(BaseSchema):
     """Base schema for Province."""
-    code: str = Field(..., min_length=1, max_length=10)
-    nom: str = Field(..., min_length=1, max_length=100)
+    code: Code10
+    nom: Nom100
 
 
 class ProvinceCreate(ProvinceBase):
@@ -27,25 +35,22 @@ class ProvinceCreate(ProvinceBase):
     pass
 
 
-class ProvinceUpdate(BaseSchema):
-    """Schema for updating a Province."""
-    code: Optional[str] = Field(None, min_length=1, max_length=10)
-    nom: Optional[str] = Field(None, min_length=1, max_length=100)
+ProvinceUpdate = make_partial(ProvinceBase, "ProvinceUpdate", "Schema for updating a Province.")
 
 
-class ProvinceRead(ProvinceBase, TimestampSchema):
+class ProvinceRead(ProvinceBase, TimestampSchema, ReadSchema):
     """Schema for reading a Province."""
     id: int
 
 
-class ProvinceList(BaseSchema):
+class ProvinceList(ReadSchema):
     """Schema for listing Provinces."""
     id: int
     code: str
     nom: str
 
 
-class ProvinceWithStats(BaseSchema):
+class ProvinceWithStats(ReadSchema):
     """Province with statistics (nb_regions, nb_communes)."""
     id: int
     code: str
@@ -66,8 +71,8 @@ class ProvinceWithRegions(ProvinceRead):
 
 class RegionBase(BaseSchema):
     """Base schema for Region."""
-    code: str = Field(..., min_length=1, max_length=10)
-    nom: str = Field(..., min_length=1, max_length=100)
+    code: Code10
+    nom: Nom100
     province_id: int
 
 
@@ -76,19 +81,15 @@ class RegionCreate(RegionBase):
     pass
 
 
-class RegionUpdate(BaseSchema):
-    """Schema for updating a Region."""
-    code: Optional[str] = Field(None, min_length=1, max_length=10)
-    nom: Optional[str] = Field(None, min_length=1, max_length=100)
-    province_id: Optional[int] = None
+RegionUpdate = make_partial(RegionBase, "RegionUpdate", "Schema for updating a Region.")
 
 
-class RegionRead(RegionBase, TimestampSchema):
+class RegionRead(RegionBase, TimestampSchema, ReadSchema):
     """Schema for reading a Region."""
     id: int
 
 
-class RegionList(BaseSchema):
+class RegionList(ReadSchema):
     """Schema for listing Regions."""
     id: int
     code: str
@@ -96,7 +97,7 @@ class RegionList(BaseSchema):
     province_id: int
 
 
-class RegionWithStats(BaseSchema):
+class RegionWithStats(ReadSchema):
     """Region with statistics (nb_communes, province_nom)."""
     id: int
     code: str
@@ -129,12 +130,12 @@ class RegionDetail(RegionRead):
 
 class CommuneBase(BaseSchema):
     """Base schema for Commune."""
-    code: str = Field(..., min_length=1, max_length=20)
-    nom: str = Field(..., min_length=1, max_length=150)
+    code: Code20
+    nom: Nom150
     type_commune: Optional[TypeCommune] = None
     region_id: int
-    population: Optional[int] = Field(None, ge=0)
-    superficie_km2: Optional[Decimal] = Field(None, ge=0)
+    population: Optional[EntierPositif] = None
+    superficie_km2: Optional[MontantPositif] = None
 
 
 class CommuneCreate(CommuneBase):
@@ -142,22 +143,15 @@ class CommuneCreate(CommuneBase):
     pass
 
 
-class CommuneUpdate(BaseSchema):
-    """Schema for updating a Commune."""
-    code: Optional[str] = Field(None, min_length=1, max_length=20)
-    nom: Optional[str] = Field(None, min_length=1, max_length=150)
-    type_commune: Optional[TypeCommune] = None
-    region_id: Optional[int] = None
-    population: Optional[int] = Field(None, ge=0)
-    superficie_km2: Optional[Decimal] = Field(None, ge=0)
+CommuneUpdate = make_partial(CommuneBase, "CommuneUpdate", "Schema for updating a Commune.")
 
 
-class CommuneRead(CommuneBase, TimestampSchema):
+class CommuneRead(CommuneBase, TimestampSchema, ReadSchema):
     """Schema for reading a Commune."""
     id: int
 
 
-class CommuneList(BaseSchema):
+class CommuneList(ReadSchema):
     """Schema for listing Communes."""
     id: int
     code: str
@@ -166,7 +160,7 @@ class CommuneList(BaseSchema):
     region_id: int
 
 
-class CommuneWithStats(BaseSchema):
+class CommuneWithStats(ReadSchema):
     """Commune with statistics and parent names."""
     id: int
     code: str
@@ -188,7 +182,7 @@ class CommuneDetail(CommuneRead):
     region: "RegionWithProvince"
 
 
-class CommuneSearch(BaseSchema):
+class CommuneSearch(ReadSchema):
     """Schema for commune search results."""
     id: int
     code: str
@@ -211,5 +205,3 @@ class HierarchieGeographique(BaseSchema):
 ProvinceWithRegions.model_rebuild()
 RegionWithCommunes.model_rebuild()
 RegionDetail.model_rebuild()
-CommuneWithRegion.model_rebuild()
-CommuneDetail.model_rebuild()
@@ -5,12 +5,32 @@ SocieteMiniere, ProjetMinier, ProjetCommune, RevenuMinier.
 
 from datetime import date
 from decimal import Decimal
-from typing import List, Optional
+from typing import List, Literal, Optional
 
-from pydantic import EmailStr, Field, HttpUrl
+from pydantic import EmailStr, Field, computed_field
 
 from app.models.enums import StatutProjetMinier, TypeRevenuMinier
-from app.schemas.base import BaseSchema, TimestampSchema
+from app.schemas.base import (
+    BaseSchema,
+    Code10,
+    MontantPositif,
+    Nom200,
+    Pourcentage,
+    ReadSchema,
+    Str100,
+    Str200,
+    Str255,
+    Str50,
+    TimestampSchema,
+    ZERO_DEC,
+    make_partial,
+)
+
+# Valeurs des énumérations en Literal : correspondance directe de chaînes à la
+# validation, sans construction de membres d'Enum (use_enum_values les réduit
+# de toute façon à leur valeur)
+StatutProjetMinierValeur = Literal[tuple(StatutProjetMinier._value2member_map_)]
+TypeRevenuMinierValeur = Literal[tuple(TypeRevenuMinier._value2member_map_)]
 
 
 # =====================
@@ -19,39 +39,36 @@ from app.schemas.base import BaseSchema, TimestampSchema
 
 class SocieteMiniereBase(BaseSchema):
     """Base schema for SocieteMiniere."""
-    nom: str = Field(..., min_length=1, max_length=200)
-    nif: Optional[str] = Field(None, max_length=50)
-    stat: Optional[str] = Field(None, max_length=50)
-    siege_social: Optional[str] = Field(None, max_length=255)
-    telephone: Optional[str] = Field(None, max_length=50)
-    email: Optional[EmailStr] = None
-    site_web: Optional[str] = Field(None, max_length=200)
+    nom: Nom200
+    nif: Optional[Str50] = None
+    stat: Optional[Str50] = None
+    siege_social: Optional[Str255] = None
+    telephone: Optional[Str50] = None
+    # Adresse déjà validée à l'écriture : pas de validation email en lecture
+    email: Optional[Str255] = None
+    site_web: Optional[Str200] = None
     actif: bool = True
 
 
 class SocieteMiniereCreate(SocieteMiniereBase):
     """Schema for creating a SocieteMiniere."""
-    pass
+    email: Optional[EmailStr] = None
 
 
-class SocieteMiniereUpdate(BaseSchema):
-    """Schema for updating a SocieteMiniere."""
-    nom: Optional[str] = Field(None, min_length=1, max_length=200)
-    nif: Optional[str] = Field(None, max_length=50)
-    stat: Optional[str] = Field(None, max_length=50)
-    siege_social: Optional[str] = Field(None, max_length=255)
-    telephone: Optional[str] = Field(None, max_length=50)
-    email: Optional[EmailStr] = None
-    site_web: Optional[str] = Field(None, max_length=200)
-    actif: Optional[bool] = None
+SocieteMiniereUpdate = make_partial(
+    SocieteMiniereBase,
+    "SocieteMiniereUpdate",
+    "Schema for updating a SocieteMiniere.",
+    email=(Optional[EmailStr], None),
+)
 
 
-class SocieteMiniereRead(SocieteMiniereBase, TimestampSchema):
+class SocieteMiniereRead(SocieteMiniereBase, TimestampSchema, ReadSchema):
     """Schema for reading a SocieteMiniere."""
     id: int
 
 
-class SocieteMiniereList(BaseSchema):
+class SocieteMiniereList(ReadSchema):
     """Simplified schema for listing."""
     id: int
     nom: str
@@ -69,19 +86,19 @@ class SocieteMiniereWithProjets(SocieteMiniereRead):
 
 class ProjetMinierBase(BaseSchema):
     """Base schema for ProjetMinier."""
-    nom: str = Field(..., min_length=1, max_length=200)
+    nom: Nom200
     societe_id: int
-    type_minerai: Optional[str] = Field(None, max_length=100)
-    statut: Optional[StatutProjetMinier] = None
+    type_minerai: Optional[Str100] = None
+    statut: Optional[StatutProjetMinierValeur] = None
     date_debut_exploitation: Optional[date] = None
-    surface_ha: Optional[Decimal] = Field(None, ge=0)
+    surface_ha: Optional[MontantPositif] = None
     description: Optional[str] = None
 
 
 class ProjetCommuneNested(BaseSchema):
     """Schema imbriqué pour commune + pourcentage lors de la création d'un projet."""
     commune_id: int
-    pourcentage_territoire: Decimal = Field(..., ge=0, le=100)
+    pourcentage_territoire: Pourcentage
     date_debut: Optional[date] = None
     date_fin: Optional[date] = None
 
@@ -91,32 +108,29 @@ class ProjetMinierCreate(ProjetMinierBase):
     communes: List[ProjetCommuneNested] = Field(default_factory=list)
 
 
-class ProjetMinierUpdate(BaseSchema):
-    """Schema for updating a ProjetMinier."""
-    nom: Optional[str] = Field(None, min_length=1, max_length=200)
-    societe_id: Optional[int] = None
-    type_minerai: Optional[str] = Field(None, max_length=100)
-    statut: Optional[StatutProjetMinier] = None
-    date_debut_exploitation: Optional[date] = None
-    surface_ha: Optional[Decimal] = Field(None, ge=0)
-    description: Optional[str] = None
+ProjetMinierUpdate = make_partial(
+    ProjetMinierBase,
+    "ProjetMinierUpdate",
+    "Schema for updating a ProjetMinier.",
+)
 
 
-class ProjetMinierRead(ProjetMinierBase, TimestampSchema):
+class ProjetMinierRead(ProjetMinierBase, TimestampSchema, ReadSchema):
     """Schema for reading a ProjetMinier."""
     id: int
 
 
-class ProjetMinierList(BaseSchema):
+class ProjetMinierList(ReadSchema):
     """Simplified schema for listing."""
     id: int
     nom: str
     type_minerai: Optional[str] = None
-    statut: Optional[StatutProjetMinier] = None
+    statut: Optional[StatutProjetMinierValeur] = None
 
 
-class ProjetMinierWithSociete(ProjetMinierRead):
-    """ProjetMinier with société info."""
+class ProjetMinierWithSociete(ProjetMinierBase, ReadSchema):
+    """ProjetMinier with société info (listing: no timestamps)."""
+    id: int
     societe: SocieteMiniereList
 
 
@@ -134,7 +148,7 @@ class ProjetCommuneBase(BaseSchema):
     """Base schema for ProjetCommune relation."""
     projet_id: int
     commune_id: int
-    pourcentage_territoire: Decimal = Field(..., ge=0, le=100)
+    pourcentage_territoire: Pourcentage
     date_debut: Optional[date] = None
     date_fin: Optional[date] = None
 
@@ -144,14 +158,15 @@ class ProjetCommuneCreate(ProjetCommuneBase):
     pass
 
 
-class ProjetCommuneUpdate(BaseSchema):
-    """Schema for updating a ProjetCommune relation."""
-    pourcentage_territoire: Optional[Decimal] = Field(None, ge=0, le=100)
-    date_debut: Optional[date] = None
-    date_fin: Optional[date] = None
+ProjetCommuneUpdate = make_partial(
+    ProjetCommuneBase,
+    "ProjetCommuneUpdate",
+    "Schema for updating a ProjetCommune relation.",
+    exclude=("projet_id", "commune_id"),
+)
 
 
-class ProjetCommuneRead(ProjetCommuneBase):
+class ProjetCommuneRead(ProjetCommuneBase, ReadSchema):
     """Schema for reading a ProjetCommune relation."""
     id: int
     # Include commune info for display
@@ -168,12 +183,12 @@ class RevenuMinierBase(BaseSchema):
     commune_id: int
     exercice_id: int
     projet_id: int
-    type_revenu: TypeRevenuMinier
-    montant_prevu: Decimal = Field(default=Decimal("0.00"), ge=0)
-    montant_recu: Decimal = Field(default=Decimal("0.00"), ge=0)
+    type_revenu: TypeRevenuMinierValeur
+    montant_prevu: MontantPositif = ZERO_DEC
+    montant_recu: MontantPositif = ZERO_DEC
     date_reception: Optional[date] = None
-    reference_paiement: Optional[str] = Field(None, max_length=100)
-    compte_code: str = Field(..., min_length=1, max_length=10)
+    reference_paiement: Optional[Str100] = None
+    compte_code: Code10
     compte_administratif_id: int
     commentaire: Optional[str] = None
 
@@ -183,20 +198,15 @@ class RevenuMinierCreate(RevenuMinierBase):
     pass
 
 
-class RevenuMinierUpdate(BaseSchema):
-    """Schema for updating a RevenuMinier."""
-    projet_id: Optional[int] = None
-    type_revenu: Optional[TypeRevenuMinier] = None
-    montant_prevu: Optional[Decimal] = Field(None, ge=0)
-    montant_recu: Optional[Decimal] = Field(None, ge=0)
-    date_reception: Optional[date] = None
-    reference_paiement: Optional[str] = Field(None, max_length=100)
-    compte_code: Optional[str] = Field(None, min_length=1, max_length=10)
-    compte_administratif_id: Optional[int] = None
-    commentaire: Optional[str] = None
+RevenuMinierUpdate = make_partial(
+    RevenuMinierBase,
+    "RevenuMinierUpdate",
+    "Schema for updating a RevenuMinier.",
+    exclude=("commune_id", "exercice_id"),
+)
 
 
-class RevenuMinierRead(RevenuMinierBase, TimestampSchema):
+class RevenuMinierRead(RevenuMinierBase, TimestampSchema, ReadSchema):
     """Schema for reading a RevenuMinier."""
     id: int
     # Calculated fields
@@ -204,17 +214,20 @@ class RevenuMinierRead(RevenuMinierBase, TimestampSchema):
     taux_realisation: Optional[Decimal] = None
 
 
-class RevenuMinierList(BaseSchema):
+class RevenuMinierList(ReadSchema):
     """Simplified schema for listing."""
     id: int
-    type_revenu: TypeRevenuMinier
+    type_revenu: TypeRevenuMinierValeur
     montant_prevu: Decimal
     montant_recu: Decimal
     date_reception: Optional[date] = None
 
 
-class RevenuMinierWithDetails(RevenuMinierRead):
-    """RevenuMinier with commune and project info."""
+class RevenuMinierWithDetails(RevenuMinierBase, ReadSchema):
+    """RevenuMinier with commune and project info (listing: no timestamps)."""
+    id: int
+    ecart: Optional[Decimal] = None
+    taux_realisation: Optional[Decimal] = None
     commune_nom: Optional[str] = None
     exercice_annee: Optional[int] = None
     projet_nom: Optional[str] = None
@@ -231,15 +244,23 @@ class StatistiquesRevenusMiniers(BaseSchema):
     commune_id: int
     exercice_annee: int
     # Par type de revenu
-    ristournes_prevues: Decimal = Field(default=Decimal("0.00"))
-    ristournes_recues: Decimal = Field(default=Decimal("0.00"))
-    redevances_prevues: Decimal = Field(default=Decimal("0.00"))
-    redevances_recues: Decimal = Field(default=Decimal("0.00"))
+    ristournes_prevues: Decimal = ZERO_DEC
+    ristournes_recues: Decimal = ZERO_DEC
+    redevances_prevues: Decimal = ZERO_DEC
+    redevances_recues: Decimal = ZERO_DEC
     # Totaux
-    total_prevu: Decimal = Field(default=Decimal("0.00"))
-    total_recu: Decimal = Field(default=Decimal("0.00"))
-    ecart_total: Decimal = Field(default=Decimal("0.00"))
-    taux_realisation: Optional[Decimal] = None
+    total_prevu: Decimal = ZERO_DEC
+    total_recu: Decimal = ZERO_DEC
+
+    @computed_field(repr=False)
+    @property
+    def ecart_total(self) -> Decimal:
+        return self.total_recu - self.total_prevu
+
+    @computed_field(repr=False)
+    @property
+    def taux_realisation(self) -> Optional[Decimal]:
+        return self.total_recu / self.total_prevu * 100 if self.total_prevu > 0 else None
 
 
 class ResumeProjetMinier(BaseSchema):
@@ -248,12 +269,7 @@ class ResumeProjetMinier(BaseSchema):
     projet_nom: str
     societe_nom: Optional[str] = None
     type_minerai: Optional[str] = None
-    statut: Optional[StatutProjetMinier] = None
+    statut: Optional[StatutProjetMinierValeur] = None
     nb_communes_impactees: int
     surface_totale_ha: Optional[Decimal] = None
     total_revenus_annee: Optional[Decimal] = None
-
-
-# Update forward references
-SocieteMiniereWithProjets.model_rebuild()
-ProjetMinierWithCommunes.model_rebuild()
@@ -6,159 +6,269 @@ Structures for administrative accounts presentation.
 from decimal import Decimal
 from typing import List, Optional
 
-from pydantic import Field
+from pydantic import ConfigDict, computed_field
+from typing_extensions import Self
 
 from app.models.enums import SectionBudgetaire
-from app.schemas.base import BaseSchema
+from app.schemas.base import BaseSchema, Centimes, NiveauCompte, ZERO_DEC
+
+
+def _taux(realise: int, prevu: int) -> Optional[Decimal]:
+    """Taux d'exécution (%) entre deux montants en centimes, None sans prévision."""
+    return Decimal(realise) / prevu * 100 if prevu > 0 else None
+
+
+def _moyenne(centimes: int, nombre: int) -> Decimal:
+    """Moyenne d'un montant en centimes, en unités (Decimal exact, non arrondi)."""
+    return Decimal(centimes).scaleb(-2) / nombre if nombre > 0 else ZERO_DEC
+
+
+class _MontantsSchema(BaseSchema):
+    """
+    Base des schémas à montants en centimes : leurs défauts (0) sont déjà
+    canoniques, inutile de les revalider à chaque instance.
+    """
+    model_config = ConfigDict(validate_default=False)
 
 
 # =====================
 # Ligne de tableau
 # =====================
 
-class LigneTableauBase(BaseSchema):
-    """Base schema for a table row."""
+class LigneTableauBase(_MontantsSchema):
+    """Base schema for a table row: account and budget columns shared by both tables."""
     code: str
     intitule: str
-    niveau: int = Field(..., ge=1, le=3)
+    niveau: NiveauCompte
     est_sommable: bool = True
+    budget_primitif: Centimes = 0
+    budget_additionnel: Centimes = 0
+    modifications: Centimes = 0
+    previsions_definitives: Centimes = 0
 
 
 class LigneRecettes(LigneTableauBase):
     """Row for receipts table."""
-    budget_primitif: Decimal = Field(default=Decimal("0.00"))
-    budget_additionnel: Decimal = Field(default=Decimal("0.00"))
-    modifications: Decimal = Field(default=Decimal("0.00"))
-    previsions_definitives: Decimal = Field(default=Decimal("0.00"))
-    or_admis: Decimal = Field(default=Decimal("0.00"))
-    recouvrement: Decimal = Field(default=Decimal("0.00"))
-    reste_a_recouvrer: Decimal = Field(default=Decimal("0.00"))
-    taux_execution: Optional[Decimal] = None
+    or_admis: Centimes = 0
+    recouvrement: Centimes = 0
+    reste_a_recouvrer: Centimes = 0
+
+    @computed_field(repr=False)
+    @property
+    def taux_execution(self) -> Optional[Decimal]:
+        """Execution rate (%), none for a parent row without any receipt."""
+        if self.niveau < 3 and not self.or_admis:
+            return None
+        return _taux(self.or_admis, self.previsions_definitives)
 
 
 class LigneDepenses(LigneTableauBase):
     """Row for expenses table."""
-    budget_primitif: Decimal = Field(default=Decimal("0.00"))
-    budget_additionnel: Decimal = Field(default=Decimal("0.00"))
-    modifications: Decimal = Field(default=Decimal("0.00"))
-    previsions_definitives: Decimal = Field(default=Decimal("0.00"))
-    engagement: Decimal = Field(default=Decimal("0.00"))
-    mandat_admis: Decimal = Field(default=Decimal("0.00"))
-    paiement: Decimal = Field(default=Decimal("0.00"))
-    reste_a_payer: Decimal = Field(default=Decimal("0.00"))
-    taux_execution: Optional[Decimal] = None
+    engagement: Centimes = 0
+    mandat_admis: Centimes = 0
+    paiement: Centimes = 0
+    reste_a_payer: Centimes = 0
+
+    @computed_field(repr=False)
+    @property
+    def taux_execution(self) -> Optional[Decimal]:
+        """Execution rate (%), none for a parent row without any expense."""
+        if self.niveau < 3 and not self.mandat_admis:
+            return None
+        return _taux(self.mandat_admis, self.previsions_definitives)
+
+
+# =====================
+# Lignes en colonnes
+# =====================
+
+class ColonnesTableauBase(BaseSchema):
+    """
+    Columnar layout of table rows: one list per field, rows in the same order.
+
+    Serialized as a few homogeneous lists instead of one object per row.
+    """
+    code: List[str] = []
+    intitule: List[str] = []
+    niveau: List[int] = []
+    est_sommable: List[bool] = []
+    budget_primitif: List[Centimes] = []
+    budget_additionnel: List[Centimes] = []
+    modifications: List[Centimes] = []
+    previsions_definitives: List[Centimes] = []
+
+    @classmethod
+    def from_lignes(cls, lignes: List[LigneTableauBase]) -> Self:
+        """Transpose already validated rows, without re-validation."""
+        return cls.model_construct(**{
+            name: [getattr(ligne, name) for ligne in lignes]
+            for name in cls.__trusted_fields__
+        })
+
+
+class ColonnesRecettes(ColonnesTableauBase):
+    """Receipts rows, by column."""
+    or_admis: List[Centimes] = []
+    recouvrement: List[Centimes] = []
+    reste_a_recouvrer: List[Centimes] = []
+    taux_execution: List[Optional[Decimal]] = []
+
+
+class ColonnesDepenses(ColonnesTableauBase):
+    """Expenses rows, by column."""
+    engagement: List[Centimes] = []
+    mandat_admis: List[Centimes] = []
+    paiement: List[Centimes] = []
+    reste_a_payer: List[Centimes] = []
+    taux_execution: List[Optional[Decimal]] = []
 
 
 # =====================
 # Section de tableau
 # =====================
 
-class SectionTableauRecettes(BaseSchema):
+class SectionTableauRecettes(_MontantsSchema):
     """Section of receipts table (fonctionnement or investissement)."""
     section: SectionBudgetaire
     titre: str
     lignes: List[LigneRecettes] = []
     # Totals
-    total_budget_primitif: Decimal = Field(default=Decimal("0.00"))
-    total_budget_additionnel: Decimal = Field(default=Decimal("0.00"))
-    total_modifications: Decimal = Field(default=Decimal("0.00"))
-    total_previsions_definitives: Decimal = Field(default=Decimal("0.00"))
-    total_or_admis: Decimal = Field(default=Decimal("0.00"))
-    total_recouvrement: Decimal = Field(default=Decimal("0.00"))
-    total_reste_a_recouvrer: Decimal = Field(default=Decimal("0.00"))
-    taux_execution_global: Optional[Decimal] = None
+    total_budget_primitif: Centimes = 0
+    total_budget_additionnel: Centimes = 0
+    total_modifications: Centimes = 0
+    total_previsions_definitives: Centimes = 0
+    total_or_admis: Centimes = 0
+    total_recouvrement: Centimes = 0
+    total_reste_a_recouvrer: Centimes = 0
+
+    @computed_field(repr=False)
+    @property
+    def taux_execution_global(self) -> Optional[Decimal]:
+        return _taux(self.total_or_admis, self.total_previsions_definitives)
 
 
-class SectionTableauDepenses(BaseSchema):
+class SectionTableauDepenses(_MontantsSchema):
     """Section of expenses table (fonctionnement or investissement)."""
     section: SectionBudgetaire
     titre: str
     lignes: List[LigneDepenses] = []
     # Totals
-    total_budget_primitif: Decimal = Field(default=Decimal("0.00"))
-    total_budget_additionnel: Decimal = Field(default=Decimal("0.00"))
-    total_modifications: Decimal = Field(default=Decimal("0.00"))
-    total_previsions_definitives: Decimal = Field(default=Decimal("0.00"))
-    total_engagement: Decimal = Field(default=Decimal("0.00"))
-    total_mandat_admis: Decimal = Field(default=Decimal("0.00"))
-    total_paiement: Decimal = Field(default=Decimal("0.00"))
-    total_reste_a_payer: Decimal = Field(default=Decimal("0.00"))
-    taux_execution_global: Optional[Decimal] = None
+    total_budget_primitif: Centimes = 0
+    total_budget_additionnel: Centimes = 0
+    total_modifications: Centimes = 0
+    total_previsions_definitives: Centimes = 0
+    total_engagement: Centimes = 0
+    total_mandat_admis: Centimes = 0
+    total_paiement: Centimes = 0
+    total_reste_a_payer: Centimes = 0
+
+    @computed_field(repr=False)
+    @property
+    def taux_execution_global(self) -> Optional[Decimal]:
+        return _taux(self.total_mandat_admis, self.total_previsions_definitives)
 
 
 # =====================
 # Tableaux complets
 # =====================
 
-class TableauRecettes(BaseSchema):
+class TableauRecettes(_MontantsSchema):
     """Complete receipts table with both sections."""
     commune_id: int
     commune_nom: str
     exercice_annee: int
     sections: List[SectionTableauRecettes] = []
     # Grand totals
-    total_general_previsions: Decimal = Field(default=Decimal("0.00"))
-    total_general_or_admis: Decimal = Field(default=Decimal("0.00"))
-    total_general_recouvrement: Decimal = Field(default=Decimal("0.00"))
-    taux_execution_global: Optional[Decimal] = None
+    total_general_previsions: Centimes = 0
+    total_general_or_admis: Centimes = 0
+    total_general_recouvrement: Centimes = 0
+
+    @computed_field(repr=False)
+    @property
+    def taux_execution_global(self) -> Optional[Decimal]:
+        return _taux(self.total_general_or_admis, self.total_general_previsions)
 
 
-class TableauDepenses(BaseSchema):
+class TableauDepenses(_MontantsSchema):
     """Complete expenses table with both sections."""
     commune_id: int
     commune_nom: str
     exercice_annee: int
     sections: List[SectionTableauDepenses] = []
     # Grand totals
-    total_general_previsions: Decimal = Field(default=Decimal("0.00"))
-    total_general_mandat_admis: Decimal = Field(default=Decimal("0.00"))
-    total_general_paiement: Decimal = Field(default=Decimal("0.00"))
-    taux_execution_global: Optional[Decimal] = None
+    total_general_previsions: Centimes = 0
+    total_general_mandat_admis: Centimes = 0
+    total_general_paiement: Centimes = 0
+
+    @computed_field(repr=False)
+    @property
+    def taux_execution_global(self) -> Optional[Decimal]:
+        return _taux(self.total_general_mandat_admis, self.total_general_previsions)
+
+
+class SectionRecettesColonnes(SectionTableauRecettes):
+    """Receipts section with its rows by column."""
+    lignes: ColonnesRecettes = ColonnesRecettes()
+
+
+class SectionDepensesColonnes(SectionTableauDepenses):
+    """Expenses section with its rows by column."""
+    lignes: ColonnesDepenses = ColonnesDepenses()
+
+
+class TableauRecettesColonnes(TableauRecettes):
+    """Receipts table, rows by column."""
+    sections: List[SectionRecettesColonnes] = []
+
+
+class TableauDepensesColonnes(TableauDepenses):
+    """Expenses table, rows by column."""
+    sections: List[SectionDepensesColonnes] = []
 
 
 # =====================
 # Équilibre budgétaire
 # =====================
 
-class LigneEquilibre(BaseSchema):
+class LigneEquilibre(_MontantsSchema):
     """Row for balance table."""
     libelle: str
     section: Optional[SectionBudgetaire] = None
-    recettes_previsions: Decimal = Field(default=Decimal("0.00"))
-    recettes_realisations: Decimal = Field(default=Decimal("0.00"))
-    depenses_previsions: Decimal = Field(default=Decimal("0.00"))
-    depenses_realisations: Decimal = Field(default=Decimal("0.00"))
-    solde_previsions: Decimal = Field(default=Decimal("0.00"))
-    solde_realisations: Decimal = Field(default=Decimal("0.00"))
+    recettes_previsions: Centimes = 0
+    recettes_realisations: Centimes = 0
+    depenses_previsions: Centimes = 0
+    depenses_realisations: Centimes = 0
+    solde_previsions: Centimes = 0
+    solde_realisations: Centimes = 0
 
 
-class TableauEquilibre(BaseSchema):
+class TableauEquilibre(_MontantsSchema):
     """Budget balance table."""
     commune_id: int
     commune_nom: str
     exercice_annee: int
     lignes: List[LigneEquilibre] = []
     # Section fonctionnement
-    fonctionnement_recettes_prev: Decimal = Field(default=Decimal("0.00"))
-    fonctionnement_recettes_real: Decimal = Field(default=Decimal("0.00"))
-    fonctionnement_depenses_prev: Decimal = Field(default=Decimal("0.00"))
-    fonctionnement_depenses_real: Decimal = Field(default=Decimal("0.00"))
-    fonctionnement_solde_prev: Decimal = Field(default=Decimal("0.00"))
-    fonctionnement_solde_real: Decimal = Field(default=Decimal("0.00"))
+    fonctionnement_recettes_prev: Centimes = 0
+    fonctionnement_recettes_real: Centimes = 0
+    fonctionnement_depenses_prev: Centimes = 0
+    fonctionnement_depenses_real: Centimes = 0
+    fonctionnement_solde_prev: Centimes = 0
+    fonctionnement_solde_real: Centimes = 0
     # Section investissement
-    investissement_recettes_prev: Decimal = Field(default=Decimal("0.00"))
-    investissement_recettes_real: Decimal = Field(default=Decimal("0.00"))
-    investissement_depenses_prev: Decimal = Field(default=Decimal("0.00"))
-    investissement_depenses_real: Decimal = Field(default=Decimal("0.00"))
-    investissement_solde_prev: Decimal = Field(default=Decimal("0.00"))
-    investissement_solde_real: Decimal = Field(default=Decimal("0.00"))
+    investissement_recettes_prev: Centimes = 0
+    investissement_recettes_real: Centimes = 0
+    investissement_depenses_prev: Centimes = 0
+    investissement_depenses_real: Centimes = 0
+    investissement_solde_prev: Centimes = 0
+    investissement_solde_real: Centimes = 0
     # Totaux généraux
-    total_recettes_prev: Decimal = Field(default=Decimal("0.00"))
-    total_recettes_real: Decimal = Field(default=Decimal("0.00"))
-    total_depenses_prev: Decimal = Field(default=Decimal("0.00"))
-    total_depenses_real: Decimal = Field(default=Decimal("0.00"))
-    total_solde_prev: Decimal = Field(default=Decimal("0.00"))
-    total_solde_real: Decimal = Field(default=Decimal("0.00"))
+    total_recettes_prev: Centimes = 0
+    total_recettes_real: Centimes = 0
+    total_depenses_prev: Centimes = 0
+    total_depenses_real: Centimes = 0
+    total_solde_prev: Centimes = 0
+    total_solde_real: Centimes = 0
 
 
 # =====================
@@ -192,13 +302,23 @@ class ResumeFinancier(BaseSchema):
     """Financial summary for a commune/year."""
     commune_id: int
     exercice_annee: int
-    total_recettes_prevues: Decimal
-    total_recettes_realisees: Decimal
-    total_depenses_prevues: Decimal
-    total_depenses_realisees: Decimal
-    solde_budgetaire: Decimal
-    taux_execution_recettes: Optional[Decimal] = None
-    taux_execution_depenses: Optional[Decimal] = None
+    total_recettes_prevues: Centimes
+    total_recettes_realisees: Centimes
+    total_depenses_prevues: Centimes
+    total_depenses_realisees: Centimes
+    solde_budgetaire: Centimes
+
+    @computed_field(repr=False)
+    @property
+    def taux_execution_recettes(self) -> Optional[Decimal]:
+        """Receipts execution rate (%)."""
+        return _taux(self.total_recettes_realisees, self.total_recettes_prevues)
+
+    @computed_field(repr=False)
+    @property
+    def taux_execution_depenses(self) -> Optional[Decimal]:
+        """Expenses execution rate (%)."""
+        return _taux(self.total_depenses_realisees, self.total_depenses_prevues)
 
 
 class ComparaisonExercices(BaseSchema):
@@ -207,16 +327,34 @@ class ComparaisonExercices(BaseSchema):
     commune_nom: str
     exercice_annee_1: int
     exercice_annee_2: int
-    # Recettes
-    recettes_annee_1: Decimal
-    recettes_annee_2: Decimal
-    variation_recettes: Decimal
-    variation_recettes_pct: Optional[Decimal] = None
-    # Depenses
-    depenses_annee_1: Decimal
-    depenses_annee_2: Decimal
-    variation_depenses: Decimal
-    variation_depenses_pct: Optional[Decimal] = None
+    recettes_annee_1: Centimes
+    recettes_annee_2: Centimes
+    depenses_annee_1: Centimes
+    depenses_annee_2: Centimes
+
+    @computed_field(repr=False)
+    @property
+    def variation_recettes(self) -> Centimes:
+        """Receipts variation between the two years."""
+        return self.recettes_annee_2 - self.recettes_annee_1
+
+    @computed_field(repr=False)
+    @property
+    def variation_recettes_pct(self) -> Optional[Decimal]:
+        """Receipts variation (%), relative to the first year."""
+        return _taux(self.variation_recettes, self.recettes_annee_1)
+
+    @computed_field(repr=False)
+    @property
+    def variation_depenses(self) -> Centimes:
+        """Expenses variation between the two years."""
+        return self.depenses_annee_2 - self.depenses_annee_1
+
+    @computed_field(repr=False)
+    @property
+    def variation_depenses_pct(self) -> Optional[Decimal]:
+        """Expenses variation (%), relative to the first year."""
+        return _taux(self.variation_depenses, self.depenses_annee_1)
 
 
 class StatistiquesRegion(BaseSchema):
@@ -225,8 +363,18 @@ class StatistiquesRegion(BaseSchema):
     region_nom: str
     exercice_annee: int
     nb_communes: int
-    total_recettes: Decimal
-    total_depenses: Decimal
-    moyenne_recettes_commune: Decimal
-    moyenne_depenses_commune: Decimal
+    total_recettes: Centimes = 0
+    total_depenses: Centimes = 0
     taux_execution_moyen: Optional[Decimal] = None
+
+    @computed_field(repr=False)
+    @property
+    def moyenne_recettes_commune(self) -> Decimal:
+        """Average receipts per commune."""
+        return _moyenne(self.total_recettes, self.nb_communes)
+
+    @computed_field(repr=False)
+    @property
+    def moyenne_depenses_commune(self) -> Decimal:
+        """Average expenses per commune."""
+        return _moyenne(self.total_depenses, self.nb_communes)
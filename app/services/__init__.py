@@ -14,6 +14,7 @@ from app.services.search_service import SearchService, search_service
 from app.services.calcul_service import CalculService, calcul_service
 from app.services.validation_service import ValidationService, validation_service
 from app.services.audit_service import AuditService, audit_service
+from app.services.cache_service import ReferenceCacheService, reference_cache
 
 __all__ = [
     "AuthService",
@@ -31,4 +32,6 @@ __all__ = [
     "validation_service",
     "AuditService",
     "audit_service",
+    "ReferenceCacheService",
+    "reference_cache",
 ]
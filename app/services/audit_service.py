@@ -3,8 +3,12 @@ Service d'audit pour l'enregistrement des modifications.
 Journalise toutes les opérations CRUD sur les données sensibles.
 """
 
-from datetime import datetime
-from typing import Any, Optional
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from functools import cache
+from typing import Any, Callable, Optional
+from uuid import UUID
 
 from sqlalchemy.orm import Session
 
@@ -12,6 +16,52 @@ from app.models.annexes import AuditLog
 from app.models.enums import ActionAudit
 
 
+def _identite(value: Any) -> Any:
+    """Valeur déjà sérialisable, renvoyée telle quelle."""
+    return value
+
+
+def _nettoyer(value: Any) -> Any:
+    """Convertit une valeur en type sérialisable (table de conversion par type exact)."""
+    conversion = _CONVERSIONS.get(type(value))
+    if conversion is not None:
+        return conversion(value)
+    return _nettoyer_sous_classe(value)
+
+
+def _nettoyer_sous_classe(value: Any) -> Any:
+    """Cas lent : énumérations et sous-classes des types de la table."""
+    if isinstance(value, Enum):
+        return value.value
+    for type_, conversion in _CONVERSIONS.items():
+        if isinstance(value, type_):
+            return conversion(value)
+    return value
+
+
+# Conversion par type exact : une recherche dans un dict par valeur
+_CONVERSIONS: dict[type, Callable[[Any], Any]] = {
+    type(None): _identite,
+    str: _identite,
+    int: _identite,
+    float: _identite,
+    bool: _identite,
+    datetime: datetime.isoformat,
+    date: date.isoformat,
+    Decimal: float,
+    UUID: str,
+    list: lambda v: [_nettoyer(x) for x in v],
+    tuple: lambda v: [_nettoyer(x) for x in v],
+    dict: lambda v: {k: _nettoyer(x) for k, x in v.items()},
+}
+
+
+@cache
+def _noms_colonnes(model_cls: type) -> tuple[str, ...]:
+    """Noms des colonnes de la table d'un modèle, lus une fois par classe."""
+    return tuple(column.name for column in model_cls.__table__.columns)
+
+
 class AuditService:
     """
     Service pour l'enregistrement des actions dans le journal d'audit.
@@ -189,28 +239,11 @@ class AuditService:
         if not values:
             return {}
 
-        cleaned = {}
-        for key, value in values.items():
-            cleaned[key] = self._clean_value(value)
-
-        return cleaned
+        return {key: _nettoyer(value) for key, value in values.items()}
 
     def _clean_value(self, value: Any) -> Any:
         """Convertit une valeur en type sérialisable."""
-        if value is None:
-            return None
-        if isinstance(value, datetime):
-            return value.isoformat()
-        if hasattr(value, "value"):  # Enum
-            return value.value
-        if hasattr(value, "__decimal__") or str(type(value)) == "<class 'decimal.Decimal'>":
-            return float(value)
-        if isinstance(value, (list, tuple)):
-            return [self._clean_value(v) for v in value]
-        if isinstance(value, dict):
-            return {k: self._clean_value(v) for k, v in value.items()}
-        # Types de base (str, int, float, bool)
-        return value
+        return _nettoyer(value)
 
     def model_to_dict(self, model: Any, exclude: Optional[list[str]] = None) -> dict:
         """
@@ -223,16 +256,14 @@ class AuditService:
         Returns:
             Dictionnaire des valeurs du modèle
         """
-        exclude = exclude or []
-        exclude.extend(["_sa_instance_state"])  # Toujours exclure l'état SQLAlchemy
-
-        result = {}
-        for column in model.__table__.columns:
-            if column.name not in exclude:
-                value = getattr(model, column.name, None)
-                result[column.name] = self._clean_value(value)
-
-        return result
+        # Ensemble local : la liste de l'appelant n'est pas modifiée
+        exclus = frozenset(exclude or ())
+
+        return {
+            nom: _nettoyer(getattr(model, nom, None))
+            for nom in _noms_colonnes(type(model))
+            if nom not in exclus
+        }
 
 
 # Singleton instance
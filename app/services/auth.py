@@ -3,8 +3,8 @@ Authentication service.
 Handles user authentication, registration, and session management.
 """
 
-from datetime import datetime, timezone
-from typing import Optional, Tuple
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple, Union
 
 from sqlalchemy.orm import Session
 
@@ -12,15 +12,17 @@ from app.core.config import settings
 from app.core.security import (
     create_access_token,
     create_refresh_token,
+    dummy_verify_password,
     get_password_hash,
-    get_token_expiry,
+    hash_refresh_token,
+    verify_and_update_password,
     verify_password,
     verify_refresh_token,
 )
 from app.models.enums import RoleUtilisateur
 from app.models.utilisateurs import Session as UserSession
 from app.models.utilisateurs import Utilisateur
-from app.schemas.auth import Token, UserCreate, UserRegister
+from app.schemas.auth import Token, UserCreate, UserLoginResponse, UserRead, UserRegister
 
 
 class AuthService:
@@ -38,23 +40,36 @@ class AuthService:
             password: Plain text password
 
         Returns:
-            User object if authentication successful, None otherwise
+            User object if authentication successful, None otherwise.
+            Inactive users are only returned once the password is verified;
+            callers must reject them.
         """
         user = self.db.query(Utilisateur).filter(
-            Utilisateur.email == email
+            Utilisateur.par_email(email)
         ).first()
 
         if not user:
+            dummy_verify_password(password)
             return None
 
-        if not verify_password(password, user.mot_de_passe_hash):
+        valid, new_hash = verify_and_update_password(password, user.mot_de_passe_hash)
+        if not valid:
             return None
 
+        # Compte désactivé : refusé par l'appelant (403), seulement après un mot de passe correct
+        # pour ne pas révéler l'existence du compte
+        if not user.actif:
+            return user
+
+        # Ancien hachage (bcrypt) : remplacé par argon2id, enregistré au commit de la session
+        if new_hash:
+            user.mot_de_passe_hash = new_hash
+
         return user
 
     def create_user(
         self,
-        user_data: UserCreate | UserRegister,
+        user_data: Union[UserCreate, UserRegister],
         created_by: Optional[Utilisateur] = None
     ) -> Utilisateur:
         """
@@ -72,7 +87,7 @@ class AuthService:
         """
         # Check if email already exists
         existing = self.db.query(Utilisateur).filter(
-            Utilisateur.email == user_data.email
+            Utilisateur.par_email(user_data.email)
         ).first()
 
         if existing:
@@ -113,6 +128,44 @@ class AuthService:
         Returns:
             Token object with access and refresh tokens
         """
+        token = self._open_session(user, ip_address, user_agent)
+        self.db.commit()
+        return token
+
+    def login(
+        self,
+        user: Utilisateur,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None
+    ) -> UserLoginResponse:
+        """
+        Create tokens for a user and return them with the user information.
+
+        Args:
+            user: Authenticated user object
+            ip_address: Client IP address
+            user_agent: Client user agent
+
+        Returns:
+            Tokens and user information
+        """
+        token = self._open_session(user, ip_address, user_agent)
+
+        # Flush : updated_at relu par RETURNING (eager_defaults). L'utilisateur est
+        # lu en mémoire avant que le commit ne l'expire : pas de re-SELECT
+        self.db.flush()
+        user_read = UserRead.from_orm_trusted(user)
+        self.db.commit()
+
+        return UserLoginResponse(token=token, user=user_read)
+
+    def _open_session(
+        self,
+        user: Utilisateur,
+        ip_address: Optional[str],
+        user_agent: Optional[str]
+    ) -> Token:
+        """Sign the tokens and add the session row, without committing."""
         # Create access token
         access_token = create_access_token(
             subject=user.id,
@@ -121,16 +174,21 @@ class AuthService:
             commune_id=user.commune_id,
         )
 
-        # Create refresh token
-        refresh_token = create_refresh_token(subject=user.id)
+        # Expiry for session storage, computed once instead of decoding
+        # (and re-verifying) the token we are about to sign; JWT exp has
+        # one-second precision
+        expiry = (
+            datetime.now(timezone.utc)
+            + timedelta(minutes=settings.REFRESH_TOKEN_EXPIRE_MINUTES)
+        ).replace(microsecond=0)
 
-        # Get expiry for session storage
-        expiry = get_token_expiry(refresh_token)
+        # Create refresh token
+        refresh_token = create_refresh_token(subject=user.id, expires_at=expiry)
 
         # Store session in database
         session = UserSession(
             utilisateur_id=user.id,
-            refresh_token=refresh_token,
+            refresh_token_hash=hash_refresh_token(refresh_token),
             expires_at=expiry,
             ip_address=ip_address,
             user_agent=user_agent,
@@ -139,7 +197,6 @@ class AuthService:
 
         # Update last login
         user.derniere_connexion = datetime.now(timezone.utc)
-        self.db.commit()
 
         return Token(
             access_token=access_token,
@@ -172,21 +229,17 @@ class AuthService:
 
         user_id = int(payload.get("sub"))
 
-        # Find session in database
-        session = self.db.query(UserSession).filter(
-            UserSession.refresh_token == refresh_token,
+        # Find session in database (colonnes de l'index couvrant uniquement)
+        # L'expiration n'est pas relue : la session expire au même instant que le
+        # token (même valeur), dont le claim exp vient d'être vérifié au décodage
+        session = self.db.query(UserSession.id).filter(
+            UserSession.refresh_token_hash == hash_refresh_token(refresh_token),
             UserSession.utilisateur_id == user_id,
         ).first()
 
         if not session:
             return None
 
-        # Check if expired
-        if session.is_expired:
-            self.db.delete(session)
-            self.db.commit()
-            return None
-
         # Get user
         user = self.db.query(Utilisateur).filter(
             Utilisateur.id == user_id
@@ -196,7 +249,7 @@ class AuthService:
             return None
 
         # Delete old session
-        self.db.delete(session)
+        self._delete_session(session.id)
         self.db.commit()
 
         # Create new tokens
@@ -212,16 +265,17 @@ class AuthService:
         Returns:
             True if logout successful
         """
-        session = self.db.query(UserSession).filter(
-            UserSession.refresh_token == refresh_token
-        ).first()
-
-        if session:
-            self.db.delete(session)
-            self.db.commit()
-            return True
+        deleted = self.db.query(UserSession).filter(
+            UserSession.refresh_token_hash == hash_refresh_token(refresh_token)
+        ).delete(synchronize_session=False)
+        self.db.commit()
+        return deleted > 0
 
-        return False
+    def _delete_session(self, session_id: int) -> None:
+        """Supprime une session par identifiant, sans la charger."""
+        self.db.query(UserSession).filter(
+            UserSession.id == session_id
+        ).delete(synchronize_session=False)
 
     def logout_all(self, user_id: int) -> int:
         """
@@ -297,7 +351,7 @@ class AuthService:
             True if password reset successfully
         """
         user = self.db.query(Utilisateur).filter(
-            Utilisateur.email == email
+            Utilisateur.par_email(email)
         ).first()
 
         if not user:
@@ -322,7 +376,7 @@ class AuthService:
             True if email verified successfully
         """
         user = self.db.query(Utilisateur).filter(
-            Utilisateur.email == email
+            Utilisateur.par_email(email)
         ).first()
 
         if not user:
@@ -344,7 +398,7 @@ class AuthService:
             User object or None
         """
         return self.db.query(Utilisateur).filter(
-            Utilisateur.email == email
+            Utilisateur.par_email(email)
         ).first()
 
     def get_user_by_id(self, user_id: int) -> Optional[Utilisateur]:
@@ -0,0 +1,321 @@
+"""
+Cache en mémoire des données de référence.
+Exercices, plan comptable et géographie : petites tables lues à chaque
+requête de tableau, modifiées quelques fois par an.
+"""
+
+import threading
+import time
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import date
+from typing import Any, Callable, Optional
+
+from pydantic import TypeAdapter
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.comptabilite import Exercice, PlanComptable
+from app.models.enums import SectionBudgetaire, TypeCommune, TypeMouvement
+from app.models.geographie import Commune, Province, Region
+from app.schemas.comptabilite import PlanComptableTree
+
+_ARBRE_ADAPTER = TypeAdapter(list[PlanComptableTree])
+
+
+@dataclass(frozen=True)
+class ExerciceRef:
+    """Instantané immuable d'un exercice (indépendant de la session)."""
+    id: int
+    annee: int
+    libelle: Optional[str]
+    date_debut: date
+    date_fin: date
+    cloture: bool
+
+
+@dataclass(frozen=True)
+class CompteRef:
+    """Instantané immuable d'une rubrique du plan comptable."""
+    code: str
+    intitule: str
+    niveau: int
+    type_mouvement: TypeMouvement
+    section: SectionBudgetaire
+    parent_code: Optional[str]
+    est_sommable: bool
+    ordre_affichage: Optional[int]
+
+
+@dataclass(frozen=True)
+class ProvinceRef:
+    """Instantané immuable d'une province."""
+    id: int
+    code: str
+    nom: str
+
+
+@dataclass(frozen=True)
+class RegionRef:
+    """Instantané immuable d'une région, avec sa province."""
+    id: int
+    code: str
+    nom: str
+    province_id: int
+    province: ProvinceRef
+
+
+@dataclass(frozen=True)
+class CommuneRef:
+    """Instantané immuable d'une commune, avec sa région et sa province."""
+    id: int
+    code: str
+    nom: str
+    type_commune: Optional[TypeCommune]
+    region_id: int
+    province_id: int
+    region: RegionRef
+
+
+@dataclass(frozen=True)
+class GeographieRef:
+    """Hiérarchie géographique complète, indexée par identifiant."""
+    provinces: dict[int, ProvinceRef]
+    regions: dict[int, RegionRef]
+    communes: dict[int, CommuneRef]
+
+
+class TTLCache:
+    """
+    Cache clé/valeur minimal avec expiration.
+    Partagé par tous les threads du processus.
+    """
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._data: dict[Any, tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+
+    def get_or_load(self, key: Any, loader: Callable[[], Any]) -> Any:
+        """Retourne la valeur en cache ou la charge via `loader`."""
+        now = time.monotonic()
+        entry = self._data.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        value = loader()
+        with self._lock:
+            self._data[key] = (now + self.ttl, value)
+        return value
+
+    def pop(self, key: Any) -> None:
+        """Supprime une entrée."""
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        """Vide le cache."""
+        with self._lock:
+            self._data.clear()
+
+
+class ReferenceCacheService:
+    """
+    Service de cache des tables de référence (exercices, plan comptable,
+    provinces, régions, communes).
+
+    Les valeurs mises en cache sont des instantanés immuables et non des
+    objets ORM, afin de pouvoir être partagées entre sessions.
+    """
+
+    def __init__(self, ttl: float = settings.REFERENCE_CACHE_TTL_SECONDS):
+        self._cache = TTLCache(ttl)
+
+    # =====================
+    # Exercices
+    # =====================
+
+    def _load_exercices(self, db: Session) -> dict[int, ExerciceRef]:
+        """Charge tous les exercices, indexés par année."""
+        return {
+            e.annee: ExerciceRef(
+                id=e.id,
+                annee=e.annee,
+                libelle=e.libelle,
+                date_debut=e.date_debut,
+                date_fin=e.date_fin,
+                cloture=e.cloture,
+            )
+            for e in db.query(Exercice).all()
+        }
+
+    def get_exercices(self, db: Session) -> dict[int, ExerciceRef]:
+        """Retourne tous les exercices indexés par année."""
+        return self._cache.get_or_load("exercices", lambda: self._load_exercices(db))
+
+    def get_exercice_by_annee(self, db: Session, annee: int) -> Optional[ExerciceRef]:
+        """
+        Retourne l'exercice d'une année donnée, None s'il n'existe pas.
+        Les écritures sur les exercices appellent invalidate() : une absence
+        ne déclenche pas de rechargement.
+        """
+        return self.get_exercices(db).get(annee)
+
+    # =====================
+    # Plan comptable
+    # =====================
+
+    def _load_comptes(
+        self,
+        db: Session,
+        type_mouvement: TypeMouvement,
+        section: SectionBudgetaire,
+    ) -> tuple[CompteRef, ...]:
+        """Charge les rubriques actives d'une section, dans l'ordre d'affichage."""
+        comptes = db.query(PlanComptable).filter(
+            PlanComptable.type_mouvement == type_mouvement,
+            PlanComptable.section == section,
+            PlanComptable.actif == True
+        ).order_by(PlanComptable.ordre_affichage, PlanComptable.code).all()
+
+        return tuple(
+            CompteRef(
+                code=c.code,
+                intitule=c.intitule,
+                niveau=c.niveau,
+                type_mouvement=c.type_mouvement,
+                section=c.section,
+                parent_code=c.parent_code,
+                est_sommable=c.est_sommable,
+                ordre_affichage=c.ordre_affichage,
+            )
+            for c in comptes
+        )
+
+    def get_comptes(
+        self,
+        db: Session,
+        type_mouvement: TypeMouvement,
+        section: SectionBudgetaire,
+    ) -> tuple[CompteRef, ...]:
+        """Retourne les rubriques actives d'une section du plan comptable."""
+        return self._cache.get_or_load(
+            ("comptes", type_mouvement, section),
+            lambda: self._load_comptes(db, type_mouvement, section),
+        )
+
+    def _load_arbre_comptes(self, db: Session) -> bytes:
+        """
+        Construit l'arborescence complète du plan comptable, sérialisée en JSON.
+        Une requête en projection de colonnes, puis un seul passage qui
+        rattache chaque nœud à la liste d'enfants de son parent.
+        """
+        colonnes = [
+            getattr(PlanComptable, name)
+            for name in PlanComptableTree.__trusted_fields__
+            if name != "enfants"
+        ]
+        comptes = db.execute(
+            select(*colonnes).order_by(
+                PlanComptable.type_mouvement,
+                PlanComptable.section,
+                PlanComptable.ordre_affichage.nullslast(),
+                PlanComptable.code,
+            )
+        ).mappings().all()
+
+        codes = {c["code"] for c in comptes}
+        enfants: defaultdict[str, list[PlanComptableTree]] = defaultdict(list)
+        racines = []
+        for c in comptes:
+            noeud = PlanComptableTree.model_construct(**c, enfants=enfants[c["code"]])
+            if c["parent_code"] in codes:
+                enfants[c["parent_code"]].append(noeud)
+            else:
+                racines.append(noeud)
+
+        return _ARBRE_ADAPTER.dump_json(racines)
+
+    def get_arbre_comptes(self, db: Session) -> bytes:
+        """
+        Retourne l'arborescence du plan comptable déjà sérialisée : construite
+        une fois, jusqu'à expiration ou invalidation après une écriture.
+        """
+        return self._cache.get_or_load(
+            ("arbre_comptes",),
+            lambda: self._load_arbre_comptes(db),
+        )
+
+    # =====================
+    # Géographie
+    # =====================
+
+    def _load_geographie(self, db: Session) -> GeographieRef:
+        """Charge provinces, régions et communes (projection de colonnes)."""
+        provinces = {
+            p.id: ProvinceRef(id=p.id, code=p.code, nom=p.nom)
+            for p in db.query(Province.id, Province.code, Province.nom)
+        }
+        regions = {
+            r.id: RegionRef(
+                id=r.id,
+                code=r.code,
+                nom=r.nom,
+                province_id=r.province_id,
+                province=provinces[r.province_id],
+            )
+            for r in db.query(Region.id, Region.code, Region.nom, Region.province_id)
+        }
+        communes = {
+            c.id: CommuneRef(
+                id=c.id,
+                code=c.code,
+                nom=c.nom,
+                type_commune=c.type_commune,
+                region_id=c.region_id,
+                province_id=c.province_id,
+                region=regions[c.region_id],
+            )
+            for c in db.query(
+                Commune.id, Commune.code, Commune.nom, Commune.type_commune,
+                Commune.region_id, Commune.province_id,
+            )
+        }
+        return GeographieRef(provinces=provinces, regions=regions, communes=communes)
+
+    def get_geographie(self, db: Session) -> GeographieRef:
+        """Retourne la hiérarchie géographique complète."""
+        return self._cache.get_or_load("geographie", lambda: self._load_geographie(db))
+
+    def get_commune(self, db: Session, commune_id: int) -> Optional[CommuneRef]:
+        """
+        Retourne une commune avec sa région et sa province, None si l'identifiant
+        est inconnu. Une absence ne déclenche pas de rechargement : un identifiant
+        invalide répété ne doit pas recharger toute la géographie à chaque requête
+        (fraîcheur assurée par le TTL et invalidate()).
+        """
+        return self.get_geographie(db).communes.get(commune_id)
+
+    def get_region(self, db: Session, region_id: int) -> Optional[RegionRef]:
+        """Retourne une région avec sa province."""
+        return self.get_geographie(db).regions.get(region_id)
+
+    def get_communes_region(self, db: Session, region_id: int) -> tuple[CommuneRef, ...]:
+        """Retourne les communes d'une région."""
+        return tuple(
+            c for c in self.get_geographie(db).communes.values()
+            if c.region_id == region_id
+        )
+
+    # =====================
+    # Invalidation
+    # =====================
+
+    def invalidate(self) -> None:
+        """Invalide le cache (à appeler après toute modification des référentiels)."""
+        self._cache.clear()
+
+
+# Singleton instance
+reference_cache = ReferenceCacheService()
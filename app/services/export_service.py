@@ -32,11 +32,11 @@ from app.schemas.tableau import (
 )
 
 
-def format_montant(montant: Optional[Decimal], with_symbol: bool = False) -> str:
-    """Format amount in Ariary (MGA) with thousands separator."""
-    if montant is None:
+def format_montant(centimes: Optional[int], with_symbol: bool = False) -> str:
+    """Format amount (in cents, as held by the table schemas) in Ariary (MGA) with thousands separator."""
+    if centimes is None:
         return ""
-    value = float(montant)
+    value = centimes / 100
     formatted = f"{value:,.0f}".replace(",", " ")
     if with_symbol:
         return f"{formatted} MGA"
@@ -5,11 +5,13 @@ Handles administrative account data import from Excel files.
 
 from dataclasses import dataclass
 from decimal import Decimal, InvalidOperation
-from io import BytesIO
-from typing import Any, Optional
+from io import BytesIO, StringIO
+from typing import Any, Optional, Union
 
 from openpyxl import load_workbook
 from openpyxl.worksheet.worksheet import Worksheet
+from sqlalchemy import Integer, column, literal, literal_column, select, table, text
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.orm import Session
 
 from app.models.comptabilite import (
@@ -361,6 +363,70 @@ class ExcelImportService:
 
         return result
 
+    def _write_rows(
+        self,
+        model: Union[type[DonneesRecettes], type[DonneesDepenses]],
+        commune_id: int,
+        exercice_id: int,
+        rows: dict[str, dict[str, Decimal]],
+        update_existing: bool,
+    ) -> tuple[int, int]:
+        """
+        Write imported rows in bulk. Returns (imported, updated) counts.
+
+        Rows are streamed with COPY into a temporary table, then merged with a
+        single INSERT ... ON CONFLICT on (commune_id, exercice_id, compte_code).
+        """
+        if not rows:
+            return (0, 0)
+
+        colonnes = list(next(iter(rows.values())).keys())
+        nom_tmp = f"import_{model.__tablename__}"
+
+        # Table temporaire de la transaction, vidée si une feuille précédente l'a utilisée
+        self.db.execute(text(
+            f"CREATE TEMP TABLE IF NOT EXISTS {nom_tmp} "
+            f"(compte_code VARCHAR(10), {', '.join(f'{c} NUMERIC(18, 2)' for c in colonnes)}) "
+            "ON COMMIT DROP"
+        ))
+        self.db.execute(text(f"TRUNCATE {nom_tmp}"))
+
+        # COPY (format texte, séparateur tabulation) sur la connexion de la session
+        buffer = StringIO()
+        for code, values in rows.items():
+            buffer.write("\t".join([code, *(str(values[c]) for c in colonnes)]) + "\n")
+        buffer.seek(0)
+        with self.db.connection().connection.cursor() as cursor:
+            cursor.copy_expert(
+                f"COPY {nom_tmp} (compte_code, {', '.join(colonnes)}) FROM STDIN", buffer
+            )
+
+        tmp = table(nom_tmp, column("compte_code"), *(column(c) for c in colonnes))
+        stmt = insert(model).from_select(
+            ["commune_id", "exercice_id", "compte_code", *colonnes],
+            select(
+                literal(commune_id, Integer),
+                literal(exercice_id, Integer),
+                tmp.c.compte_code,
+                *(tmp.c[c] for c in colonnes),
+            ),
+        )
+        cle = [model.commune_id, model.exercice_id, model.compte_code]
+        if update_existing:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=cle,
+                set_={c: stmt.excluded[c] for c in colonnes},
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=cle)
+
+        # xmax = 0 : ligne insérée ; sinon ligne existante mise à jour
+        inseree = self.db.execute(
+            stmt.returning(literal_column("xmax = 0"))
+        ).scalars().all()
+        imported = sum(1 for flag in inseree if flag)
+        return (imported, len(inseree) - imported)
+
     def _import_recettes_sheet(
         self,
         ws: Worksheet,
@@ -369,13 +435,11 @@ class ExcelImportService:
         update_existing: bool,
     ) -> tuple[int, int]:
         """Import recettes from worksheet. Returns (imported, updated) counts."""
-        imported = 0
-        updated = 0
-
         start_row = self._find_data_start_row(ws)
         if start_row == 0:
             return (0, 0)
 
+        rows: dict[str, dict[str, Decimal]] = {}
         for row in ws.iter_rows(min_row=start_row):
             code = row[self.RECETTES_COLUMNS["code"]].value
             if code is None or str(code).strip() == "":
@@ -411,33 +475,11 @@ class ExcelImportService:
                 ),
             }
 
-            # Check if entry exists
-            existing = (
-                self.db.query(DonneesRecettes)
-                .filter(
-                    DonneesRecettes.commune_id == commune_id,
-                    DonneesRecettes.exercice_id == exercice_id,
-                    DonneesRecettes.compte_code == code,
-                )
-                .first()
-            )
-
-            if existing:
-                if update_existing:
-                    for field, value in values.items():
-                        setattr(existing, field, value)
-                    updated += 1
-            else:
-                recette = DonneesRecettes(
-                    commune_id=commune_id,
-                    exercice_id=exercice_id,
-                    compte_code=code,
-                    **values,
-                )
-                self.db.add(recette)
-                imported += 1
+            rows[code] = values
 
-        return (imported, updated)
+        return self._write_rows(
+            DonneesRecettes, commune_id, exercice_id, rows, update_existing
+        )
 
     def _import_depenses_sheet(
         self,
@@ -447,13 +489,11 @@ class ExcelImportService:
         update_existing: bool,
     ) -> tuple[int, int]:
         """Import depenses from worksheet. Returns (imported, updated) counts."""
-        imported = 0
-        updated = 0
-
         start_row = self._find_data_start_row(ws)
         if start_row == 0:
             return (0, 0)
 
+        rows: dict[str, dict[str, Decimal]] = {}
         for row in ws.iter_rows(min_row=start_row):
             code = row[self.DEPENSES_COLUMNS["code"]].value
             if code is None or str(code).strip() == "":
@@ -491,29 +531,8 @@ class ExcelImportService:
                 ),
             }
 
-            existing = (
-                self.db.query(DonneesDepenses)
-                .filter(
-                    DonneesDepenses.commune_id == commune_id,
-                    DonneesDepenses.exercice_id == exercice_id,
-                    DonneesDepenses.compte_code == code,
-                )
-                .first()
-            )
-
-            if existing:
-                if update_existing:
-                    for field, value in values.items():
-                        setattr(existing, field, value)
-                    updated += 1
-            else:
-                depense = DonneesDepenses(
-                    commune_id=commune_id,
-                    exercice_id=exercice_id,
-                    compte_code=code,
-                    **values,
-                )
-                self.db.add(depense)
-                imported += 1
+            rows[code] = values
 
-        return (imported, updated)
+        return self._write_rows(
+            DonneesDepenses, commune_id, exercice_id, rows, update_existing
+        )
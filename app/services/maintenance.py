@@ -0,0 +1,70 @@
+"""
+Tâches de maintenance périodiques de la base.
+Lancées au démarrage de l'application (comme le tampon des visites), sur le
+pool de journalisation : elles n'occupent jamais une connexion des requêtes.
+"""
+
+import asyncio
+import zlib
+
+from loguru import logger
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.database import LogSessionLocal
+
+
+def _cle_verrou(nom: str) -> int:
+    """Clé de verrou consultatif stable pour une tâche (même valeur dans chaque processus)."""
+    return zlib.crc32(nom.encode())
+
+
+class TacheMaintenance:
+    """
+    Exécute une fonction SQL toutes les `interval_seconds` secondes, la
+    première fois dès le démarrage.
+
+    Plusieurs workers lancent la même tâche : un verrou consultatif de
+    transaction garantit qu'un seul l'exécute à la fois, les autres passent
+    leur tour.
+    """
+
+    def __init__(self, nom: str, sql: str, interval_seconds: float):
+        self.nom = nom
+        self.sql = text(sql)
+        self.interval_seconds = interval_seconds
+        self._cle = _cle_verrou(nom)
+
+    def _execute(self) -> None:
+        """Exécution synchrone (hors de la boucle d'événements)."""
+        try:
+            with LogSessionLocal() as db:
+                verrou = db.execute(
+                    text("SELECT pg_try_advisory_xact_lock(:cle)"), {"cle": self._cle}
+                ).scalar()
+                if verrou:
+                    db.execute(self.sql)
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Échec de la tâche de maintenance {self.nom} : {e}")
+
+    async def run(self) -> None:
+        """Boucle périodique, jusqu'à annulation (arrêt de l'application)."""
+        while True:
+            await asyncio.to_thread(self._execute)
+            await asyncio.sleep(self.interval_seconds)
+
+
+# Agrégats des revenus miniers (vue matérialisée mv_revenus_miniers_commune_exercice)
+rafraichissement_revenus_miniers = TacheMaintenance(
+    "rafraichir_revenus_miniers_agreges",
+    "SELECT rafraichir_revenus_miniers_agreges()",
+    settings.MV_REVENUS_MINIERS_REFRESH_SECONDS,
+)
+
+# Partitions mensuelles d'audit_log et statistiques_visites (mois courant et suivants)
+creation_partitions_mensuelles = TacheMaintenance(
+    "creer_partitions_mensuelles",
+    "SELECT creer_partitions_mensuelles()",
+    settings.PARTITIONS_MENSUELLES_INTERVAL_SECONDS,
+)
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from typing import Optional
 
 from sqlalchemy import func, or_, text
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, selectinload, undefer
 
 from app.models.documents import Document
 from app.models.geographie import Commune, Province, Region
@@ -171,7 +171,7 @@ class SearchService:
 
         # Search documents
         if "document" in search_types:
-            documents = self._search_documents(db, like_term, limit)
+            documents = self._search_documents(db, query, limit)
             for d in documents:
                 all_results.append(SearchResult(
                     type="document",
@@ -296,7 +296,9 @@ class SearchService:
 
     def _search_communes(self, db: Session, like_term: str, limit: int) -> list[Commune]:
         """Search communes by name or code."""
-        return db.query(Commune).filter(
+        return db.query(Commune).options(
+            *Commune.with_full_detail()
+        ).filter(
             or_(
                 Commune.nom.ilike(like_term),
                 Commune.code.ilike(like_term),
@@ -324,7 +326,9 @@ class SearchService:
 
     def _search_projets(self, db: Session, like_term: str, limit: int) -> list[ProjetMinier]:
         """Search mining projects by name or mineral type."""
-        return db.query(ProjetMinier).filter(
+        return db.query(ProjetMinier).options(
+            joinedload(ProjetMinier.societe)
+        ).filter(
             or_(
                 ProjetMinier.nom.ilike(like_term),
                 ProjetMinier.type_minerai.ilike(like_term),
@@ -334,22 +338,22 @@ class SearchService:
 
     def _search_societes(self, db: Session, like_term: str, limit: int) -> list[SocieteMiniere]:
         """Search mining companies by name."""
-        return db.query(SocieteMiniere).filter(
+        return db.query(SocieteMiniere).options(
+            selectinload(SocieteMiniere.projets).load_only(ProjetMinier.id)
+        ).filter(
             or_(
                 SocieteMiniere.nom.ilike(like_term),
                 SocieteMiniere.pays_origine.ilike(like_term),
             )
         ).limit(limit).all()
 
-    def _search_documents(self, db: Session, like_term: str, limit: int) -> list[Document]:
-        """Search public documents by title or description."""
-        return db.query(Document).filter(
+    def _search_documents(self, db: Session, query: str, limit: int) -> list[Document]:
+        """Search public documents by title, description or file name (full-text)."""
+        return db.query(Document).options(
+            undefer(Document.description)
+        ).filter(
             Document.public == True,
-            or_(
-                Document.titre.ilike(like_term),
-                Document.description.ilike(like_term),
-                Document.nom_fichier.ilike(like_term),
-            )
+            Document.recherche(query),
         ).limit(limit).all()
 
 
@@ -0,0 +1,138 @@
+"""
+Tampon en mémoire des visites de pages.
+Les visites sont agrégées par jour/page/commune puis écrites par lots, en
+un seul upsert, par une tâche de fond lancée au démarrage de l'application :
+aucune écriture en base sur le chemin de la requête.
+"""
+
+import asyncio
+import random
+from datetime import date
+from typing import Optional
+
+from loguru import logger
+from sqlalchemy import func, literal_column
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.database import LogSessionLocal
+from app.models.annexes import NB_COMPARTIMENTS_STATS, StatistiqueVisite
+
+# (date_visite, page, commune_id)
+CleVisite = tuple[date, str, Optional[int]]
+# (nb_visites, nb_telechargements, ip_address, user_agent)
+Compteur = tuple[int, int, Optional[str], Optional[str]]
+
+
+def increment_statistiques(db: Session, compteurs: dict[CleVisite, Compteur]) -> None:
+    """
+    Incrémente les compteurs jour/page/commune en un seul upsert.
+    Chaque appel tire un compartiment au hasard : deux écritures concurrentes
+    sur la même page verrouillent rarement la même ligne.
+    """
+    compartiment = random.randrange(NB_COMPARTIMENTS_STATS)
+    stmt = insert(StatistiqueVisite).values([
+        {
+            "date_visite": date_visite,
+            "page": page,
+            "commune_id": commune_id,
+            "compartiment": compartiment,
+            "nb_visites": nb_visites,
+            "nb_telechargements": nb_telechargements,
+            "ip_address": ip_address,
+            "user_agent": user_agent[:500] if user_agent else None,
+        }
+        for (date_visite, page, commune_id), (nb_visites, nb_telechargements, ip_address, user_agent)
+        in compteurs.items()
+    ])
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[
+            StatistiqueVisite.date_visite,
+            StatistiqueVisite.page,
+            # Expression de l'index uk_stats_compteur, à l'identique (constante littérale)
+            func.coalesce(StatistiqueVisite.commune_id, literal_column("0")),
+            StatistiqueVisite.compartiment,
+        ],
+        set_={
+            "nb_visites": StatistiqueVisite.nb_visites + stmt.excluded.nb_visites,
+            "nb_telechargements": StatistiqueVisite.nb_telechargements + stmt.excluded.nb_telechargements,
+        },
+    )
+    db.execute(stmt)
+
+
+class VisitBuffer:
+    """
+    Agrège les visites en mémoire et les écrit toutes les `flush_seconds`
+    secondes, ou dès que `max_size` compteurs distincts sont en attente.
+
+    `add` est appelé depuis la boucle d'événements (endpoints async) : pas de
+    verrou, l'échange du tampon avant écriture se fait dans la même boucle.
+    """
+
+    def __init__(
+        self,
+        max_size: int = settings.VISIT_BUFFER_MAX_SIZE,
+        flush_seconds: float = settings.VISIT_BUFFER_FLUSH_SECONDS,
+    ):
+        self.max_size = max_size
+        self.flush_seconds = flush_seconds
+        # Valeur : [nb_visites, ip_address, user_agent] (IP et agent de la première visite)
+        self._compteurs: dict[CleVisite, list] = {}
+        self._plein: Optional[asyncio.Event] = None
+
+    def add(
+        self,
+        visits: list[tuple[str, Optional[int]]],
+        ip_address: Optional[str],
+        user_agent: Optional[str],
+    ) -> None:
+        """Ajoute des visites (page, commune_id) au tampon."""
+        today = date.today()
+        for page, commune_id in visits:
+            cle = (today, page, commune_id)
+            compteur = self._compteurs.get(cle)
+            if compteur is None:
+                self._compteurs[cle] = [1, ip_address, user_agent]
+            else:
+                compteur[0] += 1
+
+        if self._plein is not None and len(self._compteurs) >= self.max_size:
+            self._plein.set()
+
+    async def flush(self) -> None:
+        """Écrit les compteurs en attente, sur le pool de journalisation."""
+        if self._plein is not None:
+            self._plein.clear()
+        if not self._compteurs:
+            return
+
+        compteurs, self._compteurs = self._compteurs, {}
+        await asyncio.to_thread(self._write, {
+            cle: (nb_visites, 0, ip_address, user_agent)
+            for cle, (nb_visites, ip_address, user_agent) in compteurs.items()
+        })
+
+    def _write(self, compteurs: dict[CleVisite, Compteur]) -> None:
+        """Upsert d'un lot de compteurs (exécuté hors de la boucle d'événements)."""
+        try:
+            with LogSessionLocal() as db:
+                increment_statistiques(db, compteurs)
+                db.commit()
+        except Exception as e:
+            logger.warning(f"Échec de l'enregistrement de {len(compteurs)} compteur(s) de visites : {e}")
+
+    async def run(self) -> None:
+        """Boucle d'écriture périodique, jusqu'à annulation (arrêt de l'application)."""
+        self._plein = asyncio.Event()
+        while True:
+            try:
+                await asyncio.wait_for(self._plein.wait(), self.flush_seconds)
+            except asyncio.TimeoutError:
+                pass
+            await self.flush()
+
+
+# Instance unique par processus
+visit_buffer = VisitBuffer()
@@ -7,6 +7,7 @@
 -- =============================================================================
 
 -- Suppression des tables existantes (dans l'ordre inverse des dependances)
+DROP MATERIALIZED VIEW IF EXISTS mv_revenus_miniers_commune_exercice CASCADE;
 DROP VIEW IF EXISTS vue_tableau_equilibre CASCADE;
 DROP VIEW IF EXISTS vue_tableau_depenses CASCADE;
 DROP VIEW IF EXISTS vue_tableau_recettes CASCADE;
@@ -46,6 +47,18 @@ DROP TYPE IF EXISTS type_document CASCADE;
 DROP TYPE IF EXISTS role_utilisateur CASCADE;
 DROP TYPE IF EXISTS section_budgetaire CASCADE;
 DROP TYPE IF EXISTS type_mouvement CASCADE;
+DROP TYPE IF EXISTS type_commune_enum CASCADE;
+DROP TYPE IF EXISTS statut_projet_minier CASCADE;
+DROP TYPE IF EXISTS type_revenu_minier CASCADE;
+DROP TYPE IF EXISTS type_carte CASCADE;
+DROP TYPE IF EXISTS action_audit CASCADE;
+
+-- =============================================================================
+-- EXTENSIONS
+-- =============================================================================
+
+-- Chemins hierarchiques (plan_comptable.chemin)
+CREATE EXTENSION IF NOT EXISTS ltree;
 
 -- =============================================================================
 -- TYPES ENUMERES
@@ -87,6 +100,27 @@ CREATE TYPE type_section_cms AS ENUM (
     'graphiques_analytiques' -- Section graphiques analytiques
 );
 
+-- Types de communes
+CREATE TYPE type_commune_enum AS ENUM ('urbaine', 'rurale');
+
+-- Statut des projets miniers
+CREATE TYPE statut_projet_minier AS ENUM ('exploration', 'exploitation', 'rehabilitation', 'ferme');
+
+-- Types de revenus miniers
+CREATE TYPE type_revenu_minier AS ENUM (
+    'ristourne_miniere',
+    'redevance_miniere',
+    'frais_administration_miniere',
+    'quote_part_ristourne',
+    'autre'
+);
+
+-- Types de cartes informatives CMS
+CREATE TYPE type_carte AS ENUM ('image', 'statistique', 'icone');
+
+-- Actions journalisees dans l'audit
+CREATE TYPE action_audit AS ENUM ('INSERT', 'UPDATE', 'DELETE');
+
 -- =============================================================================
 -- 1. TABLES GEOGRAPHIQUES
 -- =============================================================================
@@ -123,8 +157,11 @@ CREATE TABLE communes (
     id SERIAL PRIMARY KEY,
     code VARCHAR(20) UNIQUE NOT NULL,
     nom VARCHAR(150) NOT NULL,
-    type_commune VARCHAR(20) CHECK (type_commune IN ('urbaine', 'rurale')),
+    type_commune type_commune_enum,
     region_id INTEGER NOT NULL REFERENCES regions(id) ON DELETE CASCADE,
+    -- Sans FK : copiee de regions.province_id par trigger, l'integrite est
+    -- deja garantie par communes.region_id -> regions -> provinces
+    province_id INTEGER NOT NULL,
     population INTEGER,
     superficie_km2 DECIMAL(10, 2),
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
@@ -133,9 +170,11 @@ CREATE TABLE communes (
 
 COMMENT ON TABLE communes IS 'Communes de Madagascar (collectivites territoriales)';
 COMMENT ON COLUMN communes.type_commune IS 'Type: urbaine ou rurale';
+COMMENT ON COLUMN communes.province_id IS 'Province de la region (denormalisee, maintenue par trigger)';
 
 CREATE INDEX idx_communes_region ON communes(region_id);
 CREATE INDEX idx_communes_nom ON communes(nom);
+CREATE INDEX idx_communes_province_region ON communes(province_id, region_id);
 
 -- =============================================================================
 -- 2. TABLE PLAN COMPTABLE
@@ -150,6 +189,8 @@ CREATE TABLE plan_comptable (
     type_mouvement type_mouvement NOT NULL,
     section section_budgetaire NOT NULL,
     parent_code VARCHAR(10),
+    -- Chemin complet depuis la racine (ex. 70.701.7011), maintenu par trigger
+    chemin LTREE NOT NULL,
     est_sommable BOOLEAN DEFAULT TRUE,
     ordre_affichage INTEGER,
     actif BOOLEAN DEFAULT TRUE,
@@ -166,11 +207,15 @@ COMMENT ON COLUMN plan_comptable.niveau IS '1=categorie principale, 2=sous-categ
 COMMENT ON COLUMN plan_comptable.type_mouvement IS 'recette ou depense';
 COMMENT ON COLUMN plan_comptable.section IS 'fonctionnement ou investissement';
 COMMENT ON COLUMN plan_comptable.parent_code IS 'Code du compte parent pour la hierarchie';
+COMMENT ON COLUMN plan_comptable.chemin IS 'Chemin ltree des codes depuis la racine (sous-arbre : chemin <@ X)';
 COMMENT ON COLUMN plan_comptable.est_sommable IS 'Si true, les valeurs enfants sont sommees';
 COMMENT ON COLUMN plan_comptable.ordre_affichage IS 'Ordre pour reproduire la structure Excel';
 
 CREATE INDEX idx_plan_comptable_parent ON plan_comptable(parent_code);
-CREATE INDEX idx_plan_comptable_type ON plan_comptable(type_mouvement, section);
+CREATE INDEX idx_plan_comptable_chemin ON plan_comptable USING GIST (chemin);
+-- Rubriques actives seulement : chargement du cache de reference (tableaux)
+CREATE INDEX idx_plan_comptable_actifs ON plan_comptable(type_mouvement, section, ordre_affichage, code)
+    WHERE actif = TRUE;
 CREATE INDEX idx_plan_comptable_niveau ON plan_comptable(niveau);
 CREATE INDEX idx_plan_comptable_ordre ON plan_comptable(type_mouvement, section, ordre_affichage);
 
@@ -216,13 +261,19 @@ COMMENT ON COLUMN comptes_administratifs.created_by IS 'Utilisateur ayant cree l
 
 CREATE INDEX idx_compte_admin_commune ON comptes_administratifs(commune_id);
 CREATE INDEX idx_compte_admin_exercice ON comptes_administratifs(exercice_id);
+CREATE INDEX idx_compte_admin_created_by ON comptes_administratifs(created_by) WHERE created_by IS NOT NULL;
 
 -- Donnees RECETTES par commune/exercice/compte
+-- Partitionnee par exercice (LIST) : les requetes filtrent quasi toujours
+-- sur un seul exercice_id, Postgres n'explore alors qu'une partition.
+-- La cle de partition doit figurer dans la cle primaire et les contraintes uniques.
 CREATE TABLE donnees_recettes (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     commune_id INTEGER NOT NULL REFERENCES communes(id) ON DELETE CASCADE,
     exercice_id INTEGER NOT NULL REFERENCES exercices(id) ON DELETE CASCADE,
     compte_code VARCHAR(10) NOT NULL REFERENCES plan_comptable(code) ON DELETE CASCADE,
+    -- Section denormalisee depuis plan_comptable (trigger sync_donnees_section)
+    section section_budgetaire NOT NULL,
 
     -- Colonnes financieres (en Ariary - MGA)
     budget_primitif DECIMAL(18, 2) DEFAULT 0,
@@ -242,9 +293,10 @@ CREATE TABLE donnees_recettes (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
+    CONSTRAINT pk_donnees_recettes PRIMARY KEY (id, exercice_id),
     CONSTRAINT uk_recettes_commune_exercice_compte
         UNIQUE (commune_id, exercice_id, compte_code)
-);
+) PARTITION BY LIST (exercice_id);
 
 COMMENT ON TABLE donnees_recettes IS 'Donnees financieres des recettes par commune/exercice/compte';
 COMMENT ON COLUMN donnees_recettes.budget_primitif IS 'Budget Primitif en Ariary';
@@ -259,13 +311,24 @@ CREATE INDEX idx_recettes_commune ON donnees_recettes(commune_id);
 CREATE INDEX idx_recettes_exercice ON donnees_recettes(exercice_id);
 CREATE INDEX idx_recettes_compte ON donnees_recettes(compte_code);
 CREATE INDEX idx_recettes_commune_exercice ON donnees_recettes(commune_id, exercice_id);
+CREATE INDEX idx_recettes_exercice_section ON donnees_recettes(exercice_id, section, commune_id);
+CREATE INDEX idx_recettes_non_validees ON donnees_recettes(exercice_id, commune_id) WHERE valide = FALSE;
+CREATE INDEX idx_recettes_valide_par ON donnees_recettes(valide_par) WHERE valide_par IS NOT NULL;
+
+-- Partition par defaut : recoit les lignes d'un exercice sans partition dediee
+CREATE TABLE donnees_recettes_defaut PARTITION OF donnees_recettes DEFAULT WITH (fillfactor = 85);
 
 -- Donnees DEPENSES par commune/exercice/compte
+-- Partitionnee par exercice (LIST) : les requetes filtrent quasi toujours
+-- sur un seul exercice_id, Postgres n'explore alors qu'une partition.
+-- La cle de partition doit figurer dans la cle primaire et les contraintes uniques.
 CREATE TABLE donnees_depenses (
-    id SERIAL PRIMARY KEY,
+    id SERIAL,
     commune_id INTEGER NOT NULL REFERENCES communes(id) ON DELETE CASCADE,
     exercice_id INTEGER NOT NULL REFERENCES exercices(id) ON DELETE CASCADE,
     compte_code VARCHAR(10) NOT NULL REFERENCES plan_comptable(code) ON DELETE CASCADE,
+    -- Section denormalisee depuis plan_comptable (trigger sync_donnees_section)
+    section section_budgetaire NOT NULL,
 
     -- Colonnes financieres (en Ariary - MGA)
     budget_primitif DECIMAL(18, 2) DEFAULT 0,
@@ -287,9 +350,10 @@ CREATE TABLE donnees_depenses (
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
 
+    CONSTRAINT pk_donnees_depenses PRIMARY KEY (id, exercice_id),
     CONSTRAINT uk_depenses_commune_exercice_compte
         UNIQUE (commune_id, exercice_id, compte_code)
-);
+) PARTITION BY LIST (exercice_id);
 
 COMMENT ON TABLE donnees_depenses IS 'Donnees financieres des depenses par commune/exercice/compte';
 COMMENT ON COLUMN donnees_depenses.budget_primitif IS 'Budget Primitif en Ariary';
@@ -306,6 +370,12 @@ CREATE INDEX idx_depenses_commune ON donnees_depenses(commune_id);
 CREATE INDEX idx_depenses_exercice ON donnees_depenses(exercice_id);
 CREATE INDEX idx_depenses_compte ON donnees_depenses(compte_code);
 CREATE INDEX idx_depenses_commune_exercice ON donnees_depenses(commune_id, exercice_id);
+CREATE INDEX idx_depenses_exercice_section ON donnees_depenses(exercice_id, section, commune_id);
+CREATE INDEX idx_depenses_non_validees ON donnees_depenses(exercice_id, commune_id) WHERE valide = FALSE;
+CREATE INDEX idx_depenses_valide_par ON donnees_depenses(valide_par) WHERE valide_par IS NOT NULL;
+
+-- Partition par defaut : recoit les lignes d'un exercice sans partition dediee
+CREATE TABLE donnees_depenses_defaut PARTITION OF donnees_depenses DEFAULT WITH (fillfactor = 85);
 
 -- =============================================================================
 -- 4. TABLES PROJETS MINIERS
@@ -338,7 +408,7 @@ CREATE TABLE projets_miniers (
     nom VARCHAR(200) NOT NULL,
     societe_id INTEGER REFERENCES societes_minieres(id) ON DELETE SET NULL,
     type_minerai VARCHAR(100),
-    statut VARCHAR(50) CHECK (statut IN ('exploration', 'exploitation', 'rehabilitation', 'ferme')),
+    statut statut_projet_minier,
     date_debut_exploitation DATE,
     surface_ha DECIMAL(12, 2),
     description TEXT,
@@ -378,16 +448,18 @@ CREATE TABLE revenus_miniers (
     exercice_id INTEGER NOT NULL REFERENCES exercices(id) ON DELETE CASCADE,
     projet_id INTEGER REFERENCES projets_miniers(id) ON DELETE SET NULL,
 
-    type_revenu VARCHAR(50) NOT NULL CHECK (type_revenu IN (
-        'ristourne_miniere',
-        'redevance_miniere',
-        'frais_administration_miniere',
-        'quote_part_ristourne',
-        'autre'
-    )),
+    type_revenu type_revenu_minier NOT NULL,
 
     montant_prevu DECIMAL(18, 2) DEFAULT 0,
     montant_recu DECIMAL(18, 2) DEFAULT 0,
+    ecart DECIMAL(18, 2) GENERATED ALWAYS AS (
+        COALESCE(montant_recu, 0) - COALESCE(montant_prevu, 0)
+    ) STORED,
+    -- Sans precision : le taux n'est pas borne (montant recu tres superieur au prevu)
+    taux_realisation DECIMAL GENERATED ALWAYS AS (
+        CASE WHEN montant_prevu > 0
+            THEN ROUND(COALESCE(montant_recu, 0) / montant_prevu * 100, 2) ELSE 0 END
+    ) STORED,
     date_reception DATE,
     reference_paiement VARCHAR(100),
     compte_code VARCHAR(10) REFERENCES plan_comptable(code),
@@ -399,12 +471,18 @@ CREATE TABLE revenus_miniers (
 
 COMMENT ON TABLE revenus_miniers IS 'Revenus miniers specifiques (ristournes, redevances)';
 COMMENT ON COLUMN revenus_miniers.type_revenu IS 'Type de revenu minier';
+COMMENT ON COLUMN revenus_miniers.ecart IS 'Calcule par la base : montant_recu - montant_prevu';
 COMMENT ON COLUMN revenus_miniers.compte_code IS 'Lien vers le plan comptable (7713 ou 7717 generalement)';
 
-CREATE INDEX idx_revenus_miniers_commune ON revenus_miniers(commune_id);
-CREATE INDEX idx_revenus_miniers_exercice ON revenus_miniers(exercice_id);
+-- Index couvrants pour les agregations (index-only scan sur les montants)
+CREATE INDEX idx_revenus_miniers_commune_exercice ON revenus_miniers(commune_id, exercice_id, type_revenu)
+    INCLUDE (montant_prevu, montant_recu);
+CREATE INDEX idx_revenus_miniers_exercice_type ON revenus_miniers(exercice_id, type_revenu)
+    INCLUDE (commune_id, montant_prevu, montant_recu);
 CREATE INDEX idx_revenus_miniers_projet ON revenus_miniers(projet_id);
+CREATE INDEX idx_revenus_miniers_compte ON revenus_miniers(compte_code) WHERE compte_code IS NOT NULL;
 CREATE INDEX idx_revenus_miniers_type ON revenus_miniers(type_revenu);
+CREATE INDEX idx_revenus_miniers_ecart ON revenus_miniers(ecart);
 
 -- =============================================================================
 -- 5. TABLES UTILISATEURS ET AUTHENTIFICATION
@@ -413,7 +491,7 @@ CREATE INDEX idx_revenus_miniers_type ON revenus_miniers(type_revenu);
 -- Utilisateurs
 CREATE TABLE utilisateurs (
     id SERIAL PRIMARY KEY,
-    email VARCHAR(255) UNIQUE NOT NULL,
+    email VARCHAR(255) NOT NULL,
     mot_de_passe_hash VARCHAR(255) NOT NULL,
     nom VARCHAR(100) NOT NULL,
     prenom VARCHAR(100),
@@ -430,9 +508,9 @@ COMMENT ON TABLE utilisateurs IS 'Utilisateurs de la plateforme';
 COMMENT ON COLUMN utilisateurs.role IS 'Role: admin, editeur, lecteur, commune';
 COMMENT ON COLUMN utilisateurs.commune_id IS 'Si role=commune, utilisateur limite a cette commune';
 
-CREATE INDEX idx_utilisateurs_email ON utilisateurs(email);
+-- Unicite et recherche insensibles a la casse (connexion : WHERE LOWER(email) = ...)
+CREATE UNIQUE INDEX uk_utilisateurs_email_lower ON utilisateurs(LOWER(email));
 CREATE INDEX idx_utilisateurs_commune ON utilisateurs(commune_id);
-CREATE INDEX idx_utilisateurs_role ON utilisateurs(role);
 
 -- Ajout des references de validation
 ALTER TABLE donnees_recettes
@@ -453,7 +531,8 @@ ALTER TABLE comptes_administratifs
 CREATE TABLE sessions (
     id SERIAL PRIMARY KEY,
     utilisateur_id INTEGER NOT NULL REFERENCES utilisateurs(id) ON DELETE CASCADE,
-    refresh_token VARCHAR(500) NOT NULL,
+    -- Empreinte BLAKE2b-256 du refresh token (le token n'est jamais stocke)
+    refresh_token_hash BYTEA NOT NULL CHECK (octet_length(refresh_token_hash) = 32),
     expires_at TIMESTAMP NOT NULL,
     ip_address VARCHAR(45),
     user_agent TEXT,
@@ -463,8 +542,12 @@ CREATE TABLE sessions (
 COMMENT ON TABLE sessions IS 'Sessions utilisateurs et refresh tokens JWT';
 
 CREATE INDEX idx_sessions_utilisateur ON sessions(utilisateur_id);
-CREATE INDEX idx_sessions_token ON sessions(refresh_token);
-CREATE INDEX idx_sessions_expires ON sessions(expires_at);
+-- Index couvrant : la verification d'un refresh token est un index-only scan
+CREATE UNIQUE INDEX uk_sessions_token_hash ON sessions(refresh_token_hash)
+    INCLUDE (id, utilisateur_id);
+-- expires_at croit avec l'ordre d'insertion : un BRIN suffit a la purge
+CREATE INDEX idx_sessions_expires_brin ON sessions USING BRIN (expires_at)
+    WITH (pages_per_range = 32);
 
 -- =============================================================================
 -- 6. TABLES DOCUMENTS
@@ -485,18 +568,41 @@ CREATE TABLE documents (
     uploade_par INTEGER REFERENCES utilisateurs(id) ON DELETE SET NULL,
     nb_telechargements INTEGER DEFAULT 0,
     public BOOLEAN DEFAULT TRUE,
+    recherche_tsv TSVECTOR GENERATED ALWAYS AS (
+        to_tsvector('french'::regconfig,
+            coalesce(titre, '') || ' ' || coalesce(description, '') || ' ' || coalesce(nom_fichier, ''))
+    ) STORED,
+    taille_formatee VARCHAR(20) GENERATED ALWAYS AS (
+        CASE
+            WHEN taille_octets IS NULL THEN 'Inconnu'
+            WHEN taille_octets < 1024 THEN round(taille_octets::numeric, 1)::text || ' o'
+            WHEN taille_octets < 1048576 THEN round(taille_octets::numeric / 1024, 1)::text || ' Ko'
+            WHEN taille_octets < 1073741824 THEN round(taille_octets::numeric / 1048576, 1)::text || ' Mo'
+            WHEN taille_octets < 1099511627776 THEN round(taille_octets::numeric / 1073741824, 1)::text || ' Go'
+            ELSE round(taille_octets::numeric / 1099511627776, 1)::text || ' To'
+        END
+    ) STORED,
+    extension VARCHAR(255) GENERATED ALWAYS AS (
+        lower(coalesce(substring(nom_fichier from '\.([^.]*)$'), ''))
+    ) STORED,
     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+) WITH (fillfactor = 85);  -- place libre pour les mises a jour HOT de nb_telechargements
 
 COMMENT ON TABLE documents IS 'Documents et pieces justificatives';
 COMMENT ON COLUMN documents.type_document IS 'Type: compte_administratif, budget, piece_justificative, etc.';
 COMMENT ON COLUMN documents.public IS 'Si true, visible par tous les visiteurs';
+COMMENT ON COLUMN documents.recherche_tsv IS 'Vecteur plein texte (titre, description, nom de fichier)';
+COMMENT ON COLUMN documents.taille_formatee IS 'Taille lisible (o, Ko, Mo, Go, To), calculee a l''ecriture';
+COMMENT ON COLUMN documents.extension IS 'Extension du fichier en minuscules, calculee a l''ecriture';
 
 CREATE INDEX idx_documents_commune ON documents(commune_id);
 CREATE INDEX idx_documents_exercice ON documents(exercice_id);
 CREATE INDEX idx_documents_type ON documents(type_document);
-CREATE INDEX idx_documents_public ON documents(public) WHERE public = TRUE;
+-- Documents publics, du plus recent au plus ancien (pagination par curseur)
+CREATE INDEX idx_documents_public_recents ON documents(created_at DESC, id DESC) WHERE public = TRUE;
+CREATE INDEX idx_documents_fts ON documents USING GIN (recherche_tsv);
+CREATE INDEX idx_documents_uploade_par ON documents(uploade_par) WHERE uploade_par IS NOT NULL;
 
 -- =============================================================================
 -- 7. SYSTEME CMS - PAGES COMPTE ADMINISTRATIF
@@ -541,6 +647,8 @@ CREATE INDEX idx_pages_ca_commune ON pages_compte_administratif(commune_id);
 CREATE INDEX idx_pages_ca_exercice ON pages_compte_administratif(exercice_id);
 CREATE INDEX idx_pages_ca_statut ON pages_compte_administratif(statut);
 CREATE INDEX idx_pages_ca_publie ON pages_compte_administratif(statut, date_publication) WHERE statut = 'publie';
+CREATE INDEX idx_pages_ca_cree_par ON pages_compte_administratif(cree_par) WHERE cree_par IS NOT NULL;
+CREATE INDEX idx_pages_ca_modifie_par ON pages_compte_administratif(modifie_par) WHERE modifie_par IS NOT NULL;
 
 -- Sections CMS avec ordre et visibilite
 CREATE TABLE sections_cms (
@@ -682,7 +790,7 @@ CREATE TABLE cartes_informatives (
     ordre INTEGER NOT NULL DEFAULT 0,
 
     -- Type de carte: image ou statistique
-    type_carte VARCHAR(20) CHECK (type_carte IN ('image', 'statistique', 'icone')) DEFAULT 'image',
+    type_carte type_carte DEFAULT 'image',
 
     -- Contenu image (si type = image)
     image_url VARCHAR(500),
@@ -803,44 +911,59 @@ CREATE TABLE newsletter_abonnes (
 
 COMMENT ON TABLE newsletter_abonnes IS 'Abonnes a la newsletter';
 
-CREATE INDEX idx_newsletter_email ON newsletter_abonnes(email);
-CREATE INDEX idx_newsletter_actif ON newsletter_abonnes(actif) WHERE actif = TRUE;
+-- L'email est deja indexe par sa contrainte UNIQUE ; index partiel des abonnes
+-- actifs (envoi, export trie par email, comptage)
+CREATE INDEX idx_newsletter_actifs_email ON newsletter_abonnes(email) WHERE actif = TRUE;
 
 -- Statistiques de visites
+-- Partitionnee par mois (RANGE sur date_visite), voir creer_partitions_mensuelles()
 CREATE TABLE statistiques_visites (
-    id SERIAL PRIMARY KEY,
+    id BIGSERIAL,
     date_visite DATE NOT NULL,
     page VARCHAR(255),
     commune_id INTEGER REFERENCES communes(id) ON DELETE SET NULL,
+    -- Compartiment du compteur : repartit les increments concurrents sur 16 lignes
+    compartiment SMALLINT NOT NULL DEFAULT 0,
     nb_visites INTEGER DEFAULT 1,
     nb_telechargements INTEGER DEFAULT 0,
     ip_address VARCHAR(45),
     user_agent TEXT,
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT pk_statistiques_visites PRIMARY KEY (id, date_visite)
+) PARTITION BY RANGE (date_visite);
 
 COMMENT ON TABLE statistiques_visites IS 'Statistiques de visites pour le back-office';
 
 CREATE INDEX idx_stats_date ON statistiques_visites(date_visite);
 CREATE INDEX idx_stats_commune ON statistiques_visites(commune_id);
 CREATE INDEX idx_stats_page ON statistiques_visites(page);
+-- Cible de l'upsert des compteurs (INSERT ... ON CONFLICT DO UPDATE) ;
+-- COALESCE : les compteurs sans commune (NULL) partagent la meme ligne
+CREATE UNIQUE INDEX uk_stats_compteur ON statistiques_visites(date_visite, page, (COALESCE(commune_id, 0)), compartiment);
+
+-- User agents courts, peu compressibles : stockes hors ligne sans compression
+ALTER TABLE statistiques_visites ALTER COLUMN user_agent SET STORAGE EXTERNAL;
+
+CREATE TABLE statistiques_visites_defaut PARTITION OF statistiques_visites DEFAULT WITH (fillfactor = 85);
 
 -- =============================================================================
 -- 8. TABLE AUDIT LOG
 -- =============================================================================
 
 -- Historique des modifications (audit trail)
+-- Partitionnee par mois (RANGE sur created_at), voir creer_partitions_mensuelles()
 CREATE TABLE audit_log (
-    id SERIAL PRIMARY KEY,
+    id BIGSERIAL,
     table_name VARCHAR(100) NOT NULL,
     record_id INTEGER NOT NULL,
-    action VARCHAR(20) NOT NULL CHECK (action IN ('INSERT', 'UPDATE', 'DELETE')),
+    action action_audit NOT NULL,
     old_values JSONB,
     new_values JSONB,
     utilisateur_id INTEGER REFERENCES utilisateurs(id) ON DELETE SET NULL,
     ip_address VARCHAR(45),
-    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-);
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    CONSTRAINT pk_audit_log PRIMARY KEY (id, created_at)
+) PARTITION BY RANGE (created_at);
 
 COMMENT ON TABLE audit_log IS 'Journal daudit des modifications';
 COMMENT ON COLUMN audit_log.old_values IS 'Anciennes valeurs en JSON';
@@ -851,6 +974,8 @@ CREATE INDEX idx_audit_record ON audit_log(table_name, record_id);
 CREATE INDEX idx_audit_date ON audit_log(created_at);
 CREATE INDEX idx_audit_utilisateur ON audit_log(utilisateur_id);
 
+CREATE TABLE audit_log_defaut PARTITION OF audit_log DEFAULT;
+
 -- =============================================================================
 -- 9. VUES POUR GENERATION DES TABLEAUX EXCEL
 -- =============================================================================
@@ -1013,10 +1138,50 @@ GROUP BY c.id, c.code, c.nom, r.nom, e.id, e.annee;
 
 COMMENT ON VIEW vue_tableau_equilibre IS 'Vue pour generer le tableau dequilibre (feuille EQUILIBRE Excel)';
 
+-- Agregats des revenus miniers par commune / exercice / type (tableaux de bord).
+-- Rafraichie par rafraichir_revenus_miniers_agreges() : en fin de seed_data.sql, puis
+-- toutes les 5 minutes par l'application (app/services/maintenance.py).
+CREATE MATERIALIZED VIEW mv_revenus_miniers_commune_exercice AS
+SELECT
+    commune_id,
+    exercice_id,
+    type_revenu,
+    COUNT(*) AS nb_revenus,
+    COALESCE(SUM(montant_prevu), 0) AS total_prevu,
+    COALESCE(SUM(montant_recu), 0) AS total_recu
+FROM revenus_miniers
+GROUP BY commune_id, exercice_id, type_revenu;
+
+COMMENT ON MATERIALIZED VIEW mv_revenus_miniers_commune_exercice IS 'Totaux des revenus miniers par commune, exercice et type';
+
+-- Index unique requis par REFRESH MATERIALIZED VIEW CONCURRENTLY
+CREATE UNIQUE INDEX uk_mv_revenus_miniers ON mv_revenus_miniers_commune_exercice(commune_id, exercice_id, type_revenu);
+CREATE INDEX idx_mv_revenus_miniers_exercice ON mv_revenus_miniers_commune_exercice(exercice_id, type_revenu);
+
+-- Rafraichissement sans bloquer les lectures
+CREATE OR REPLACE FUNCTION rafraichir_revenus_miniers_agreges()
+RETURNS VOID AS $$
+BEGIN
+    REFRESH MATERIALIZED VIEW CONCURRENTLY mv_revenus_miniers_commune_exercice;
+END;
+$$ LANGUAGE plpgsql;
+
 -- =============================================================================
 -- 10. FONCTIONS UTILITAIRES
 -- =============================================================================
 
+-- Purge des sessions expirees (cron, quotidien) ; retourne le nombre supprime
+CREATE OR REPLACE FUNCTION purger_sessions_expirees()
+RETURNS INTEGER AS $$
+DECLARE
+    nb INTEGER;
+BEGIN
+    DELETE FROM sessions WHERE expires_at < CURRENT_TIMESTAMP;
+    GET DIAGNOSTICS nb = ROW_COUNT;
+    RETURN nb;
+END;
+$$ LANGUAGE plpgsql;
+
 -- Fonction pour mettre a jour le timestamp updated_at
 CREATE OR REPLACE FUNCTION update_updated_at_column()
 RETURNS TRIGGER AS $$
@@ -1026,6 +1191,215 @@ BEGIN
 END;
 $$ LANGUAGE plpgsql;
 
+-- Denormalisation communes.province_id depuis la region de la commune
+-- (toujours recalculee, y compris si province_id est ecrite directement)
+CREATE OR REPLACE FUNCTION sync_commune_province()
+RETURNS TRIGGER AS $$
+BEGIN
+    SELECT province_id INTO NEW.province_id FROM regions WHERE id = NEW.region_id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sync_commune_province_before_write
+    BEFORE INSERT OR UPDATE OF region_id, province_id ON communes
+    FOR EACH ROW EXECUTE FUNCTION sync_commune_province();
+
+-- Propagation d'un changement de province d'une region vers ses communes
+CREATE OR REPLACE FUNCTION sync_region_communes_province()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE communes SET province_id = NEW.province_id WHERE region_id = NEW.id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sync_region_communes_province_after_update
+    AFTER UPDATE OF province_id ON regions
+    FOR EACH ROW
+    WHEN (OLD.province_id IS DISTINCT FROM NEW.province_id)
+    EXECUTE FUNCTION sync_region_communes_province();
+
+-- Chemin ltree du plan comptable : chemin du parent + code du compte
+CREATE OR REPLACE FUNCTION sync_plan_comptable_chemin()
+RETURNS TRIGGER AS $$
+DECLARE
+    label ltree := text2ltree(regexp_replace(NEW.code, '[^A-Za-z0-9_]', '_', 'g'));
+BEGIN
+    NEW.chemin := COALESCE(
+        (SELECT chemin FROM plan_comptable WHERE code = NEW.parent_code) || label,
+        label
+    );
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sync_plan_comptable_chemin_before_write
+    BEFORE INSERT OR UPDATE OF code, parent_code ON plan_comptable
+    FOR EACH ROW EXECUTE FUNCTION sync_plan_comptable_chemin();
+
+-- Propagation d'un changement de chemin a tout le sous-arbre
+CREATE OR REPLACE FUNCTION sync_plan_comptable_sous_arbre()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE plan_comptable
+    SET chemin = NEW.chemin || subpath(chemin, nlevel(OLD.chemin))
+    WHERE chemin <@ OLD.chemin AND id <> NEW.id;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sync_plan_comptable_sous_arbre_after_update
+    AFTER UPDATE OF chemin ON plan_comptable
+    FOR EACH ROW
+    WHEN (OLD.chemin IS DISTINCT FROM NEW.chemin)
+    EXECUTE FUNCTION sync_plan_comptable_sous_arbre();
+
+-- Section budgetaire denormalisee sur les donnees financieres :
+-- les agregations par section ne joignent plus plan_comptable
+CREATE OR REPLACE FUNCTION sync_donnees_section()
+RETURNS TRIGGER AS $$
+BEGIN
+    SELECT section INTO NEW.section FROM plan_comptable WHERE code = NEW.compte_code;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sync_recettes_section_before_write
+    BEFORE INSERT OR UPDATE OF compte_code ON donnees_recettes
+    FOR EACH ROW EXECUTE FUNCTION sync_donnees_section();
+
+CREATE TRIGGER sync_depenses_section_before_write
+    BEFORE INSERT OR UPDATE OF compte_code ON donnees_depenses
+    FOR EACH ROW EXECUTE FUNCTION sync_donnees_section();
+
+-- Propagation d'un changement de section d'un compte vers ses donnees
+CREATE OR REPLACE FUNCTION sync_plan_comptable_section()
+RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE donnees_recettes SET section = NEW.section WHERE compte_code = NEW.code;
+    UPDATE donnees_depenses SET section = NEW.section WHERE compte_code = NEW.code;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER sync_plan_comptable_section_after_update
+    AFTER UPDATE OF section ON plan_comptable
+    FOR EACH ROW
+    WHEN (OLD.section IS DISTINCT FROM NEW.section)
+    EXECUTE FUNCTION sync_plan_comptable_section();
+
+-- Creation des partitions donnees_recettes / donnees_depenses d'un exercice
+-- (donnees_recettes_ex_12, donnees_depenses_ex_12, ...). Idempotente.
+-- Nommees par exercice_id, la cle de partition : un exercice supprime puis
+-- recree pour la meme annee obtient un nouvel id, donc ses propres partitions
+-- (un nom par annee ferait tomber ses lignes dans la partition DEFAULT).
+-- fillfactor 85 : les montants sont modifies apres import (saisie, validation),
+-- la place libre permet des mises a jour HOT dans la meme page.
+CREATE OR REPLACE FUNCTION creer_partitions_exercice(p_exercice_id INTEGER, p_annee INTEGER)
+RETURNS VOID AS $$
+DECLARE
+    t TEXT;
+    nom_partition TEXT;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['donnees_recettes', 'donnees_depenses'] LOOP
+        nom_partition := t || '_ex_' || p_exercice_id;
+        IF to_regclass(nom_partition) IS NULL THEN
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %I FOR VALUES IN (%s) WITH (fillfactor = 85)',
+                nom_partition, t, p_exercice_id
+            );
+            EXECUTE format('COMMENT ON TABLE %I IS %L', nom_partition, 'Exercice ' || p_annee);
+        END IF;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION creer_partitions_nouvel_exercice()
+RETURNS TRIGGER AS $$
+BEGIN
+    PERFORM creer_partitions_exercice(NEW.id, NEW.annee);
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+-- Partitions mensuelles des tables de journalisation (audit_log_2025_01, ...).
+-- Cree les partitions du mois courant et des p_nb_mois suivants. Idempotente :
+-- executee par l'application au demarrage puis chaque jour
+-- (app/services/maintenance.py) ; la retention se fait par
+-- DETACH PARTITION / DROP TABLE plutot que par DELETE.
+-- Les lignes deja tombees dans la partition DEFAULT pour un mois sans partition
+-- sont deplacees dans la nouvelle partition : DEFAULT est detachee le temps de
+-- la creer et d'y inserer ces lignes, puis rattachee (sinon CREATE TABLE ...
+-- PARTITION OF echoue sur la contrainte implicite de DEFAULT).
+-- audit_log est en ajout seul (fillfactor 100) ; statistiques_visites incremente
+-- ses compteurs sur place (fillfactor 85, mises a jour HOT).
+CREATE OR REPLACE FUNCTION creer_partitions_mensuelles(p_nb_mois INTEGER DEFAULT 3)
+RETURNS VOID AS $$
+DECLARE
+    t TEXT;
+    cle TEXT;
+    nom_partition TEXT;
+    defaut TEXT;
+    debut DATE;
+    fin DATE;
+    i INTEGER;
+    a_deplacer BOOLEAN;
+BEGIN
+    FOREACH t IN ARRAY ARRAY['audit_log', 'statistiques_visites'] LOOP
+        cle := CASE WHEN t = 'audit_log' THEN 'created_at' ELSE 'date_visite' END;
+        defaut := t || '_defaut';
+        FOR i IN 0..p_nb_mois LOOP
+            debut := (date_trunc('month', CURRENT_DATE) + make_interval(months => i))::DATE;
+            fin := (debut + INTERVAL '1 month')::DATE;
+            nom_partition := t || '_' || to_char(debut, 'YYYY_MM');
+            CONTINUE WHEN to_regclass(nom_partition) IS NOT NULL;
+
+            EXECUTE format(
+                'SELECT EXISTS (SELECT 1 FROM %I WHERE %I >= %L AND %I < %L)',
+                defaut, cle, debut, cle, fin
+            ) INTO a_deplacer;
+
+            IF a_deplacer THEN
+                EXECUTE format('ALTER TABLE %I DETACH PARTITION %I', t, defaut);
+            END IF;
+
+            EXECUTE format(
+                'CREATE TABLE %I PARTITION OF %I FOR VALUES FROM (%L) TO (%L)%s',
+                nom_partition, t, debut, fin,
+                CASE WHEN t = 'statistiques_visites' THEN ' WITH (fillfactor = 85)' ELSE '' END
+            );
+
+            IF a_deplacer THEN
+                EXECUTE format(
+                    'WITH deplacees AS (DELETE FROM %I WHERE %I >= %L AND %I < %L RETURNING *) '
+                    || 'INSERT INTO %I SELECT * FROM deplacees',
+                    defaut, cle, debut, cle, fin, nom_partition
+                );
+                EXECUTE format('ALTER TABLE %I ATTACH PARTITION %I DEFAULT', t, defaut);
+            END IF;
+        END LOOP;
+    END LOOP;
+END;
+$$ LANGUAGE plpgsql;
+
+SELECT creer_partitions_mensuelles();
+
+-- Chaque nouvel exercice obtient ses propres partitions
+CREATE TRIGGER creer_partitions_exercice_apres_insert
+    AFTER INSERT ON exercices
+    FOR EACH ROW EXECUTE FUNCTION creer_partitions_nouvel_exercice();
+
+-- Agregats multi-exercices calcules partition par partition
+DO $$
+BEGIN
+    EXECUTE format(
+        'ALTER DATABASE %I SET enable_partitionwise_aggregate = on',
+        current_database()
+    );
+END;
+$$;
+
 -- Application des triggers de mise a jour automatique
 CREATE TRIGGER update_provinces_updated_at
     BEFORE UPDATE ON provinces
@@ -416,6 +416,12 @@ CROSS JOIN generate_series(0, 30) AS n
 WHERE c.nom IN ('Taolagnaro (Fort-Dauphin)', 'Moramanga', 'Antananarivo Renivohitra')
 LIMIT 50;
 
+-- =============================================================================
+-- 12. AGREGATS (vue materialisee creee vide par schema.sql)
+-- =============================================================================
+
+SELECT rafraichir_revenus_miniers_agreges();
+
 -- =============================================================================
 -- VERIFICATION FINALE
 -- =============================================================================
@@ -0,0 +1,99 @@
+"""
+Fixtures partagées des tests.
+
+Les tests marqués par la fixture `db_engine` s'exécutent contre la base
+PostgreSQL configurée (.env ou variables POSTGRES_*), initialisée par
+bank/scripts/init-db.sh (schéma + données de démonstration). Sans serveur
+joignable, ils sont ignorés.
+"""
+
+import os
+from pathlib import Path
+
+import pytest
+
+# Sans .env, valeurs factices : les modules s'importent, les tests base de
+# données sont ignorés faute de connexion
+if not (Path(__file__).resolve().parent.parent / ".env").exists():
+    os.environ.setdefault("POSTGRES_USER", "postgres")
+    os.environ.setdefault("POSTGRES_PASSWORD", "postgres")
+    os.environ.setdefault("POSTGRES_DB", "revenus_miniers_db")
+    os.environ.setdefault("SECRET_KEY", "tests-uniquement")
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event, text
+from sqlalchemy.exc import OperationalError
+
+from app.database import engine
+from app.main import app
+
+# Commune des données de démonstration (bank/scripts/seed_data.sql)
+COMMUNE_DEMO = "Taolagnaro (Fort-Dauphin)"
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    """Moteur principal, si le serveur PostgreSQL est joignable."""
+    try:
+        with engine.connect():
+            pass
+    except OperationalError as e:
+        pytest.skip(f"PostgreSQL indisponible : {e.orig}")
+    return engine
+
+
+@pytest.fixture
+def client(db_engine):
+    """
+    Client HTTP de l'application.
+    Hors bloc `with` : les tâches de fond du lifespan ne sont pas lancées,
+    seules les requêtes du test sont comptées.
+    """
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+@pytest.fixture
+def requetes_sql(db_engine):
+    """
+    Liste des instructions SQL émises sur le moteur principal pendant le test
+    (événement before_cursor_execute). Vider la liste avant la mesure.
+    """
+    requetes: list[str] = []
+
+    def _compter(conn, cursor, statement, parameters, context, executemany):
+        requetes.append(statement)
+
+    event.listen(db_engine, "before_cursor_execute", _compter)
+    yield requetes
+    event.remove(db_engine, "before_cursor_execute", _compter)
+
+
+@pytest.fixture(scope="session")
+def commune_id(db_engine) -> int:
+    """Identifiant de la commune des données de démonstration (seed_data.sql)."""
+    with db_engine.connect() as conn:
+        commune_id = conn.execute(
+            text("SELECT id FROM communes WHERE nom = :nom"), {"nom": COMMUNE_DEMO}
+        ).scalar()
+    if commune_id is None:
+        pytest.skip("Données de démonstration absentes (bank/scripts/seed_data.sql)")
+    return commune_id
+
+
+@pytest.fixture(scope="session")
+def documents_demo(db_engine, commune_id):
+    """
+    Documents temporaires répartis sur plusieurs exercices : une liste qui
+    relirait commune ou exercice ligne par ligne émettrait plus de requêtes.
+    """
+    with db_engine.begin() as conn:
+        ids = conn.execute(text(
+            "INSERT INTO documents (commune_id, exercice_id, type_document, titre, nom_fichier, chemin_fichier) "
+            "SELECT :commune_id, e.id, 'compte_administratif', 'Test budget ' || n, 'test_' || n || '.pdf', '/tmp/test_' || n || '.pdf' "
+            "FROM exercices e CROSS JOIN generate_series(1, 4) AS n "
+            "RETURNING id"
+        ), {"commune_id": commune_id}).scalars().all()
+    yield ids
+    with db_engine.begin() as conn:
+        conn.execute(text("DELETE FROM documents WHERE id = ANY(:ids)"), {"ids": ids})
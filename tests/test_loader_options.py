@@ -0,0 +1,79 @@
+"""
+Options de chargement face aux relations lazy="raise_on_sql".
+
+Une relation lue sans option de chargement lève une erreur à l'exécution au
+lieu d'émettre une requête : ces tests rejouent les options des endpoints
+(géographie, documents, revenus miniers) et de chaque with_full_detail(),
+puis parcourent les relations que les réponses lisent.
+"""
+
+import pytest
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.orm import Session, configure_mappers, joinedload, undefer_group
+
+from app.database import Base
+from app.models.base import DETAIL
+from app.models.comptabilite import DonneesDepenses, DonneesRecettes, PlanComptable
+from app.models.documents import Document
+from app.models.geographie import Commune, Province, Region
+from app.models.projets_miniers import ProjetMinier, RevenuMinier
+from app.models.utilisateurs import Utilisateur
+
+# (modèle, options de chargement, chemins de relations lus par la réponse)
+CHARGEMENTS = [
+    (Province, (joinedload(Province.regions),), ("regions",)),
+    (Region, (joinedload(Region.province), joinedload(Region.communes)), ("province", "communes")),
+    (Commune, Commune.with_full_detail(), ("region.province",)),
+    (Document, Document.with_full_detail(), ("commune", "exercice", "uploadeur")),
+    (Document, (undefer_group(DETAIL),), ()),
+    (PlanComptable, PlanComptable.with_full_detail(), ("parent", "enfants")),
+    (DonneesRecettes, DonneesRecettes.with_full_detail(), ("commune", "exercice", "compte")),
+    (DonneesDepenses, DonneesDepenses.with_full_detail(), ("commune", "exercice", "compte")),
+    (ProjetMinier, ProjetMinier.with_full_detail(), ("societe", "projets_communes.commune")),
+    (RevenuMinier, RevenuMinier.with_full_detail(), ("commune", "exercice", "projet", "compte")),
+    (Utilisateur, Utilisateur.with_full_detail(), ("commune",)),
+]
+
+
+def _parcourir(objets: list, chemin: str) -> None:
+    """Lit chaque relation du chemin pointé ("region.province") sur les objets."""
+    for nom in chemin.split("."):
+        suivants = []
+        for obj in objets:
+            valeur = getattr(obj, nom)
+            if isinstance(valeur, list):
+                suivants.extend(valeur)
+            elif valeur is not None:
+                suivants.append(valeur)
+        objets = suivants
+
+
+def test_configure_mappers():
+    """Toutes les relations se résolvent (back_populates, cibles, jointures)."""
+    configure_mappers()
+
+
+def test_modeles_avec_detail_couverts():
+    """Chaque modèle qui définit with_full_detail() figure dans CHARGEMENTS."""
+    couverts = {modele for modele, _, _ in CHARGEMENTS}
+    avec_detail = {
+        mapper.class_ for mapper in Base.registry.mappers
+        if hasattr(mapper.class_, "with_full_detail")
+    }
+    assert avec_detail <= couverts
+
+
+@pytest.mark.parametrize("modele, options, chemins", CHARGEMENTS)
+def test_options_compilent(modele, options, chemins):
+    """Les options désignent des relations existantes du modèle."""
+    select(modele).options(*options).compile(dialect=postgresql.dialect())
+
+
+@pytest.mark.parametrize("modele, options, chemins", CHARGEMENTS)
+def test_relations_chargees(db_engine, modele, options, chemins):
+    """Les relations lues par la réponse sont chargées : aucune ne lève d'erreur."""
+    with Session(db_engine) as db:
+        objets = db.execute(select(modele).options(*options).limit(20)).unique().scalars().all()
+        for chemin in chemins:
+            _parcourir(objets, chemin)
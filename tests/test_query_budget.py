@@ -0,0 +1,77 @@
+"""
+Budgets de requêtes SQL des endpoints les plus sollicités.
+
+Les relations sont en lazy="raise_on_sql" et chargées par options explicites :
+le nombre d'instructions par requête HTTP est fixe et ne dépend pas du
+nombre de lignes renvoyées. Un N+1 réintroduit fait échouer ces tests.
+
+Mesure en régime établi : un premier appel remplit le cache des référentiels,
+seul le second est compté.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from app.api.deps import get_current_editor
+
+EXERCICE_DEMO = 2023
+
+
+def _mesurer(client, requetes_sql: list, url: str) -> int:
+    """Nombre d'instructions SQL émises par un GET, caches déjà remplis."""
+    client.get(url)
+    requetes_sql.clear()
+    response = client.get(url)
+    assert response.status_code == 200, response.text
+    return len(requetes_sql)
+
+
+@pytest.mark.parametrize(
+    "url, budget",
+    [
+        ("/api/v1/geo/communes?limit={limite}", 3),
+        ("/api/v1/geo/communes/search?q=an&limit={limite}", 1),
+        ("/api/v1/search/communes?q=an&limit={limite}", 1),
+        ("/api/v1/documents?limit={limite}", 1),
+        ("/api/v1/revenus?limit={limite}", 1),
+    ],
+)
+def test_listes_sans_n_plus_1(client, requetes_sql, documents_demo, url, budget):
+    """Le nombre de requêtes d'une liste ne dépend pas de sa taille."""
+    petite = _mesurer(client, requetes_sql, url.format(limite=5))
+    grande = _mesurer(client, requetes_sql, url.format(limite=50))
+    assert petite <= budget, requetes_sql
+    assert grande == petite, requetes_sql
+
+
+def test_liste_documents_admin(client, requetes_sql, documents_demo):
+    """Commune et exercice de chaque document préchargés (plus de SELECT par ligne)."""
+    app = client.app
+    app.dependency_overrides[get_current_editor] = lambda: SimpleNamespace(id=1)
+    petite = _mesurer(client, requetes_sql, "/api/v1/admin/upload/documents?limit=2")
+    grande = _mesurer(client, requetes_sql, "/api/v1/admin/upload/documents?limit=50")
+    assert petite <= 1, requetes_sql
+    assert grande == petite, requetes_sql
+
+
+@pytest.mark.parametrize(
+    "url, budget",
+    [
+        ("/api/v1/geo/communes/{commune_id}", 1),
+        ("/api/v1/tableaux/recettes?commune_id={commune_id}&exercice_annee={annee}", 1),
+        ("/api/v1/tableaux/depenses?commune_id={commune_id}&exercice_annee={annee}", 1),
+        ("/api/v1/tableaux?commune_id={commune_id}&exercice_annee={annee}", 2),
+        ("/api/v1/pages/by-commune/{commune_id}", 2),
+    ],
+)
+def test_budget_detail(client, requetes_sql, commune_id, url, budget):
+    """Vues détail et tableaux : budget fixe d'instructions SQL."""
+    nombre = _mesurer(client, requetes_sql, url.format(commune_id=commune_id, annee=EXERCICE_DEMO))
+    assert nombre <= budget, requetes_sql
+
+
+def test_budget_detail_document(client, requetes_sql, documents_demo):
+    """Détail d'un document : commune, exercice et auteur chargés avec lui."""
+    nombre = _mesurer(client, requetes_sql, f"/api/v1/documents/{documents_demo[0]}")
+    assert nombre <= 1, requetes_sql